@@ -0,0 +1,139 @@
+"""Benchmarks for the pet model's update path and memory footprint."""
+import os
+from src.tamagotchi.config.profiles import PROFILES
+from src.tamagotchi.config.settings import settings
+from src.tamagotchi.core.pet import Tamagotchi
+from src.tamagotchi.core.sharded import ShardedPopulation
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.metrics import MetricsRegistry
+from src.tamagotchi.optimize import ResultCache, evaluate, random_schedules, simulate
+from src.tamagotchi.sim import SECONDS_PER_DAY
+from .harness import Metric, benchmark, latency, rate, time_per_call
+from .memory import REPRESENTATIONS, bytes_per_pet
+
+@benchmark("core.update")
+def bench_update(quick):
+    """Tamagotchi.update() calls per second, scalar and batched."""
+    pet = Tamagotchi("Bench", last_update=0.0)
+    clock = iter(range(1, 10**9))
+    scalar = time_per_call(lambda: pet.update(float(next(clock))), 2000 if quick else 20000)
+
+    size = 10000 if quick else 100000
+    population = PetPopulation.from_pets(
+        Tamagotchi(f"Pet{i}", last_update=0.0) for i in range(size)
+    )
+    batched = time_per_call(lambda: population.update(float(next(clock))), 10 if quick else 50)
+    return {
+        "scalar": rate(scalar, "pets/s"),
+        "population": rate(batched / size, "pets/s"),
+    }
+
+@benchmark("core.profiles")
+def bench_profiles(quick):
+    """Per-tick cost of per-pet rate profiles against one global PetSettings."""
+    clock = iter(range(1, 10**9))
+    profiles = ["default"] + sorted(PROFILES)
+    number = 2000 if quick else 20000
+    default_pet = Tamagotchi("Bench", last_update=0.0)
+    profiled_pet = Tamagotchi("Bench", last_update=0.0, profile="glutton")
+    scalar_default = time_per_call(lambda: default_pet.update(float(next(clock))), number)
+    scalar_profiled = time_per_call(lambda: profiled_pet.update(float(next(clock))), number)
+
+    size = 10000 if quick else 100000
+    population = PetPopulation.from_pets(
+        Tamagotchi(f"Pet{i}", last_update=0.0, profile=profiles[i % len(profiles)])
+        for i in range(size)
+    )
+    number = 10 if quick else 50
+    shared = time_per_call(lambda: population.update(float(next(clock)), settings.pet), number)
+    per_pet = time_per_call(lambda: population.update(float(next(clock))), number)
+    return {
+        "scalar_default": rate(scalar_default, "pets/s"),
+        "scalar_profiled": rate(scalar_profiled, "pets/s"),
+        "population_shared": rate(shared / size, "pets/s"),
+        "population_per_pet": rate(per_pet / size, "pets/s"),
+    }
+
+@benchmark("core.actions")
+def bench_actions(quick):
+    """A "feed everyone below 30 hunger" care job: per-pet calls, a list pass and a mask."""
+    size = 10000 if quick else 100000
+    number = 5 if quick else 20
+    start = [float(i % 60) for i in range(size)]
+    pets = [Tamagotchi(f"Pet{i}", hunger=hunger, last_update=0.0) for i, hunger in enumerate(start)]
+    population = PetPopulation.from_pets(pets)
+
+    # Each run restores the starting hunger so every run feeds the same half
+    def per_pet():
+        for pet in pets:
+            if pet.hunger < 30:
+                pet.feed()
+        for pet, hunger in zip(pets, start):
+            pet.hunger = hunger
+
+    def listed():
+        Tamagotchi.feed_many([pet for pet in pets if pet.hunger < 30])
+        for pet, hunger in zip(pets, start):
+            pet.hunger = hunger
+
+    def masked():
+        population.feed(population.hunger < 30)
+        population.hunger[:] = start
+
+    return {
+        "per_pet": rate(time_per_call(per_pet, number) / size, "pets/s"),
+        "list": rate(time_per_call(listed, number) / size, "pets/s"),
+        "mask": rate(time_per_call(masked, number) / size, "pets/s"),
+    }
+
+@benchmark("core.metrics")
+def bench_metrics(quick):
+    """Cost of timing a block with the metrics registry off and on."""
+    number = 20000 if quick else 200000
+    histogram = MetricsRegistry().histogram("bench_seconds")
+
+    def timed():
+        with histogram.time():
+            pass
+
+    disabled = time_per_call(timed, number)
+    histogram._registry.enable()  # pylint: disable=protected-access
+    enabled = time_per_call(timed, number)
+    return {"disabled": latency(disabled), "enabled": latency(enabled)}
+
+@benchmark("core.sharded")
+def bench_sharded(quick):
+    """ShardedPopulation ticks over one worker versus one worker per CPU."""
+    size = 100000 if quick else 1000000
+    pets = [Tamagotchi(f"Pet{i}", last_update=0.0) for i in range(size)]
+    clock = iter(range(1, 10**9))
+    metrics = {}
+    for workers in sorted({1, os.cpu_count() or 1}):
+        with ShardedPopulation(pets, workers=workers) as population:
+            tick = time_per_call(lambda: population.update(float(next(clock))), 5 if quick else 20)
+        metrics[f"workers_{workers}"] = rate(tick / size, "pets/s")
+    return metrics
+
+@benchmark("core.optimize")
+def bench_optimize(quick):
+    """Care schedules scored over a simulated month, fresh and from the result cache."""
+    count = 1000 if quick else 10000
+    schedules = random_schedules(count, seed=1)
+    duration = 30 * SECONDS_PER_DAY
+    fresh = time_per_call(lambda: simulate(schedules, duration), 1, 1 if quick else 3)
+    cache = ResultCache()
+    evaluate(schedules, duration, cache=cache)
+    cached = time_per_call(lambda: evaluate(schedules, duration, cache=cache), 1)
+    return {
+        "simulate": rate(fresh / count, "schedules/s"),
+        "cached": rate(cached / count, "schedules/s"),
+    }
+
+@benchmark("core.memory")
+def bench_memory(quick):
+    """Bytes held per pet for each in-memory representation."""
+    size = 10000 if quick else 100000
+    return {
+        name: Metric(bytes_per_pet(build, size), "bytes/pet", higher_is_better=False)
+        for name, build in REPRESENTATIONS.items()
+    }
@@ -0,0 +1,124 @@
+"""Benchmarks for saving and loading pets."""
+import os
+import tempfile
+from src.tamagotchi.analytics import report
+from src.tamagotchi.core.pet import Tamagotchi
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.storage.columnar import ColumnReader, export_population, import_population
+from src.tamagotchi.storage.eventlog import EventLog
+from src.tamagotchi.storage.journal import SaveJournal
+from src.tamagotchi.storage.records import RecordFile, write_population
+from .harness import Metric, benchmark, latency, rate, time_per_call
+
+@benchmark("persistence.json")
+def bench_json(quick):
+    """Tamagotchi.save()/load() round trips against a scratch directory."""
+    number = 50 if quick else 500
+    pet = Tamagotchi("Bench")
+    with tempfile.TemporaryDirectory() as save_dir:
+        save = time_per_call(lambda: pet.save(save_dir), number)
+        load = time_per_call(lambda: Tamagotchi.load("Bench", save_dir), number)
+    return {
+        "save_latency": latency(save),
+        "save_rate": rate(save),
+        "load_latency": latency(load),
+        "load_rate": rate(load),
+    }
+
+@benchmark("persistence.journal")
+def bench_journal(quick):
+    """SaveJournal appends of a changed pet, as the game loop issues them."""
+    number = 100 if quick else 1000
+    pet = Tamagotchi("Bench", last_update=0.0)
+    clock = iter(range(1, 10**9))
+
+    def tick_and_flush():
+        pet.update(float(next(clock)))
+        journal.flush(pet)
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        journal = SaveJournal(save_dir)
+        journal.snapshot(pet)
+        flush = time_per_call(tick_and_flush, number)
+    return {"flush_latency": latency(flush)}
+
+@benchmark("persistence.records")
+def bench_records(quick):
+    """Opening a record file, scanning a column and finding one pet by name."""
+    count = 10_000 if quick else 1_000_000
+    population = PetPopulation.from_pets(
+        Tamagotchi(f"Pet{i}", hunger=float(i % 100), last_update=0.0) for i in range(count)
+    )
+    with tempfile.TemporaryDirectory() as save_dir:
+        path = os.path.join(save_dir, "pets.rec")
+        write_population(path, population)
+        with RecordFile(path) as records:
+            scan = time_per_call(lambda: int((records.hunger < 20).sum()), 20)
+            find = time_per_call(lambda: records.load(f"Pet{count // 2}"), 1000)
+        opened = time_per_call(lambda: RecordFile(path).close(), 100)
+    return {
+        "open_latency": latency(opened),
+        "scan_rate": rate(scan / count, "pets/s"),
+        "find_latency": latency(find),
+    }
+
+@benchmark("persistence.replay")
+def bench_replay(quick):
+    """Appending actions to an event log and replaying a pet's whole history."""
+    count = 10_000 if quick else 100_000
+    pet = Tamagotchi("Bench", last_update=0.0)
+    with tempfile.TemporaryDirectory() as save_dir:
+        log = EventLog(save_dir)
+        clock = iter(range(1, 10**9))
+
+        def act():
+            pet.update(float(next(clock)))
+            log.apply(pet, "feed")
+
+        append = time_per_call(act, count, repeat=1)
+        replay = time_per_call(lambda: log.replay("Bench"), 1, repeat=3)
+        events = sum(1 for _ in log.events("Bench"))
+    return {
+        "append_latency": latency(append),
+        "replay_rate": rate(replay / events, "events/s"),
+    }
+
+@benchmark("persistence.columnar")
+def bench_columnar(quick):
+    """Bulk export and import through chunked column files, and their size on disk."""
+    count = 10_000 if quick else 1_000_000
+    population = PetPopulation.from_pets(
+        Tamagotchi(f"Pet{i}", hunger=float(i % 100), last_update=0.0) for i in range(count)
+    )
+    repeat = 3
+    with tempfile.TemporaryDirectory() as save_dir:
+        path = os.path.join(save_dir, "pets.tcol")
+        export = time_per_call(lambda: export_population(path, population), 1, repeat)
+        size = os.path.getsize(path)
+        restore = time_per_call(lambda: import_population(path), 1, repeat)
+
+        def scan():
+            with ColumnReader(path) as reader:
+                return sum(int((chunk["hunger"] < 20).sum()) for chunk in reader.chunks(["hunger"]))
+
+        scanned = time_per_call(scan, 1, repeat)
+    return {
+        "export": rate(export / count, "pets/s"),
+        "import": rate(restore / count, "pets/s"),
+        "column_scan": rate(scanned / count, "pets/s"),
+        "bytes_per_pet": Metric(size / count, "bytes/pet", higher_is_better=False),
+    }
+
+@benchmark("persistence.analytics")
+def bench_analytics(quick):
+    """The streaming report over a column file: pets through one pass of every aggregator."""
+    count = 2_000 if quick else 100_000
+    population = PetPopulation.from_pets(
+        Tamagotchi(f"Pet{i}", hunger=float(i % 100), happiness=float(i * 7 % 100), last_update=0.0)
+        for i in range(count)
+    )
+    with tempfile.TemporaryDirectory() as save_dir:
+        path = os.path.join(save_dir, "pets.tcol")
+        export_population(path, population)
+        seconds = time_per_call(lambda: report(path, at=0.0), 1, 3)
+    return {"report": rate(seconds / count, "pets/s")}
@@ -0,0 +1,137 @@
+"""Benchmarks for sprite generation and per-frame Tk rendering."""
+import tempfile
+import time
+from types import SimpleNamespace
+from src.tamagotchi.core.pet import Tamagotchi
+from src.tamagotchi.pet_sprite import STATE_COLORS, SpriteAtlas
+from .harness import Metric, Skip, benchmark, latency, time_per_call
+
+def _tk_root():
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise Skip(f"no display ({e}); run under xvfb-run") from e
+    root.withdraw()
+    return root
+
+@benchmark("render.atlas")
+def bench_atlas(quick):
+    """Drawing every sprite state from scratch versus loading the cached sheet."""
+    repeat = 3 if quick else 7
+
+    def load_all(cache_dir):
+        atlas = SpriteAtlas(cache_dir)
+        for state in STATE_COLORS:
+            atlas.frames(state)
+
+    def draw_fresh():
+        with tempfile.TemporaryDirectory() as cache_dir:
+            load_all(cache_dir)
+
+    cold = time_per_call(draw_fresh, 1, repeat)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        load_all(cache_dir)
+        warm = time_per_call(lambda: load_all(cache_dir), 1, repeat)
+    return {
+        "cold_ms": Metric(cold * 1e3, "ms", higher_is_better=False),
+        "warm_ms": Metric(warm * 1e3, "ms", higher_is_better=False),
+    }
+
+@benchmark("render.tk", needs_display=True)
+def bench_tk(quick):
+    """PetSprite startup and per-frame animate()/update_status_bars() cost."""
+    import tkinter as tk
+    from src.game import Game
+    from src.tamagotchi.pet_sprite import PetSprite
+    from src.tamagotchi.ui.retained import RetainedBar
+
+    root = _tk_root()
+    try:
+        canvas = tk.Canvas(root, width=360, height=300)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            started = time.perf_counter()
+            sprite = PetSprite(canvas, 180, 150, atlas=SpriteAtlas(cache_dir))
+            sprite.load_sprites()
+            startup = time.perf_counter() - started
+        number = 200 if quick else 2000
+        animate = time_per_call(sprite.animate, number)
+
+        bars = {
+            f"{stat}_fill": RetainedBar(tk.Canvas(root), 200, 20, "#FF0000")
+            for stat in ("hunger", "happiness", "energy")
+        }
+        pet = Tamagotchi("Bench", last_update=0.0)
+        game = SimpleNamespace(pet=pet, **bars)
+        clock = iter(range(1, 10**9))
+
+        def frame():
+            pet.update(float(next(clock)) * 0.01)
+            Game.update_status_bars(game)
+            root.update_idletasks()
+
+        bars_frame = time_per_call(frame, number)
+    finally:
+        root.destroy()
+    return {
+        "sprite_startup_ms": Metric(startup * 1e3, "ms", higher_is_better=False),
+        "animate_latency": latency(animate),
+        "status_bars_latency": latency(bars_frame),
+    }
+
+@benchmark("render.sprite_cache", needs_display=True)
+def bench_sprite_cache(quick):
+    """Tk images and bytes held by many sprites sharing the process-wide frame cache."""
+    import tkinter as tk
+    from src.tamagotchi.pet_sprite import FRAME_CACHE, PetSprite, appearance_for
+
+    root = _tk_root()
+    try:
+        canvas = tk.Canvas(root)
+        count = 100 if quick else 1000
+        started = time.perf_counter()
+        sprites = [
+            PetSprite(canvas, 0, 0, appearance=appearance_for(f"Pet{i}")) for i in range(count)
+        ]
+        for sprite in sprites:
+            sprite.load_sprites()
+        elapsed = time.perf_counter() - started
+        images, held = len(FRAME_CACHE), FRAME_CACHE.bytes
+    finally:
+        FRAME_CACHE.clear()
+        root.destroy()
+    return {
+        "images_per_sprite": Metric(images / count, "images", higher_is_better=False),
+        "bytes_held": Metric(held, "bytes", higher_is_better=False),
+        "startup_per_sprite": latency(elapsed / count),
+    }
+
+@benchmark("render.farm", needs_display=True)
+def bench_farm(quick):
+    """FarmView frame cost with thousands of pets loaded, and the Tk items it keeps."""
+    from src.tamagotchi.ui.farm import FarmView, random_population
+
+    root = _tk_root()
+    try:
+        root.geometry("800x600")
+        view = FarmView(root, random_population(1000 if quick else 5000))
+        view.frame.pack(fill="both", expand=True)
+        root.update()
+        number = 50 if quick else 300
+
+        def frame():
+            view._frame()  # pylint: disable=protected-access
+            root.update_idletasks()
+
+        per_frame = time_per_call(frame, number)
+        view.canvas.yview_scroll(10, "units")
+        scroll = time_per_call(lambda: view.canvas.yview_scroll(1, "units"), 20)
+        items = len(view.canvas.find_all())
+        view.destroy()
+    finally:
+        root.destroy()
+    return {
+        "frame_latency": latency(per_frame),
+        "scroll_row_latency": latency(scroll),
+        "canvas_items": Metric(items, "items", higher_is_better=False),
+    }
@@ -0,0 +1,21 @@
+"""Benchmarks for launch cost, measured in fresh interpreters."""
+from .harness import Metric, Skip, benchmark
+from .startup import IMPORT_BUDGETS_MS, import_time, time_to_first_frame
+
+@benchmark("startup.imports")
+def bench_imports(quick):
+    """Cumulative ``-X importtime`` of the model and game entry modules."""
+    # pylint: disable=unused-argument
+    return {
+        module: Metric(import_time(module)[0], "ms", higher_is_better=False)
+        for module in IMPORT_BUDGETS_MS
+    }
+
+@benchmark("startup.first_frame", needs_display=True)
+def bench_first_frame(quick):
+    """Launching the classic game until its first frame is painted."""
+    # pylint: disable=unused-argument
+    elapsed = time_to_first_frame()
+    if elapsed is None:
+        raise Skip("the game could not open a window; run under xvfb-run")
+    return {"launch_ms": Metric(elapsed, "ms", higher_is_better=False)}
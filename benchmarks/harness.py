@@ -0,0 +1,92 @@
+"""Registry, timing helpers and baseline comparison for the benchmark suite."""
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+import platform
+import statistics
+import sys
+import time
+
+@dataclass
+class Metric:
+    """One measured value."""
+    value: float
+    unit: str
+    higher_is_better: bool = True
+
+@dataclass
+class Benchmark:
+    """A registered benchmark producing one or more metrics."""
+    name: str
+    func: Callable[[bool], Dict[str, Metric]]
+    needs_display: bool = False
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+class Skip(Exception):
+    """Raised by a benchmark that cannot run in this environment."""
+
+def benchmark(name: str, needs_display: bool = False) -> Callable:
+    """Register a benchmark function taking a ``quick`` flag."""
+    def register(func: Callable[[bool], Dict[str, Metric]]) -> Callable:
+        BENCHMARKS[name] = Benchmark(name, func, needs_display)
+        return func
+    return register
+
+def time_per_call(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Return the median seconds per call over ``repeat`` runs of ``number`` calls."""
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        runs.append((time.perf_counter() - started) / number)
+    return statistics.median(runs)
+
+def rate(seconds_per_call: float, unit: str = "ops/s") -> Metric:
+    """Turn a per-call time into a throughput metric."""
+    return Metric(1.0 / seconds_per_call if seconds_per_call else float("inf"), unit)
+
+def latency(seconds_per_call: float) -> Metric:
+    """Turn a per-call time into a microsecond latency metric."""
+    return Metric(seconds_per_call * 1e6, "us", higher_is_better=False)
+
+def environment() -> Dict[str, str]:
+    """Describe the machine so results from different hosts aren't compared blindly."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+def run(names: Optional[List[str]] = None, quick: bool = False) -> Dict:
+    """Run the selected benchmarks and return the JSON-ready results document."""
+    results = {}
+    skipped = {}
+    for name, bench in BENCHMARKS.items():
+        if names and not any(selected in name for selected in names):
+            continue
+        try:
+            metrics = bench.func(quick)
+        except Skip as e:
+            skipped[name] = str(e)
+            continue
+        for metric_name, metric in metrics.items():
+            results[f"{name}.{metric_name}"] = asdict(metric)
+    return {"environment": environment(), "quick": quick, "results": results, "skipped": skipped}
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Return a line per metric that got worse than the baseline by more than ``tolerance``."""
+    regressions = []
+    for name, metric in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if not reference or not reference["value"]:
+            continue
+        change = (metric["value"] - reference["value"]) / reference["value"]
+        worse = -change if metric["higher_is_better"] else change
+        if worse > tolerance:
+            regressions.append(
+                f"{name}: {reference['value']:.4g} -> {metric['value']:.4g} {metric['unit']} "
+                f"({worse:.0%} worse)"
+            )
+    return regressions
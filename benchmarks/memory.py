@@ -0,0 +1,70 @@
+"""Report bytes per pet for each in-memory representation at several population sizes.
+
+    python -m benchmarks.memory --sizes 10000 100000 1000000
+"""
+from typing import Callable, Dict, List, Optional
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from src.tamagotchi.core.compact import CompactTamagotchi
+from src.tamagotchi.core.pet import Tamagotchi
+from src.tamagotchi.core.population import PetPopulation
+
+def _pets(cls: type, count: int) -> List:
+    # Distinct float stats, as pets have after their first update
+    return [
+        cls(f"Pet{i}", hunger=i % 97 + 0.5, happiness=i % 89 + 0.25,
+            energy=i % 83 + 0.125, last_update=1.7e9 + i)
+        for i in range(count)
+    ]
+
+REPRESENTATIONS: Dict[str, Callable[[int], object]] = {
+    "dataclass": lambda count: _pets(Tamagotchi, count),
+    "compact": lambda count: _pets(CompactTamagotchi, count),
+    "population": lambda count: PetPopulation.from_pets(_pets(CompactTamagotchi, count)),
+}
+
+def bytes_per_pet(build: Callable[[int], object], count: int) -> float:
+    """Return the traced bytes still held per pet once ``build(count)`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        pets = build(count)
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del pets
+    return held / count
+
+def measure(sizes: List[int], names: Optional[List[str]] = None) -> Dict[str, Dict[int, float]]:
+    """Return ``{representation: {size: bytes per pet}}``."""
+    return {
+        name: {size: bytes_per_pet(build, size) for size in sizes}
+        for name, build in REPRESENTATIONS.items()
+        if not names or name in names
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Bytes per pet by representation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--only", action="append", choices=sorted(REPRESENTATIONS))
+    parser.add_argument("--json", action="store_true", help="print the table as JSON")
+    args = parser.parse_args(argv)
+
+    table = measure(args.sizes, args.only)
+    if args.json:
+        json.dump(table, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"{'pets':>10} " + " ".join(f"{name:>12}" for name in table))
+    for size in args.sizes:
+        print(f"{size:>10} " + " ".join(f"{table[name][size]:>12.1f}" for name in table))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
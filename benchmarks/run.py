@@ -0,0 +1,48 @@
+"""Run the benchmark suite and optionally compare it against a stored baseline.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+"""
+from typing import List, Optional
+import argparse
+import json
+import sys
+from . import bench_core, bench_persistence, bench_render, bench_startup  # noqa: F401  pylint: disable=unused-import
+from .harness import compare, run
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Tamagotchi performance benchmarks")
+    parser.add_argument("-k", dest="names", action="append",
+                        help="only run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads for CI smoke runs")
+    parser.add_argument("--output", help="write results JSON to this file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="flag metrics that regressed against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed relative slowdown before a metric counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.names, args.quick)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    for name, reason in results["skipped"].items():
+        print(f"skipped {name}: {reason}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions against {args.compare}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
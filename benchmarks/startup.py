@@ -0,0 +1,113 @@
+"""Check launch cost against budgets: ``-X importtime`` per entry module and time to first frame.
+
+    python -m benchmarks.startup           # exits non-zero when over budget
+    python -m benchmarks.startup --json
+
+Every measurement runs in a fresh interpreter so nothing is already imported.
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in milliseconds
+IMPORT_BUDGETS_MS: Dict[str, float] = {
+    "src.tamagotchi.core.pet": 150.0,
+    "src.tamagotchi.core.population": 400.0,
+    "src.game": 300.0,
+}
+
+# Launch to the first painted window, including interpreter startup
+FIRST_FRAME_BUDGET_MS = 1500.0
+
+# Modules the headless model must never pull in
+HEADLESS_MODULES = ("src.tamagotchi", "src.tamagotchi.core.pet", "src.tamagotchi.storage.journal")
+GUI_MODULES = ("tkinter", "PIL")
+
+_FIRST_FRAME_SCRIPT = """
+import sys, tempfile
+try:
+    from src.game import Game
+    game = Game(save_dir=tempfile.mkdtemp())
+except Exception as e:  # No display, most likely
+    print(f"error {e}", flush=True)
+    sys.exit(1)
+game.root.update()
+print("first-frame", flush=True)
+game.root.destroy()
+"""
+
+def import_time(module: str) -> Tuple[float, List[str]]:
+    """Return the cumulative import time of ``module`` in ms and every module it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total) / 1000
+    return cumulative[module], sorted(cumulative)
+
+def time_to_first_frame() -> Optional[float]:
+    """Return ms from launching the classic game to its first painted frame, or None without a display."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", _FIRST_FRAME_SCRIPT],
+        cwd=REPO_ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    line = process.stdout.readline()
+    elapsed = (time.perf_counter() - started) * 1000
+    process.communicate()
+    return elapsed if line.startswith("first-frame") else None
+
+def check() -> Tuple[Dict[str, Optional[float]], List[str]]:
+    """Measure everything; returns the measurements and a list of budget violations."""
+    measurements: Dict[str, Optional[float]] = {}
+    problems = []
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        elapsed, _ = import_time(module)
+        measurements[f"import {module}"] = elapsed
+        if elapsed > budget:
+            problems.append(f"import {module} took {elapsed:.1f} ms (budget {budget:.0f} ms)")
+    for module in HEADLESS_MODULES:
+        _, imported = import_time(module)
+        leaked = [name for name in imported if name.split(".")[0] in GUI_MODULES]
+        if leaked:
+            problems.append(f"import {module} pulled in {', '.join(leaked[:3])}")
+    first_frame = time_to_first_frame()
+    measurements["first frame"] = first_frame
+    if first_frame is not None and first_frame > FIRST_FRAME_BUDGET_MS:
+        problems.append(
+            f"first frame after {first_frame:.0f} ms (budget {FIRST_FRAME_BUDGET_MS:.0f} ms)"
+        )
+    return measurements, problems
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Check startup time against budgets")
+    parser.add_argument("--json", action="store_true", help="print measurements as JSON")
+    args = parser.parse_args(argv)
+
+    measurements, problems = check()
+    if args.json:
+        json.dump({"measurements_ms": measurements, "over_budget": problems}, sys.stdout, indent=2)
+        print()
+    else:
+        for name, value in measurements.items():
+            shown = "skipped (no display)" if value is None else f"{value:8.1f} ms"
+            print(f"{name:<40} {shown}")
+    for problem in problems:
+        print(f"OVER BUDGET {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,33 @@
+import argparse
+import logging
 import os
 import sys
+from src.game import Game
+from src.tamagotchi.clock import parse_speed
 
-print("=== Starting Tamagotchi Game ===")
-print(f"Current working directory: {os.getcwd()}")
-print(f"Python version: {sys.version}")
-print(f"Python executable: {sys.executable}")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 
-from src.game import Game
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Look after a virtual pet.")
+    parser.add_argument(
+        "--log-level", type=str.upper, choices=LOG_LEVELS,
+        default=os.environ.get("TAMAGOTCHI_LOG_LEVEL", "WARNING").upper(),
+        help="diagnostics shown on stderr (default: $TAMAGOTCHI_LOG_LEVEL or WARNING)"
+    )
+    args = parser.parse_args(argv)
+    # argparse checks choices for given flags only, not for the environment default
+    if args.log_level not in LOG_LEVELS:
+        parser.error(f"TAMAGOTCHI_LOG_LEVEL must be one of {', '.join(LOG_LEVELS)}, "
+                     f"not {args.log_level!r}")
+    if os.environ.get("TAMAGOTCHI_SPEED"):
+        try:
+            parse_speed(os.environ["TAMAGOTCHI_SPEED"])
+        except ValueError as error:
+            parser.error(str(error))
+    logging.basicConfig(level=args.log_level)
+    game = Game()
+    game.run()
+    return 0
 
 if __name__ == "__main__":
-    print("Creating game instance...")
-    game = Game()
-    print("Starting game...")
-    game.run() 
\ No newline at end of file
+    sys.exit(main())
@@ -1,4 +1,18 @@
-from .tamagotchi.ui.game import Game, run_game
-from .tamagotchi import Tamagotchi
+"""Package root; exports are imported on first use so headless code never loads tkinter."""
+from typing import Any
+import importlib
 
-__all__ = ['Game', 'Tamagotchi'] 
\ No newline at end of file
+_EXPORTS = {
+    "Game": ".tamagotchi.ui.game",
+    "run_game": ".tamagotchi.ui.game",
+    "Tamagotchi": ".tamagotchi.core.pet",
+}
+
+__all__ = ['Game', 'Tamagotchi']
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
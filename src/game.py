@@ -1,12 +1,26 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
+import logging
 import os
+import time
+from src.tamagotchi.clock import get_clock
 from src.tamagotchi.core.pet import Tamagotchi
-from src.tamagotchi.pet_sprite import PetSprite
+from src.tamagotchi.pet_sprite import PetSprite, mood
 from src.tamagotchi.config.settings import settings
+from src.tamagotchi.metrics import (
+    AFTER_LAG_SECONDS, PET_SAVE_ERRORS, RENDER_SECONDS, TICK_SECONDS, metrics
+)
+from src.tamagotchi.storage.eventlog import EventLog
+from src.tamagotchi.storage.journal import SaveJournal
+from src.tamagotchi.ui.overlay import FrameStats, PerfOverlay
+from src.tamagotchi.ui.retained import RetainedBar
+
+logger = logging.getLogger(__name__)
 
 class Game:
-    def __init__(self):
+    def __init__(self, save_dir=None, clock=None):
+        # Model time for the pet; the loop itself still ticks once a real second
+        self.clock = clock if clock is not None else get_clock()
         self.root = tk.Tk()
         self.root.title(settings.game.TITLE)
         self.root.geometry(f"{settings.game.WINDOW_WIDTH}x{settings.game.WINDOW_HEIGHT}")
@@ -73,16 +87,27 @@ class Game:
         self.sleep_button = sleep_button
         
         # Load or create pet
+        if save_dir is None:
+            save_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "saves")
+        self.save_dir = save_dir
+        self.journal = SaveJournal(self.save_dir)
+        self.events = EventLog(self.save_dir)
         self.pet = self.load_or_create_pet()
         
+        # Frame timing behind the F3 overlay
+        self.frame_stats = FrameStats()
+        self.overlay = PerfOverlay(self.root, self.frame_stats)
+        
         # Create pet sprite
         self.pet_sprite = PetSprite(
             self.canvas,
             settings.game.WINDOW_WIDTH // 2,
-            150
+            150,
+            stats=self.frame_stats
         )
         
         # Start game loop
+        self._update_due = None
         self.update()
         
     def create_menu(self):
@@ -95,6 +120,8 @@ class Game:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="New Pet", command=self.new_pet)
         file_menu.add_command(label="Load Pet", command=self.load_pet)
+        if metrics.enabled:
+            file_menu.add_command(label="Export Metrics...", command=self.export_metrics)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.exit_game)
         
@@ -107,13 +134,14 @@ class Game:
         """Start a new pet."""
         if messagebox.askyesno("New Pet", "Are you sure you want to start a new pet? Your current pet will be saved."):
             self.save_pet()  # Save current pet before creating new one
-            self.pet = Tamagotchi("Tama")
+            self.pet = Tamagotchi("Tama", last_update=self.clock())
+            self.events.snapshot(self.pet)
             self.save_pet()
             messagebox.showinfo("New Pet", "A new pet has been created!")
             
     def load_pet(self):
         """Load a pet from a save file."""
-        save_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "saves")
+        save_dir = self.save_dir
         if not os.path.exists(save_dir):
             messagebox.showwarning("Load Pet", "No save directory found!")
             return
@@ -148,8 +176,9 @@ class Game:
             if selection:
                 pet_name = listbox.get(selection[0])
                 self.save_pet()  # Save current pet
-                self.pet = Tamagotchi.load(pet_name, save_dir)
+                self.pet = self.journal.load(pet_name)
                 if self.pet:
+                    self.events.loaded(self.pet)
                     messagebox.showinfo("Load Pet", f"Loaded {pet_name}!")
                     dialog.destroy()
                 else:
@@ -167,10 +196,26 @@ class Game:
         )
         load_button.pack(pady=10)
         
+    def export_metrics(self):
+        """Write a metrics snapshot as JSON or Prometheus text."""
+        path = filedialog.asksaveasfilename(
+            title="Export Metrics",
+            defaultextension=".prom",
+            filetypes=[("Prometheus text", "*.prom"), ("JSON", "*.json")]
+        )
+        if path:
+            metrics.dump(path)
+            
     def exit_game(self):
         """Exit the game with confirmation."""
         if messagebox.askyesno("Exit", "Are you sure you want to exit? Your pet will be saved."):
             self.save_pet()
+            try:
+                self.events.compact(
+                    self.pet.name, self.pet.last_update - settings.save.EVENT_RETENTION
+                )
+            except OSError:
+                logger.exception("Error compacting the event log")
             self.root.quit()
             
     def show_about(self):
@@ -205,12 +250,16 @@ class Game:
         )
         bar.pack(side='left', padx=5)
         
-        setattr(self, f"{label.cget('text').lower()}_bar", bar)
+        name = label.cget('text').lower()
+        setattr(self, f"{name}_bar", bar)
+        setattr(
+            self,
+            f"{name}_fill",
+            RetainedBar(bar, settings.ui.BAR_WIDTH, settings.ui.BAR_HEIGHT, color)
+        )
         
     def create_button(self, text, command, column):
         """Create a button with the given text, command, and column position."""
-        print(f"Creating button: {text} at column {column}")  # Debug print
-        
         button = tk.Button(
             self.buttons_frame,
             text=text,
@@ -227,58 +276,39 @@ class Game:
         
         # Place button in grid with padding
         button.grid(row=0, column=column, padx=10, pady=10, sticky='ew')
-        
-        print(f"Button {text} created and placed at column {column}")  # Debug print
+        logger.debug("Placed %s button at column %d", text, column)
         return button
         
     def update_status_bars(self):
-        # Update hunger bar
-        self.hunger_bar.delete("all")
-        self.hunger_bar.create_rectangle(
-            0, 0,
-            settings.ui.BAR_WIDTH * (self.pet.hunger / 100),
-            settings.ui.BAR_HEIGHT,
-            fill=settings.game.RED
-        )
-        
-        # Update happiness bar
-        self.happiness_bar.delete("all")
-        self.happiness_bar.create_rectangle(
-            0, 0,
-            settings.ui.BAR_WIDTH * (self.pet.happiness / 100),
-            settings.ui.BAR_HEIGHT,
-            fill=settings.game.YELLOW
-        )
-        
-        # Update energy bar
-        self.energy_bar.delete("all")
-        self.energy_bar.create_rectangle(
-            0, 0,
-            settings.ui.BAR_WIDTH * (self.pet.energy / 100),
-            settings.ui.BAR_HEIGHT,
-            fill=settings.game.GREEN
-        )
+        # Resize the existing rectangles; unchanged widths cost no Tk call
+        self.hunger_fill.set_value(self.pet.hunger)
+        self.happiness_fill.set_value(self.pet.happiness)
+        self.energy_fill.set_value(self.pet.energy)
         
     def update(self):
-        self.pet.update()
-        self.update_status_bars()
-        self.save_pet()
-        
-        # Update pet sprite based on state
-        if self.pet.is_sleeping:
-            self.pet_sprite.set_animation("sleep")
-        elif self.pet.happiness > 80:
-            self.pet_sprite.set_animation("happy")
-        elif self.pet.hunger < 20:
-            self.pet_sprite.set_animation("sick")
-        else:
-            self.pet_sprite.set_animation("idle")
+        lag = 0.0 if self._update_due is None else time.perf_counter() - self._update_due
+        if self._update_due is not None:
+            AFTER_LAG_SECONDS.observe(lag)
+        self.frame_stats.begin_frame(lag)
+        with TICK_SECONDS.time():
+            with self.frame_stats.phase("update"):
+                self.pet.update(self.clock())
+            with self.frame_stats.phase("save"):
+                self.flush_pet()
+        
+        with RENDER_SECONDS.time(), self.frame_stats.phase("render"):
+            self.update_status_bars()
+            
+            # Update pet sprite based on state
+            self.pet_sprite.set_animation(mood(self.pet))
+        self.frame_stats.end_frame()
         
+        self._update_due = time.perf_counter() + 1.0
         self.root.after(1000, self.update)
         
     def feed_pet(self):
         if not self.pet.is_sleeping:
-            self.pet.feed()
+            self.act("feed")
             self.pet_sprite.set_animation("eat")
             self.root.after(1000, lambda: self.pet_sprite.set_animation("idle"))
         else:
@@ -289,8 +319,8 @@ class Game:
             messagebox.showwarning("Warning", "Cannot play while sleeping!")
             return
             
-        if self.pet.energy >= settings.pet.PLAY_ENERGY_COST:
-            self.pet.play()
+        if self.pet.energy >= self.pet.rates.PLAY_ENERGY_COST:
+            self.act("play")
             self.pet_sprite.set_animation("play")
             self.root.after(1000, lambda: self.pet_sprite.set_animation("idle"))
         else:
@@ -298,7 +328,7 @@ class Game:
             
     def sleep_pet(self):
         """Toggle sleep mode for the pet."""
-        self.pet.sleep()
+        self.act("sleep")
         if self.pet.is_sleeping:
             self.pet_sprite.set_animation("sleep")
             messagebox.showinfo("Sleep", f"{self.pet.name} is now sleeping.")
@@ -306,31 +336,49 @@ class Game:
             self.pet_sprite.set_animation("idle")
             messagebox.showinfo("Sleep", f"{self.pet.name} has woken up.")
         
-    def load_or_create_pet(self):
-        save_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "saves")
-        os.makedirs(save_dir, exist_ok=True)
-        save_path = os.path.join(save_dir, "tama.json")
-        
-        print(f"Load directory: {save_dir}")
-        print(f"Attempting to load from: {save_path}")
+    def act(self, action):
+        """Apply an action to the pet, recording it in the event log."""
+        try:
+            self.events.apply(self.pet, action)
+        except OSError:
+            logger.exception("Error logging %s", action)
+            getattr(self.pet, action)()
         
+    def load_or_create_pet(self):
         # Try to load existing pet
-        pet = Tamagotchi.load("tama", save_dir)
+        pet = self.journal.load("tama")
+        if pet is None:
+            # A missing or corrupt save can be rebuilt from the action history
+            pet = self.events.replay("tama")
+            if pet is not None:
+                logger.warning("Rebuilt %s from %s", pet.name, self.events.path("tama"))
+                self.journal.snapshot(pet)
         if pet is not None:
+            logger.info("Loaded %s from %s", pet.name, self.save_dir)
+            self.events.loaded(pet)
             return pet
             
-        print(f"No save file found at: {save_path}")
+        logger.info("No save found at %s; creating a new pet", self.journal.snapshot_path("tama"))
         # Create new pet if none exists
-        pet = Tamagotchi("Tama")
-        pet.save(save_dir)
+        pet = Tamagotchi("Tama", last_update=self.clock())
+        self.journal.snapshot(pet)
+        self.events.snapshot(pet)
         return pet
             
+    def flush_pet(self):
+        """Append the pet's changes to its journal once the flush interval has passed."""
+        try:
+            self.journal.maybe_flush(self.pet)
+        except OSError:
+            PET_SAVE_ERRORS.inc()
+            logger.exception("Error saving pet")
+            
     def save_pet(self):
         try:
-            save_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "saves")
-            self.pet.save(save_dir)
-        except Exception as e:
-            print(f"Error saving pet: {e}")
+            self.journal.snapshot(self.pet)
+        except Exception:
+            PET_SAVE_ERRORS.inc()
+            logger.exception("Error saving pet")
             messagebox.showerror("Error", "Failed to save pet state!")
             
     def run(self):
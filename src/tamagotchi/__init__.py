@@ -1,8 +1,20 @@
 """A modern Tamagotchi-style virtual pet game."""
+from typing import Any
+import importlib
 
 __version__ = "1.0.0"
 
-from .core.pet import Tamagotchi
-from .ui.game import Game
+# The UI pulls in tkinter, so exports are imported on first use
+_EXPORTS = {
+    "Tamagotchi": ".core.pet",
+    "Game": ".ui.game",
+}
 
-__all__ = ["Tamagotchi", "Game"] 
\ No newline at end of file
+__all__ = ["Tamagotchi", "Game"]
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
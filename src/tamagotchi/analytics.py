@@ -0,0 +1,461 @@
+"""Streaming statistics over saved pets, in one pass and constant memory.
+
+    python -m src.tamagotchi.analytics saves
+    python -m src.tamagotchi.analytics backup.tcol --json
+
+A pipeline is plain generators: a source yields pets (or per-pet histories
+rebuilt from the event logs), stages such as where() and select() wrap it,
+and an aggregator folds whatever comes out the end. Aggregators keep a fixed
+amount of state however many items pass through, so quantiles are P²
+estimates rather than sorts. Moods come from pet_sprite.mood(), the rule the
+game window uses to pick a sprite.
+
+    sick = aggregate(current(read_pets("saves")), Fraction(is_sick))
+    deaths = aggregate(
+        where(histories("saves"), lambda h: h.died_at is not None),
+        GroupBy(care_band, lambda: Quantile(0.5, lambda h: h.lifetime)),
+    )
+"""
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+)
+from bisect import bisect_right, insort
+import abc
+import argparse
+import json
+import math
+import os
+import sys
+from .clock import now
+from .config.profiles import profile_rates
+from .config.settings import settings
+from .core.pet import Tamagotchi
+from .pet_sprite import mood
+from .storage.columnar import ColumnReader
+from .storage.eventlog import EventLog
+from .storage.records import RecordFile
+from .storage.sqlite_store import JSONDirectoryStore, SQLiteStore
+
+SECONDS_PER_DAY = 86400.0
+# Band edges, in logged actions per day, for grouping pets by how often they were cared for
+CARE_BANDS = (1.0, 10.0, 50.0)
+
+def _identity(item: Any) -> Any:
+    return item
+
+# Sources
+
+def pets_in_dir(save_dir: str) -> Iterator[Tamagotchi]:
+    """Yield every pet saved as JSON in ``save_dir``, without listing them all first."""
+    store = JSONDirectoryStore(save_dir)
+    with os.scandir(save_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and not entry.name.startswith("."):
+                pet = store.load(entry.name[:-len(".json")])
+                if pet is not None:
+                    yield pet
+
+def read_pets(path: str) -> Iterator[Tamagotchi]:
+    """Yield every pet in a save directory, SQLite database, record file or column file."""
+    if os.path.isdir(path):
+        yield from pets_in_dir(path)
+    elif path.endswith(".tcol"):
+        with ColumnReader(path) as reader:
+            yield from reader.pets()
+    elif path.endswith(".rec"):
+        with RecordFile(path) as records:
+            yield from records.pets()
+    elif path.endswith(".db"):
+        with SQLiteStore(path) as store:
+            yield from store.load_many()
+    else:
+        raise ValueError(f"don't know how to read pets from {path}")
+
+def _death_time(pet: Tamagotchi) -> float:
+    """Model time a living pet dies at if nobody touches it again."""
+    rates = profile_rates(pet.profile)
+    return pet.last_update + min(
+        pet.hunger / rates.HUNGER_RATE if rates.HUNGER_RATE > 0 else math.inf,
+        pet.happiness / rates.HAPPINESS_RATE if rates.HAPPINESS_RATE > 0 else math.inf,
+    )
+
+class History(NamedTuple):
+    """One pet's life as its event log tells it."""
+    name: str
+    born: float  # Model time of the first logged state
+    last_seen: float  # Model time of the last logged record
+    actions: int  # Actions taken while the pet was alive
+    died_at: Optional[float]  # None while alive, or if it was dead when first logged
+    pet: Tamagotchi  # State after the last record
+
+    @property
+    def lifetime(self) -> Optional[float]:
+        """Seconds from the first logged state to death, or None if it hasn't died."""
+        return None if self.died_at is None else self.died_at - self.born
+
+    @property
+    def care_per_day(self) -> float:
+        """Actions per day over the part of its life the log covers."""
+        span = (self.last_seen if self.died_at is None else self.died_at) - self.born
+        if span <= 0:
+            return math.inf if self.actions else 0.0
+        return self.actions * SECONDS_PER_DAY / span
+
+def history(log: EventLog, name: str, at: Optional[float] = None) -> Optional[History]:
+    """Replay one pet's log, noting when it died; a pet left alone past ``at`` counts as dead.
+
+    ``at`` defaults to now(). Returns None if the log holds no state.
+    """
+    pet = None
+    born = last_seen = 0.0
+    actions = 0
+    died_at = None
+    for event in log.events(name):
+        if pet is not None and pet.is_alive and died_at is None:
+            death = _death_time(pet)
+            if death <= event.time:
+                died_at = death
+        if event.pet is not None:
+            if pet is None:
+                born = event.time
+            pet = event.pet
+        elif pet is not None:
+            pet.update(event.time)
+            if pet.is_alive:
+                actions += 1
+            getattr(pet, event.kind)()
+        last_seen = event.time
+    if pet is None:
+        return None
+    if pet.is_alive and died_at is None:
+        death = _death_time(pet)
+        if death <= (now() if at is None else at):
+            died_at = death
+    return History(pet.name, born, last_seen, actions, died_at, pet)
+
+def histories(save_dir: str, at: Optional[float] = None) -> Iterator[History]:
+    """Yield the history of every pet with an event log in ``save_dir``."""
+    log = EventLog(save_dir)
+    with os.scandir(save_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".events"):
+                pet_history = history(log, entry.name[:-len(".events")], at)
+                if pet_history is not None:
+                    yield pet_history
+
+# Stages
+
+def where(items: Iterable[Any], predicate: Callable[[Any], bool]) -> Iterator[Any]:
+    """Keep the items ``predicate`` accepts."""
+    return (item for item in items if predicate(item))
+
+def select(items: Iterable[Any], function: Callable[[Any], Any]) -> Iterator[Any]:
+    """Replace each item with ``function(item)``."""
+    return (function(item) for item in items)
+
+def current(pets: Iterable[Tamagotchi], at: Optional[float] = None) -> Iterator[Tamagotchi]:
+    """Bring each saved pet up to model time ``at`` (default: now()), as loading it would."""
+    at = now() if at is None else at
+    for pet in pets:
+        pet.update(at)
+        yield pet
+
+def tumbling(
+    items: Iterable[Any],
+    key: Callable[[Any], float],
+    width: float,
+    make: Callable[[], 'Aggregator'],
+) -> Iterator[Tuple[float, Any]]:
+    """Fold items into back-to-back windows ``width`` wide by ``key``; yield ``(start, result)``.
+
+    Items must arrive in key order; only the open window is kept. Raises
+    ValueError if an item belongs to a window that has already closed.
+    """
+    start = None
+    aggregator = make()
+    for item in items:
+        position = key(item)
+        window = math.floor(position / width) * width
+        if start is None:
+            start = window
+        elif window < start:
+            raise ValueError(f"item at {position} arrived after its window closed")
+        elif window > start:
+            yield start, aggregator.result()
+            start, aggregator = window, make()
+        aggregator.add(item)
+    if start is not None:
+        yield start, aggregator.result()
+
+# Aggregators
+
+class Aggregator(abc.ABC):
+    """Folds a stream one item at a time; ``value`` picks the number to fold from each item."""
+
+    def __init__(self, value: Optional[Callable[[Any], Any]] = None) -> None:
+        self.value = value if value is not None else _identity
+
+    @abc.abstractmethod
+    def add(self, item: Any) -> None:
+        """Fold in one item."""
+
+    @abc.abstractmethod
+    def result(self) -> Any:
+        """Return the statistic so far; None if nothing has been added."""
+
+class Count(Aggregator):
+    """How many items went by."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def add(self, item: Any) -> None:
+        self.count += 1
+
+    def result(self) -> int:
+        return self.count
+
+class Fraction(Aggregator):
+    """The share of items ``predicate`` accepts."""
+
+    def __init__(self, predicate: Callable[[Any], bool]) -> None:
+        super().__init__(predicate)
+        self.count = 0
+        self.accepted = 0
+
+    def add(self, item: Any) -> None:
+        self.count += 1
+        if self.value(item):
+            self.accepted += 1
+
+    def result(self) -> Optional[float]:
+        return self.accepted / self.count if self.count else None
+
+class Mean(Aggregator):
+    """Running mean and standard deviation (Welford's method)."""
+
+    def __init__(self, value: Optional[Callable[[Any], Any]] = None) -> None:
+        super().__init__(value)
+        self.count = 0
+        self.mean = 0.0
+        self._squares = 0.0
+
+    def add(self, item: Any) -> None:
+        x = self.value(item)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation so far."""
+        return math.sqrt(self._squares / self.count) if self.count else 0.0
+
+    def result(self) -> Optional[float]:
+        return self.mean if self.count else None
+
+class Quantile(Aggregator):
+    """Estimate the ``q`` quantile with the P² algorithm: five markers, no samples kept."""
+
+    def __init__(self, q: float, value: Optional[Callable[[Any], Any]] = None) -> None:
+        if not 0.0 < q < 1.0:
+            raise ValueError(f"quantile must be between 0 and 1, got {q}")
+        super().__init__(value)
+        self.q = q
+        self._heights: List[float] = []
+        # Marker positions and where the middle three should be; the ends sit at 0 and n - 1
+        self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self._desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+        self._increments = (0.0, q / 2, q, (1 + q) / 2, 1.0)
+
+    def add(self, item: Any) -> None:
+        x = float(self.value(item))
+        heights = self._heights
+        if len(heights) < 5:
+            insort(heights, x)
+            return
+        if x < heights[0]:
+            heights[0] = x
+            cell = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            cell = 3
+        else:
+            cell = bisect_right(heights, x) - 1
+        positions, desired, increments = self._positions, self._desired, self._increments
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in (1, 2, 3):
+            desired[i] += increments[i]
+            offset = desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                    offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i])
+            / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1])
+            / (positions[i] - positions[i - 1])
+        )
+
+    def result(self) -> Optional[float]:
+        if not self._heights:
+            return None
+        if len(self._heights) < 5:
+            # Too few to estimate; the exact answer is at hand
+            return self._heights[round(self.q * (len(self._heights) - 1))]
+        return self._heights[2]
+
+class Summary(Aggregator):
+    """Count, mean, spread and deciles, in the shape the simulator reports stats."""
+
+    def __init__(self, value: Optional[Callable[[Any], Any]] = None) -> None:
+        super().__init__(value)
+        self._mean = Mean()
+        self._quantiles = {name: Quantile(q) for name, q in
+                           (("p10", 0.1), ("p50", 0.5), ("p90", 0.9))}
+
+    def add(self, item: Any) -> None:
+        x = self.value(item)
+        self._mean.add(x)
+        for quantile in self._quantiles.values():
+            quantile.add(x)
+
+    def result(self) -> Dict[str, float]:
+        if not self._mean.count:
+            return {}
+        summary = {"count": self._mean.count, "mean": self._mean.mean, "std": self._mean.std}
+        summary.update((name, quantile.result()) for name, quantile in self._quantiles.items())
+        return summary
+
+class GroupBy(Aggregator):
+    """One aggregator from ``make()`` per distinct ``key(item)``; memory grows with the keys."""
+
+    def __init__(self, key: Callable[[Any], Any], make: Callable[[], Aggregator]) -> None:
+        super().__init__(key)
+        self.make = make
+        self.groups: Dict[Any, Aggregator] = {}
+
+    def add(self, item: Any) -> None:
+        group = self.value(item)
+        aggregator = self.groups.get(group)
+        if aggregator is None:
+            aggregator = self.groups[group] = self.make()
+        aggregator.add(item)
+
+    def result(self) -> Dict[Any, Any]:
+        return {group: self.groups[group].result() for group in sorted(self.groups)}
+
+class Combine(Aggregator):
+    """Feed every item to several named aggregators, so one pass answers several questions."""
+
+    def __init__(self, **aggregators: Aggregator) -> None:
+        super().__init__()
+        self.aggregators = aggregators
+
+    def add(self, item: Any) -> None:
+        for aggregator in self.aggregators.values():
+            aggregator.add(item)
+
+    def result(self) -> Dict[str, Any]:
+        return {name: aggregator.result() for name, aggregator in self.aggregators.items()}
+
+def aggregate(items: Iterable[Any], aggregator: Aggregator) -> Any:
+    """Run the pipeline to the end through ``aggregator`` and return its result."""
+    for item in items:
+        aggregator.add(item)
+    return aggregator.result()
+
+# Predicates and keys
+
+def is_alive(pet: Tamagotchi) -> bool:
+    """Whether the pet is alive."""
+    return pet.is_alive
+
+def is_sick(pet: Tamagotchi) -> bool:
+    """Whether a living pet is hungry enough for the game to show it sick."""
+    return pet.is_alive and pet.hunger < settings.ui.SICK_THRESHOLD
+
+def pet_mood(pet: Tamagotchi) -> str:
+    """The sprite the game would show, or "dead"."""
+    return mood(pet) if pet.is_alive else "dead"
+
+def care_band(pet_history: History, edges: Sequence[float] = CARE_BANDS) -> str:
+    """Label the pet's actions per day with the band of ``edges`` it falls in."""
+    rate = pet_history.care_per_day
+    if rate < edges[0]:
+        return f"<{edges[0]:g}"
+    for low, high in zip(edges, edges[1:]):
+        if rate < high:
+            return f"{low:g}-{high:g}"
+    return f"{edges[-1]:g}+"
+
+def report(path: str, at: Optional[float] = None) -> Dict[str, Any]:
+    """Pet counts, moods and stats for ``path``, plus deaths by care from any event logs."""
+    pets = aggregate(current(read_pets(path), at), Combine(
+        pets=Count(),
+        alive=Fraction(is_alive),
+        sick=Fraction(is_sick),
+        moods=GroupBy(pet_mood, Count),
+        hunger=Summary(lambda pet: pet.hunger),
+        happiness=Summary(lambda pet: pet.happiness),
+        energy=Summary(lambda pet: pet.energy),
+    ))
+    if os.path.isdir(path):
+        pets["death_days_by_care"] = aggregate(
+            where(histories(path, at), lambda h: h.died_at is not None),
+            GroupBy(care_band, lambda: Summary(lambda h: h.lifetime / SECONDS_PER_DAY)),
+        )
+    return pets
+
+def _format(summary: Dict[str, float]) -> str:
+    if not summary:
+        return "no pets"
+    return (f"mean {summary['mean']:.1f}, p10 {summary['p10']:.1f}, "
+            f"p50 {summary['p50']:.1f}, p90 {summary['p90']:.1f}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Summarise saved pets in one streaming pass")
+    parser.add_argument("source", nargs="?", default="saves",
+                        help="save directory, SQLite database, .rec or .tcol file")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.source):
+        parser.error(f"{args.source} does not exist")
+
+    try:
+        result = report(args.source)
+    except ValueError as e:
+        print(f"Cannot read {args.source}: {e}", file=sys.stderr)
+        return 1
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"{result['pets']} pets, {(result['alive'] or 0.0):.1%} alive, "
+          f"{(result['sick'] or 0.0):.1%} sick (hunger < {settings.ui.SICK_THRESHOLD:g})")
+    if result["pets"]:
+        print("Moods: " + ", ".join(
+            f"{name} {count / result['pets']:.1%}" for name, count in result["moods"].items()
+        ))
+    for stat in ("hunger", "happiness", "energy"):
+        print(f"{stat.capitalize()}: {_format(result[stat])}")
+    for band, days in result.get("death_days_by_care", {}).items():
+        print(f"Died with {band} actions/day: {days['count']} pets, "
+              f"median {days['p50']:.2f} days to death")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
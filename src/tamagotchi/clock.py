@@ -0,0 +1,132 @@
+"""Clocks the pet model, game loops and sprites read the time from.
+
+Model time is seconds since the epoch, as saved in ``last_update``. By default
+it comes from a MonotonicClock, so adjusting the system clock doesn't age or
+rejuvenate pets. Set ``TAMAGOTCHI_SPEED`` to run the game on an accelerated
+VirtualClock, or install one in code:
+
+    from src.tamagotchi.clock import VirtualClock, use_clock
+    with use_clock(VirtualClock(start=0.0)) as clock:
+        pet = Tamagotchi("Tama")
+        clock.advance(7 * 86400)
+        pet.update()
+"""
+from typing import Callable, Iterator, Optional
+import abc
+import contextlib
+import functools
+import logging
+import math
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# CLOCK_BOOTTIME also counts time suspended, so a sleeping laptop still ages its pet
+if hasattr(time, "CLOCK_BOOTTIME"):
+    _elapsed: Callable[[], float] = functools.partial(time.clock_gettime, time.CLOCK_BOOTTIME)
+else:
+    _elapsed = time.monotonic
+
+class Clock(abc.ABC):
+    """Calling a clock returns the current model time in epoch seconds."""
+
+    # Model seconds per real second; loops that wait for model time divide by it
+    rate = 1.0
+
+    @abc.abstractmethod
+    def __call__(self) -> float:
+        """Return the current model time."""
+
+class WallClock(Clock):
+    """The system clock, including any adjustments made to it."""
+
+    def __call__(self) -> float:
+        return time.time()
+
+class MonotonicClock(Clock):
+    """Epoch time that never jumps: a monotonic clock anchored to the wall clock once."""
+
+    def __init__(self, anchor: Optional[float] = None) -> None:
+        """Read ``anchor`` (default: the wall clock) as the time right now."""
+        self._offset = (time.time() if anchor is None else anchor) - _elapsed()
+
+    def __call__(self) -> float:
+        return self._offset + _elapsed()
+
+class VirtualClock(Clock):
+    """Time that runs ``rate`` times faster than real time and can be stepped by hand.
+
+    At the default rate of 0 it only moves when advance() is called, which
+    makes it deterministic for tests and simulations.
+    """
+
+    def __init__(self, start: Optional[float] = None, rate: float = 0.0) -> None:
+        """Start at ``start`` (default: the wall clock)."""
+        self._base = time.time() if start is None else start
+        self._since = _elapsed()
+        self._rate = rate
+
+    def __call__(self) -> float:
+        return self._base + (_elapsed() - self._since) * self._rate
+
+    @property
+    def rate(self) -> float:  # type: ignore[override]
+        """Model seconds per real second; changing it never makes time jump."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        self._base = self()
+        self._since = _elapsed()
+        self._rate = value
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward by ``seconds``."""
+        self._base += seconds
+
+def parse_speed(value: str) -> float:
+    """Read a ``TAMAGOTCHI_SPEED`` value; raises ValueError unless it is finite and above 0."""
+    try:
+        speed = float(value)
+    except ValueError:
+        speed = math.nan
+    if not math.isfinite(speed) or speed <= 0:
+        raise ValueError(f"TAMAGOTCHI_SPEED must be a number above 0, not {value!r}")
+    return speed
+
+def _default_clock() -> Clock:
+    speed = os.environ.get("TAMAGOTCHI_SPEED")
+    if speed:
+        try:
+            return VirtualClock(rate=parse_speed(speed))
+        except ValueError as error:
+            # Importing the model must not fail; main.py reports this as a usage error
+            logger.warning("%s; using real time", error)
+    return MonotonicClock()
+
+# Process-wide clock the model reads when no time is passed in
+_clock = _default_clock()
+
+def get_clock() -> Clock:
+    """Return the process-wide clock."""
+    return _clock
+
+def set_clock(clock: Clock) -> Clock:
+    """Install ``clock`` process-wide and return the one it replaces."""
+    global _clock  # pylint: disable=global-statement
+    previous, _clock = _clock, clock
+    return previous
+
+def now() -> float:
+    """Return the current model time from the process-wide clock."""
+    return _clock()
+
+@contextlib.contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """Install ``clock`` for the duration of the block."""
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
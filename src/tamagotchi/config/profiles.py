@@ -0,0 +1,28 @@
+from typing import Dict
+from .settings import PetSettings, settings
+
+# Pets without a profile follow the global settings.pet, live
+DEFAULT_PROFILE = "default"
+
+# Species/personality rate profiles: each pet resolves its own once, on creation
+PROFILES: Dict[str, PetSettings] = {
+    "glutton": PetSettings(HUNGER_RATE=0.8, FEED_HUNGER_RECOVERY=40.0),
+    "sleepyhead": PetSettings(ENERGY_RATE=0.6, SLEEP_ENERGY_RECOVERY=8.0),
+    "cheerful": PetSettings(HAPPINESS_RATE=0.15, PLAY_HAPPINESS_RECOVERY=30.0),
+    "hardy": PetSettings(HUNGER_RATE=0.35, HAPPINESS_RATE=0.2, ENERGY_RATE=0.3),
+}
+
+def register_profile(name: str, rates: PetSettings) -> None:
+    """Add or replace a named profile; pets created afterwards can use it."""
+    if name == DEFAULT_PROFILE:
+        raise ValueError(f"{DEFAULT_PROFILE!r} always means the global settings")
+    PROFILES[name] = rates
+
+def profile_rates(name: str) -> PetSettings:
+    """Return the coefficients a pet with profile ``name`` runs on."""
+    if name == DEFAULT_PROFILE:
+        return settings.pet
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"unknown rate profile: {name}") from None
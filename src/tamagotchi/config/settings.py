@@ -38,6 +38,38 @@ class UISettings:
     BAR_HEIGHT: int = 20
     INPUT_WIDTH: int = 200
     INPUT_HEIGHT: int = 40
+    HAPPY_THRESHOLD: float = 80.0  # Happiness above this shows the happy sprite
+    SICK_THRESHOLD: float = 20.0  # Hunger below this shows the sick sprite
+    SPRITE_CACHE_BYTES: int = 8 * 1024 * 1024  # Rendered frames kept for all sprites together
+
+@dataclass
+class FarmSettings:
+    """Multi-pet grid view settings."""
+    CELL_WIDTH: int = 96
+    CELL_HEIGHT: int = 112
+    BAR_WIDTH: int = 64
+    BAR_HEIGHT: int = 4
+    FRAME_MS: int = 150  # One shared animation timer for every visible pet
+    TICK_MS: int = 1000  # Model updates for the whole population
+
+@dataclass
+class SaveSettings:
+    """Persistence-specific settings."""
+    FLUSH_INTERVAL: float = 15.0  # Seconds between coalesced journal appends
+    JOURNAL_COMPACT_ENTRIES: int = 40  # Journal appends before rewriting the snapshot
+    EVENT_SNAPSHOT_EVERY: int = 256  # Logged actions between full-state records
+    EVENT_RETENTION: float = 30 * 86400.0  # Seconds of action history kept when compacting
+    EXPORT_CHUNK_SIZE: int = 65536  # Pets held in memory per chunk of a column file
+
+@dataclass
+class DebugSettings:
+    """Developer tooling settings."""
+    OVERLAY_KEY: str = "<F3>"  # Toggles the performance overlay
+    PROFILE_KEY: str = "<F4>"  # Profiles the mainloop for PROFILE_SECONDS
+    PROFILE_SECONDS: float = 10.0
+    PROFILE_DIR: str = "profiles"
+    OVERLAY_WINDOW: int = 120  # Frames and phase samples the overlay averages over
+    OVERLAY_REFRESH_MS: int = 500
 
 @dataclass
 class Settings:
@@ -45,6 +77,9 @@ class Settings:
     game: GameSettings = field(default_factory=GameSettings)
     pet: PetSettings = field(default_factory=PetSettings)
     ui: UISettings = field(default_factory=UISettings)
+    farm: FarmSettings = field(default_factory=FarmSettings)
+    save: SaveSettings = field(default_factory=SaveSettings)
+    debug: DebugSettings = field(default_factory=DebugSettings)
 
 # Create global settings instance
 settings = Settings() 
\ No newline at end of file
@@ -0,0 +1,26 @@
+from dataclasses import fields
+from .pet import Tamagotchi
+
+def _slotted_copy(cls: type, name: str) -> type:
+    """Rebuild a dataclass with ``__slots__`` instead of a per-instance ``__dict__``.
+
+    This mirrors ``dataclass(slots=True)``, which needs Python 3.10.
+    """
+    # profile stays a property over _profile; _rates holds the profile it resolves to
+    slots = tuple(
+        "_profile" if f.name == "profile" else f.name for f in fields(cls)
+    ) + ("_rates",)
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in slots and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = slots
+    namespace["__qualname__"] = name
+    namespace["__module__"] = __name__
+    namespace["__doc__"] = (
+        "A Tamagotchi stored in fixed slots instead of a per-instance __dict__."
+    )
+    return type(cls)(name, cls.__bases__, namespace)
+
+CompactTamagotchi = _slotted_copy(Tamagotchi, "CompactTamagotchi")
@@ -1,9 +1,33 @@
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any
-import time
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 import json
+import logging
+import math
 import os
-from ..config.settings import settings
+from ..clock import now
+from ..config.profiles import DEFAULT_PROFILE, profile_rates
+from ..config.settings import PetSettings
+from ..metrics import LOAD_SECONDS, PET_LOADS, PET_SAVE_ERRORS, PET_SAVES, SAVE_SECONDS
+from ..storage.atomic import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+def _time_to_cross(
+    value: float,
+    rate: float,
+    resolution: float,
+    thresholds: Tuple[float, ...]
+) -> float:
+    """Seconds until a stat changing at ``rate`` per second crosses a boundary."""
+    if rate < 0 and value > 0.0:
+        boundary = math.floor(value / resolution) * resolution
+        target = max([boundary, 0.0] + [t for t in thresholds if t < value])
+        return (value - target) / -rate
+    if rate > 0 and value < 100.0:
+        boundary = (math.floor(value / resolution) + 1) * resolution
+        target = min([boundary, 100.0] + [t for t in thresholds if t > value])
+        return (target - value) / rate
+    return math.inf
 
 @dataclass
 class Tamagotchi:
@@ -12,127 +36,152 @@ class Tamagotchi:
     hunger: float = field(default=100.0)  # Max stat is 100
     happiness: float = field(default=100.0)  # Max stat is 100
     energy: float = field(default=100.0)  # Max stat is 100
-    last_update: float = field(default_factory=time.time)
+    last_update: float = field(default_factory=now)
     age: int = field(default=0)
     is_sleeping: bool = field(default=False)
     is_alive: bool = field(default=True)
+    profile: str = field(default=DEFAULT_PROFILE)  # Species rates, see config.profiles
 
-    def save(self, save_dir: str = "saves") -> None:
-        """Save the pet's state to a file."""
-        try:
-            # Get absolute path to save directory
-            save_dir = os.path.abspath(save_dir)
-            print(f"Save directory: {save_dir}")
-            
-            # Ensure save directory exists
-            if not os.path.exists(save_dir):
-                print(f"Creating save directory: {save_dir}")
-                os.makedirs(save_dir, exist_ok=True)
-            
-            # Convert pet data to dictionary
-            pet_data = asdict(self)
-            
-            # Save to file
-            save_path = os.path.join(save_dir, f"{self.name.lower()}.json")
-            print(f"Saving to: {save_path}")
-            
-            # Ensure we have write permissions
-            if os.path.exists(save_path) and not os.access(save_path, os.W_OK):
-                print(f"Warning: No write permission for {save_path}")
-                return
-            
-            # Write the save file
-            with open(save_path, 'w') as f:
-                json.dump(pet_data, f)
-            print(f"Successfully saved pet to: {save_path}")
-            
-            # Verify the file was created
-            if os.path.exists(save_path):
-                print(f"Verified save file exists at: {save_path}")
+    def set_profile(self, profile: str) -> None:
+        """Switch the pet to another rate profile; same as assigning ``pet.profile``."""
+        self.profile = profile
+
+    @property
+    def rates(self) -> PetSettings:
+        """The PetSettings this pet's profile runs on."""
+        return self._rates
+
+    def save(self, save_dir: str = "saves", backend: Optional[Any] = None) -> None:
+        """Save the pet's state to a file, or to ``backend`` if one is given."""
+        with SAVE_SECONDS.time():
+            try:
+                if backend is not None:
+                    backend.save(self)
+                else:
+                    save_dir = os.path.abspath(save_dir)
+                    os.makedirs(save_dir, exist_ok=True)
+                    save_path = os.path.join(save_dir, f"{self.name.lower()}.json")
+                    # Write the save file atomically so a crash never truncates it
+                    atomic_write_json(save_path, asdict(self))
+                    logger.debug("Saved %s to %s", self.name, save_path)
+            except Exception:
+                PET_SAVE_ERRORS.inc()
+                logger.exception("Error saving %s to %s", self.name, save_dir)
+                raise  # Re-raise the exception to be handled by the caller
+        PET_SAVES.inc()
+
+    @classmethod
+    def load(
+        cls,
+        name: str,
+        save_dir: str = "saves",
+        backend: Optional[Any] = None
+    ) -> Optional['Tamagotchi']:
+        """Load a pet's state from a file, or from ``backend`` if one is given."""
+        with LOAD_SECONDS.time():
+            if backend is not None:
+                pet = backend.load(name)
             else:
-                print(f"Warning: Save file was not created at: {save_path}")
-            
-        except Exception as e:
-            print(f"Error saving pet: {str(e)}")
-            print(f"Current working directory: {os.getcwd()}")
-            print(f"Save directory: {save_dir}")
-            print(f"Save path: {save_path if 'save_path' in locals() else 'Not created'}")
-            raise  # Re-raise the exception to be handled by the caller
+                pet = cls._load_file(name, save_dir)
+        if pet is not None:
+            PET_LOADS.inc()
+        return pet
 
     @classmethod
-    def load(cls, name: str, save_dir: str = "saves") -> Optional['Tamagotchi']:
-        """Load a pet's state from a file."""
+    def _load_file(cls, name: str, save_dir: str) -> Optional['Tamagotchi']:
+        save_path = os.path.join(os.path.abspath(save_dir), f"{name.lower()}.json")
         try:
-            # Get absolute path to save directory
-            save_dir = os.path.abspath(save_dir)
-            print(f"Load directory: {save_dir}")
-            
-            save_path = os.path.join(save_dir, f"{name.lower()}.json")
-            print(f"Attempting to load from: {save_path}")
-            
-            if not os.path.exists(save_path):
-                print(f"No save file found at: {save_path}")
-                return None
-            
-            # Check read permissions
-            if not os.access(save_path, os.R_OK):
-                print(f"Warning: No read permission for {save_path}")
-                return None
-                
             with open(save_path, 'r') as f:
                 pet_data = json.load(f)
-            
-            print(f"Successfully loaded pet from: {save_path}")
-            return cls(**pet_data)
-            
-        except Exception as e:
-            print(f"Error loading pet: {str(e)}")
-            print(f"Current working directory: {os.getcwd()}")
-            print(f"Save directory: {save_dir}")
-            print(f"Save path: {save_path if 'save_path' in locals() else 'Not created'}")
+        except FileNotFoundError:
+            logger.debug("No save file found at %s", save_path)
+            return None
+        except Exception:
+            logger.exception("Error loading pet from %s", save_path)
+            return None
+        try:
+            pet = cls(**pet_data)
+        except (TypeError, ValueError):
+            logger.exception("Invalid pet data in %s", save_path)
             return None
+        logger.debug("Loaded %s from %s", pet.name, save_path)
+        return pet
 
-    def update(self) -> None:
+    def update(self, current_time: Optional[float] = None) -> None:
         """Update pet stats based on time passed."""
-        current_time = time.time()
-        time_passed = current_time - self.last_update
-        
+        if current_time is None:
+            current_time = now()
+        self.advance(current_time - self.last_update)
+        self.last_update = current_time
+
+    def advance(self, time_passed: float) -> None:
+        """Advance stats by ``time_passed`` seconds in closed form.
+
+        The gap is split at the moment a sleeping pet's energy reaches 100,
+        so one call over any gap matches many small ticks over the same gap.
+        """
+        rates = self._rates
         # Decrease stats over time
         self.hunger = max(
             0.0,  # Min stat is 0
-            self.hunger - time_passed * settings.pet.HUNGER_RATE
+            self.hunger - time_passed * rates.HUNGER_RATE
         )
         self.happiness = max(
             0.0,  # Min stat is 0
-            self.happiness - time_passed * settings.pet.HAPPINESS_RATE
+            self.happiness - time_passed * rates.HAPPINESS_RATE
         )
-        if self.is_sleeping:
-            self.energy = min(
-                100.0,
-                self.energy + time_passed * settings.pet.SLEEP_ENERGY_RECOVERY
-            )
-            # Wake up automatically if energy is full
-            if self.energy >= 100.0:
-                self.energy = 100.0
-                self.is_sleeping = False
-        else:
-            self.energy = max(
-                0.0,  # Min stat is 0
-                self.energy - time_passed * settings.pet.ENERGY_RATE
-            )
-        
+
         # Check if pet is still alive
         if self.hunger <= 0.0 or self.happiness <= 0.0:
             self.is_alive = False
-        
-        self.last_update = current_time
+
+        if self.is_sleeping:
+            recovery = rates.SLEEP_ENERGY_RECOVERY
+            time_to_wake = (100.0 - self.energy) / recovery if recovery > 0 else math.inf
+            if time_passed < time_to_wake:
+                self.energy = min(
+                    100.0,  # Max stat is 100
+                    self.energy + time_passed * recovery
+                )
+                return
+            # Wake up automatically once energy is full, then start draining
+            self.energy = 100.0
+            self.is_sleeping = False
+            time_passed -= time_to_wake
+
+        self.energy = max(
+            0.0,  # Min stat is 0
+            self.energy - time_passed * rates.ENERGY_RATE
+        )
+
+    def seconds_until_change(
+        self,
+        resolution: float = 1.0,
+        thresholds: Iterable[float] = ()
+    ) -> float:
+        """Return seconds until the next visible change, assuming no actions.
+
+        A change is a stat crossing a multiple of ``resolution`` or one of
+        ``thresholds``; waking up and dying fall out as crossings of 100 and 0.
+        """
+        thresholds = tuple(thresholds)
+        rates = self._rates
+        if self.is_sleeping:
+            energy_rate = rates.SLEEP_ENERGY_RECOVERY
+        else:
+            energy_rate = -rates.ENERGY_RATE
+        return min(
+            _time_to_cross(self.hunger, -rates.HUNGER_RATE, resolution, thresholds),
+            _time_to_cross(self.happiness, -rates.HAPPINESS_RATE, resolution, thresholds),
+            _time_to_cross(self.energy, energy_rate, resolution, thresholds),
+        )
 
     def feed(self) -> None:
         """Feed the pet to increase hunger."""
         if self.is_alive and not self.is_sleeping:
             self.hunger = min(
                 100.0,  # Max stat is 100
-                self.hunger + settings.pet.FEED_HUNGER_RECOVERY
+                self.hunger + self._rates.FEED_HUNGER_RECOVERY
             )
 
     def play(self) -> None:
@@ -140,11 +189,11 @@ class Tamagotchi:
         if self.is_alive and not self.is_sleeping:
             self.happiness = min(
                 100.0,  # Max stat is 100
-                self.happiness + settings.pet.PLAY_HAPPINESS_RECOVERY
+                self.happiness + self._rates.PLAY_HAPPINESS_RECOVERY
             )
             self.energy = max(
                 0.0,  # Min stat is 0
-                self.energy - settings.pet.PLAY_ENERGY_COST
+                self.energy - self._rates.PLAY_ENERGY_COST
             )
 
     def sleep(self) -> None:
@@ -154,5 +203,57 @@ class Tamagotchi:
             if self.is_sleeping:
                 self.energy = min(
                     100.0,  # Max stat is 100
-                    self.energy + settings.pet.SLEEP_ENERGY_RECOVERY
-                ) 
\ No newline at end of file
+                    self.energy + self._rates.SLEEP_ENERGY_RECOVERY
+                )
+
+    @staticmethod
+    def feed_many(pets: Iterable['Tamagotchi']) -> List[bool]:
+        """Feed every pet that is awake and alive; returns which were fed."""
+        accepted = []
+        for pet in pets:
+            ok = pet.is_alive and not pet.is_sleeping
+            if ok:
+                pet.feed()
+            accepted.append(ok)
+        return accepted
+
+    @staticmethod
+    def play_many(pets: Iterable['Tamagotchi']) -> List[bool]:
+        """Play with every pet that is awake, alive and has the energy for it.
+
+        Unlike play(), this applies the UI's energy check; returns which were played with.
+        """
+        accepted = []
+        for pet in pets:
+            ok = (pet.is_alive and not pet.is_sleeping
+                  and pet.energy >= pet.rates.PLAY_ENERGY_COST)
+            if ok:
+                pet.play()
+            accepted.append(ok)
+        return accepted
+
+    @staticmethod
+    def sleep_many(pets: Iterable['Tamagotchi']) -> List[bool]:
+        """Toggle sleep for every living pet; returns which were toggled."""
+        accepted = []
+        for pet in pets:
+            ok = pet.is_alive
+            if ok:
+                pet.sleep()
+            accepted.append(ok)
+        return accepted
+
+def _get_profile(pet: Tamagotchi) -> str:
+    return pet._profile  # pylint: disable=protected-access
+
+def _set_profile(pet: Tamagotchi, profile: str) -> None:
+    # Resolve the profile once so the hot paths read one record, not settings.pet
+    rates = profile_rates(profile)
+    pet._profile = profile  # pylint: disable=protected-access
+    pet._rates = rates  # pylint: disable=protected-access
+
+# Installed after @dataclass so the field keeps its default, while every assignment,
+# __init__'s included, re-resolves the rates
+Tamagotchi.profile = property(  # type: ignore[assignment]
+    _get_profile, _set_profile, doc="Name of the rate profile, see config.profiles."
+)
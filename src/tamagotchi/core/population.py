@@ -0,0 +1,394 @@
+from dataclasses import fields
+from types import SimpleNamespace
+from typing import Any, Iterable, Iterator, List, Optional
+import numpy as np
+from .pet import Tamagotchi
+from ..clock import now
+from ..config.profiles import DEFAULT_PROFILE, profile_rates
+from ..config.settings import PetSettings, settings
+
+# Column name -> dtype, in Tamagotchi field order (name is kept in a list)
+COLUMNS = {
+    "hunger": np.float64,
+    "happiness": np.float64,
+    "energy": np.float64,
+    "last_update": np.float64,
+    "age": np.int64,
+    "is_sleeping": np.bool_,
+    "is_alive": np.bool_,
+}
+
+# Per-pet coefficients updates and actions read, compiled from each pet's rate profile
+RATE_COLUMNS = tuple(field.name for field in fields(PetSettings))
+
+
+def advance_columns(
+    hunger: np.ndarray,
+    happiness: np.ndarray,
+    energy: np.ndarray,
+    last_update: np.ndarray,
+    is_sleeping: np.ndarray,
+    is_alive: np.ndarray,
+    current_time: float,
+    pet_settings: Optional[Any] = None,
+) -> None:
+    """Apply Tamagotchi.update() rules to whole columns in place.
+
+    ``pet_settings`` is a PetSettings or any object whose rate attributes are
+    per-pet arrays, such as PetPopulation.rates.
+    """
+    # pylint: disable=too-many-arguments
+    if pet_settings is None:
+        pet_settings = settings.pet
+    time_passed = current_time - last_update
+
+    # Decrease stats over time
+    np.maximum(0.0, hunger - time_passed * pet_settings.HUNGER_RATE, out=hunger)
+    np.maximum(0.0, happiness - time_passed * pet_settings.HAPPINESS_RATE, out=happiness)
+
+    # Sleeping pets recover energy until full, wake up, then drain for the rest
+    if is_sleeping.any():
+        recovery = pet_settings.SLEEP_ENERGY_RECOVERY
+        if np.ndim(recovery):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                time_to_wake = np.where(recovery > 0, (100.0 - energy) / recovery, np.inf)
+        elif recovery > 0:
+            time_to_wake = (100.0 - energy) / recovery
+        else:
+            time_to_wake = np.full_like(energy, np.inf)
+        wakes = is_sleeping & (time_passed >= time_to_wake)
+        still_sleeping = is_sleeping & ~wakes
+        draining_from = np.where(wakes, 100.0, energy)
+        draining_for = np.where(wakes, time_passed - time_to_wake, time_passed)
+        np.copyto(
+            energy,
+            np.where(
+                still_sleeping,
+                np.minimum(100.0, energy + time_passed * recovery),
+                np.maximum(0.0, draining_from - draining_for * pet_settings.ENERGY_RATE),
+            ),
+        )
+        is_sleeping &= ~wakes
+    else:
+        np.maximum(0.0, energy - time_passed * pet_settings.ENERGY_RATE, out=energy)
+
+    # Check if pets are still alive
+    is_alive &= (hunger > 0.0) & (happiness > 0.0)
+
+    last_update[...] = current_time
+
+
+class PetView(Tamagotchi):
+    """A Tamagotchi whose fields read and write one row of a PetPopulation."""
+
+    # pylint: disable=super-init-not-called,invalid-overridden-method
+    def __init__(self, population: 'PetPopulation', index: int) -> None:
+        object.__setattr__(self, "_population", population)
+        object.__setattr__(self, "_index", index)
+
+    @property
+    def name(self) -> str:
+        return self._population.names[self._index]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._population.names[self._index] = value
+
+    @property
+    def profile(self) -> str:
+        return self._population.profiles[self._index]
+
+    @profile.setter
+    def profile(self, value: str) -> None:
+        self._population.set_profile(self._index, value)
+
+    @property
+    def _rates(self) -> PetSettings:
+        return profile_rates(self.profile)
+
+
+def _column_property(column: str, cast: type) -> property:
+    def getter(self: PetView):
+        return cast(getattr(self._population, column)[self._index])
+
+    def setter(self: PetView, value) -> None:
+        getattr(self._population, column)[self._index] = value
+
+    return property(getter, setter)
+
+
+for _column, _dtype in COLUMNS.items():
+    _cast = {np.float64: float, np.int64: int, np.bool_: bool}[_dtype]
+    setattr(PetView, _column, _column_property(_column, _cast))
+
+
+class PetPopulation:
+    """Column-oriented store of many pets, updated as batched array operations."""
+
+    def __init__(self, capacity: int = 0) -> None:
+        """Create an empty population with room for ``capacity`` pets."""
+        self.names: List[str] = []
+        self.profiles: List[str] = []
+        # The profile every pet has, if they all share one; None if mixed or unknown
+        self._shared_profile: Optional[str] = None
+        self._size = 0
+        self._fixed = False
+        self._data = {
+            column: np.zeros(capacity, dtype=dtype)
+            for column, dtype in COLUMNS.items()
+        }
+        self._rates = {column: np.zeros(capacity) for column in RATE_COLUMNS}
+
+    @classmethod
+    def from_pets(cls, pets: Iterable[Tamagotchi]) -> 'PetPopulation':
+        """Build a population from existing pets."""
+        population = cls()
+        population.extend(pets)
+        return population
+
+    @classmethod
+    def from_columns(
+        cls,
+        names: List[str],
+        profiles: Optional[List[str]] = None,
+        **columns: np.ndarray
+    ) -> 'PetPopulation':
+        """Build a population from whole columns, e.g. read back from disk."""
+        population = cls(len(names))
+        population._size = len(names)
+        population.names = list(names)
+        for column in COLUMNS:
+            population._data[column][:] = columns[column]
+        population._compile_rates(0, profiles or [DEFAULT_PROFILE] * len(names))
+        return population
+
+    @staticmethod
+    def buffer_size(capacity: int) -> int:
+        """Return the bytes from_buffer() needs for ``capacity`` pets."""
+        per_pet = sum(np.dtype(dtype).itemsize for dtype in COLUMNS.values())
+        return (per_pet + 8 * len(RATE_COLUMNS)) * capacity
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: Any,
+        capacity: int,
+        size: int = 0,
+        names: Optional[List[str]] = None,
+        profiles: Optional[List[str]] = None,
+    ) -> 'PetPopulation':
+        """Build a fixed-capacity population whose columns live in ``buffer``.
+
+        The columns are laid out one after another, widest dtype first, so
+        several processes can map the same buffer (e.g. shared memory).
+        """
+        population = cls()
+        offset = 0
+        for column in RATE_COLUMNS:
+            population._rates[column] = np.ndarray(
+                capacity, dtype=np.float64, buffer=buffer, offset=offset
+            )
+            offset += 8 * capacity
+        for column, dtype in COLUMNS.items():
+            population._data[column] = np.ndarray(
+                capacity, dtype=dtype, buffer=buffer, offset=offset
+            )
+            offset += np.dtype(dtype).itemsize * capacity
+        population._size = size
+        population._fixed = True
+        population.names = list(names) if names is not None else []
+        population.profiles = list(profiles) if profiles is not None else []
+        return population
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> PetView:
+        return self.pet(index)
+
+    def __iter__(self) -> Iterator[PetView]:
+        return (PetView(self, index) for index in range(self._size))
+
+    def __getattr__(self, column: str) -> np.ndarray:
+        # Expose each column as a view trimmed to the live pets
+        if column in COLUMNS:
+            return self._data[column][:self._size]
+        raise AttributeError(column)
+
+    def _pet_settings(self, pet_settings: Optional[PetSettings]) -> Any:
+        # One shared profile runs on its scalar rates, which costs far less than per-pet columns
+        if pet_settings is not None:
+            return pet_settings
+        if self._shared_profile is not None:
+            return profile_rates(self._shared_profile)
+        return self.rates
+
+    @property
+    def rates(self) -> SimpleNamespace:
+        """The per-pet rate columns, readable like a PetSettings."""
+        return SimpleNamespace(**{
+            column: values[:self._size] for column, values in self._rates.items()
+        })
+
+    def _compile_rates(self, start: int, profiles: List[str]) -> None:
+        # Resolve each distinct profile once, then gather its pets' coefficients
+        if not profiles:
+            return
+        distinct = {profile: code for code, profile in enumerate(set(profiles))}
+        covers_all = start == 0 and len(profiles) >= self._size
+        if len(distinct) == 1 and (covers_all or profiles[0] == self._shared_profile):
+            self._shared_profile = profiles[0]
+        else:
+            self._shared_profile = None
+        codes = np.array([distinct[profile] for profile in profiles], dtype=np.intp)
+        self.profiles[start:start + len(profiles)] = profiles
+        for column, values in self._rates.items():
+            table = np.array([getattr(profile_rates(profile), column) for profile in distinct])
+            values[start:start + len(profiles)] = table[codes]
+
+    def set_profile(self, index: int, profile: str) -> None:
+        """Switch one pet to another rate profile."""
+        self._compile_rates(index % self._size, [profile])
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._data["hunger"])
+        if size <= capacity:
+            return
+        if self._fixed:
+            raise ValueError("buffer-backed population is full")
+        capacity = max(size, capacity * 2, 16)
+        for columns in (self._data, self._rates):
+            for column, values in columns.items():
+                grown = np.zeros(capacity, dtype=values.dtype)
+                grown[:self._size] = values[:self._size]
+                columns[column] = grown
+
+    def add(self, pet: Tamagotchi) -> int:
+        """Append a pet and return its index."""
+        self._reserve(self._size + 1)
+        index = self._size
+        self._size += 1
+        self.names.append(pet.name)
+        for column in COLUMNS:
+            self._data[column][index] = getattr(pet, column)
+        self._compile_rates(index, [pet.profile])
+        return index
+
+    def extend(self, pets: Iterable[Tamagotchi]) -> None:
+        """Append many pets."""
+        pets = list(pets)
+        start = self._size
+        self._reserve(start + len(pets))
+        self._size += len(pets)
+        self.names.extend(pet.name for pet in pets)
+        for column in COLUMNS:
+            self._data[column][start:self._size] = [getattr(pet, column) for pet in pets]
+        self._compile_rates(start, [pet.profile for pet in pets])
+
+    def pet(self, index: int) -> PetView:
+        """Return a Tamagotchi view of the pet at ``index``."""
+        if not -self._size <= index < self._size:
+            raise IndexError("pet index out of range")
+        return PetView(self, index % self._size)
+
+    def to_pets(self) -> List[Tamagotchi]:
+        """Copy every pet out into standalone Tamagotchi instances."""
+        columns = [getattr(self, column).tolist() for column in COLUMNS]
+        return [
+            Tamagotchi(name, *values, profile=profile)
+            for name, profile, *values in zip(self.names, self.profiles, *columns)
+        ]
+
+    def update(
+        self,
+        current_time: Optional[float] = None,
+        pet_settings: Optional[PetSettings] = None,
+    ) -> None:
+        """Update every pet's stats based on time passed.
+
+        Each pet decays at its own profile's rates; ``pet_settings`` overrides
+        them all, e.g. when tuning rates offline.
+        """
+        if current_time is None:
+            current_time = now()
+        advance_columns(
+            self.hunger,
+            self.happiness,
+            self.energy,
+            self.last_update,
+            self.is_sleeping,
+            self.is_alive,
+            current_time,
+            self._pet_settings(pet_settings),
+        )
+
+    def _targets(self, mask: Optional[np.ndarray]) -> np.ndarray:
+        if mask is None:
+            return np.ones(self._size, dtype=bool)
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (self._size,):
+            raise ValueError(f"mask has shape {mask.shape}, expected ({self._size},)")
+        return mask
+
+    @staticmethod
+    def _amount(value: Any, accepted: np.ndarray) -> Any:
+        # Per-pet columns are narrowed to the accepted pets; a PetSettings value is shared
+        return value[accepted] if np.ndim(value) else value
+
+    def feed(
+        self,
+        mask: Optional[np.ndarray] = None,
+        pet_settings: Optional[PetSettings] = None,
+    ) -> np.ndarray:
+        """Feed every pet in ``mask`` (default: all) that is awake and alive.
+
+        Returns the accepted pets as a boolean array.
+        """
+        rates = self._pet_settings(pet_settings)
+        accepted = self._targets(mask) & self.is_alive & ~self.is_sleeping
+        self.hunger[accepted] = np.minimum(
+            100.0, self.hunger[accepted] + self._amount(rates.FEED_HUNGER_RECOVERY, accepted)
+        )
+        return accepted
+
+    def play(
+        self,
+        mask: Optional[np.ndarray] = None,
+        pet_settings: Optional[PetSettings] = None,
+    ) -> np.ndarray:
+        """Play with every pet in ``mask`` that is awake, alive and has the energy for it.
+
+        Returns the accepted pets as a boolean array.
+        """
+        rates = self._pet_settings(pet_settings)
+        accepted = (
+            self._targets(mask) & self.is_alive & ~self.is_sleeping
+            & (self.energy >= rates.PLAY_ENERGY_COST)
+        )
+        self.happiness[accepted] = np.minimum(
+            100.0,
+            self.happiness[accepted] + self._amount(rates.PLAY_HAPPINESS_RECOVERY, accepted)
+        )
+        self.energy[accepted] = np.maximum(
+            0.0, self.energy[accepted] - self._amount(rates.PLAY_ENERGY_COST, accepted)
+        )
+        return accepted
+
+    def sleep(
+        self,
+        mask: Optional[np.ndarray] = None,
+        pet_settings: Optional[PetSettings] = None,
+    ) -> np.ndarray:
+        """Toggle sleep for every living pet in ``mask``, restoring energy as they fall asleep.
+
+        Returns the accepted pets as a boolean array.
+        """
+        rates = self._pet_settings(pet_settings)
+        accepted = self._targets(mask) & self.is_alive
+        self.is_sleeping[accepted] = ~self.is_sleeping[accepted]
+        fell_asleep = accepted & self.is_sleeping
+        self.energy[fell_asleep] = np.minimum(
+            100.0,
+            self.energy[fell_asleep] + self._amount(rates.SLEEP_ENERGY_RECOVERY, fell_asleep)
+        )
+        return accepted
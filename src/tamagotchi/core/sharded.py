@@ -0,0 +1,141 @@
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Dict, Iterable, List, Optional, Tuple
+import multiprocessing
+import os
+import zlib
+from .pet import Tamagotchi
+from .population import PetPopulation
+from ..clock import now
+from ..config.settings import PetSettings
+
+def shard_of(name: str, shards: int) -> int:
+    """Return the shard a pet lives on; stable across processes and runs."""
+    return zlib.crc32(name.lower().encode()) % shards
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block the coordinator owns.
+
+    Workers share the coordinator's resource tracker, which already knows
+    the block, so attaching here must not unregister or unlink it.
+    """
+    return shared_memory.SharedMemory(name=name)
+
+def _worker(block_name: str, capacity: int, size: int, conn: Connection) -> None:
+    """Tick one shard in place whenever the coordinator asks."""
+    block = _attach(block_name)
+    population = PetPopulation.from_buffer(block.buf, capacity, size)
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            current_time, pet_settings = message
+            population.update(current_time, pet_settings)
+            conn.send(True)
+    finally:
+        # Drop the numpy views before closing the mapping
+        del population
+        block.close()
+
+class ShardedPopulation:
+    """A pet population split by name hash across worker processes.
+
+    Each shard's columns live in a ``multiprocessing.shared_memory`` block:
+    workers tick them in place and the coordinator reads them directly, so
+    no pet state is pickled. update() is a barrier; it returns only after
+    every shard has advanced to the same ``last_update``.
+    """
+
+    def __init__(self, pets: Iterable[Tamagotchi], workers: Optional[int] = None) -> None:
+        """Shard ``pets`` across ``workers`` processes (default: one per CPU)."""
+        workers = workers or os.cpu_count() or 1
+        buckets: List[List[Tamagotchi]] = [[] for _ in range(workers)]
+        for pet in pets:
+            buckets[shard_of(pet.name, workers)].append(pet)
+
+        self.shards: List[PetPopulation] = []
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._connections: List[Connection] = []
+        self._processes: List[multiprocessing.Process] = []
+        try:
+            for shard, bucket in enumerate(buckets):
+                capacity = max(len(bucket), 1)
+                block = shared_memory.SharedMemory(
+                    create=True, size=PetPopulation.buffer_size(capacity)
+                )
+                self._blocks.append(block)
+                population = PetPopulation.from_buffer(block.buf, capacity)
+                population.extend(bucket)
+                self.shards.append(population)
+                for index, pet in enumerate(bucket):
+                    self._index[pet.name.lower()] = (shard, index)
+
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_worker,
+                    args=(block.name, capacity, len(bucket), child),
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                self._connections.append(parent)
+                self._processes.append(process)
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def __enter__(self) -> 'ShardedPopulation':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def update(
+        self,
+        current_time: Optional[float] = None,
+        pet_settings: Optional[PetSettings] = None,
+    ) -> None:
+        """Advance every shard to ``current_time`` and wait for all of them.
+
+        ``pet_settings`` overrides every pet's profile rates, as in PetPopulation.update().
+        """
+        if current_time is None:
+            current_time = now()
+        # Without an override, workers read each pet's compiled rate columns
+        for conn in self._connections:
+            conn.send((current_time, pet_settings))
+        for conn in self._connections:
+            conn.recv()
+
+    def pet(self, name: str) -> Tamagotchi:
+        """Return a live view of a pet, reading its shard's shared columns."""
+        shard, index = self._index[name.lower()]
+        return self.shards[shard].pet(index)
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        for conn in self._connections:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        # The shard views must go before their mappings can close
+        self.shards = []
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass  # A caller still holds a view; the mapping goes with it
+            block.unlink()
+        self._connections = []
+        self._processes = []
+        self._blocks = []
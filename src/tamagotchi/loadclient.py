@@ -0,0 +1,86 @@
+"""Load generator for the pet server, reporting command latency percentiles.
+
+    python -m src.tamagotchi.loadclient --port 8765 --clients 2000 --requests 50
+"""
+from typing import List, Optional
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+OPS = ("get", "feed", "play", "sleep")
+
+async def _client(args: argparse.Namespace, index: int, latencies: List[float],
+                  errors: List[str]) -> None:
+    rng = random.Random(index)
+    try:
+        if args.unix:
+            reader, writer = await asyncio.open_unix_connection(args.unix)
+        else:
+            reader, writer = await asyncio.open_connection(args.host, args.port)
+    except OSError as e:
+        errors.append(str(e))
+        return
+    try:
+        for request_id in range(args.requests):
+            command = {
+                "id": request_id,
+                "op": rng.choice(OPS),
+                "name": f"Pet{rng.randrange(args.pets)}",
+            }
+            started = time.perf_counter()
+            writer.write(json.dumps(command).encode() + b"\n")
+            # Skip subscription pushes until our reply arrives
+            while True:
+                reply = json.loads(await reader.readline())
+                if reply.get("id") == request_id:
+                    break
+            latencies.append(time.perf_counter() - started)
+    except (OSError, ValueError) as e:
+        errors.append(str(e))
+    finally:
+        writer.close()
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return float("nan")
+    rank = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+async def _run(args: argparse.Namespace) -> int:
+    latencies: List[float] = []
+    errors: List[str] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _client(args, index, latencies, errors) for index in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    print(f"{len(latencies)} commands from {args.clients} clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} commands/s)")
+    print(f"p50={percentile(latencies, 0.50) * 1e3:.2f}ms "
+          f"p99={percentile(latencies, 0.99) * 1e3:.2f}ms "
+          f"max={(latencies[-1] if latencies else float('nan')) * 1e3:.2f}ms")
+    if errors:
+        print(f"{len(errors)} clients failed, e.g. {errors[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Measure pet server command latency")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="connect to a Unix socket instead")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=50, help="commands per client")
+    parser.add_argument("--pets", type=int, default=1000,
+                        help="commands target Pet0..PetN-1, as created by server --pets")
+    args = parser.parse_args(argv)
+    return asyncio.run(_run(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
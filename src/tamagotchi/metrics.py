@@ -0,0 +1,205 @@
+"""Counters and latency histograms for the game's hot paths.
+
+Instrumentation is off unless ``TAMAGOTCHI_METRICS`` is set in the
+environment or ``metrics.enable()`` is called; while it is off, recording
+costs one attribute check. Snapshots are available on demand as a dict,
+JSON or Prometheus text:
+
+    from src.tamagotchi.metrics import metrics
+    metrics.enable()
+    ...
+    print(metrics.to_prometheus())
+"""
+from typing import Any, Dict, Iterator, Optional, Sequence
+import bisect
+import contextlib
+import json
+import math
+import os
+import time
+
+# Upper bounds in seconds, from sub-millisecond ticks to a stalled event loop
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+class Counter:
+    """A monotonically increasing count."""
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str) -> None:
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Add ``amount`` if metrics are enabled."""
+        if self._registry.enabled:
+            self.value += amount
+
+class Histogram:
+    """Observed durations in fixed buckets, plus their count and sum."""
+
+    def __init__(
+        self,
+        registry: 'MetricsRegistry',
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # The last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration if metrics are enabled."""
+        if self._registry.enabled:
+            self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self.count += 1
+            self.sum += seconds
+
+    @contextlib.contextmanager
+    def _timer(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def time(self) -> Any:
+        """Context manager that observes the duration of its block."""
+        if not self._registry.enabled:
+            return _NOT_TIMED
+        return self._timer()
+
+    def cumulative(self) -> Dict[str, int]:
+        """Return Prometheus-style ``{upper bound: observations at or below it}``."""
+        total = 0
+        result = {}
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            result["+Inf" if math.isinf(bound) else repr(bound)] = total
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile as the upper bound of its bucket."""
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return math.inf
+
+_NOT_TIMED = contextlib.nullcontext()
+
+class MetricsRegistry:
+    """Owns every counter and histogram and renders snapshots of them."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def enable(self) -> None:
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; values recorded so far are kept."""
+        self.enabled = False
+
+    def counter(self, name: str, documentation: str = "") -> Counter:
+        """Return the counter called ``name``, creating it if needed."""
+        if name not in self._counters:
+            self._counters[name] = Counter(self, name, documentation)
+        return self._counters[name]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str = "",
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Return the histogram called ``name``, creating it if needed."""
+        if name not in self._histograms:
+            self._histograms[name] = Histogram(self, name, documentation, buckets)
+        return self._histograms[name]
+
+    def reset(self) -> None:
+        """Zero every metric."""
+        for counter in self._counters.values():
+            counter.value = 0
+        for histogram in self._histograms.values():
+            histogram.counts = [0] * len(histogram.counts)
+            histogram.count = 0
+            histogram.sum = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return every metric as plain data."""
+        return {
+            "counters": {name: c.value for name, c in sorted(self._counters.items())},
+            "histograms": {
+                name: {
+                    "count": h.count,
+                    "sum": h.sum,
+                    "p50": h.quantile(0.5) if h.count else None,
+                    "p99": h.quantile(0.99) if h.count else None,
+                    "buckets": h.cumulative(),
+                }
+                for name, h in sorted(self._histograms.items())
+            },
+        }
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Render a snapshot as JSON."""
+        # Infinite quantiles are not valid JSON
+        snapshot = self.snapshot()
+        for histogram in snapshot["histograms"].values():
+            for key in ("p50", "p99"):
+                if histogram[key] is not None and math.isinf(histogram[key]):
+                    histogram[key] = "+Inf"
+        return json.dumps(snapshot, indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Render a snapshot in the Prometheus text exposition format."""
+        lines = []
+        for name, counter in sorted(self._counters.items()):
+            lines.append(f"# HELP {name} {counter.documentation}")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {counter.value}")
+        for name, histogram in sorted(self._histograms.items()):
+            lines.append(f"# HELP {name} {histogram.documentation}")
+            lines.append(f"# TYPE {name} histogram")
+            for bound, total in histogram.cumulative().items():
+                lines.append(f'{name}_bucket{{le="{bound}"}} {total}')
+            lines.append(f"{name}_sum {histogram.sum!r}")
+            lines.append(f"{name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """Write a snapshot to ``path``: JSON for ``*.json``, Prometheus text otherwise."""
+        text = self.to_json(indent=2) if path.endswith(".json") else self.to_prometheus()
+        with open(path, 'w') as f:
+            f.write(text)
+
+# Process-wide registry the game and model record into
+metrics = MetricsRegistry(enabled=bool(os.environ.get("TAMAGOTCHI_METRICS")))
+
+PET_SAVES = metrics.counter("tamagotchi_pet_saves_total", "Pet states written")
+PET_SAVE_ERRORS = metrics.counter("tamagotchi_pet_save_errors_total", "Pet writes that failed")
+PET_LOADS = metrics.counter("tamagotchi_pet_loads_total", "Pet states read")
+SAVE_SECONDS = metrics.histogram("tamagotchi_save_seconds", "Time to write one pet")
+LOAD_SECONDS = metrics.histogram("tamagotchi_load_seconds", "Time to read one pet")
+TICK_SECONDS = metrics.histogram("tamagotchi_tick_seconds", "Model update and save per game tick")
+RENDER_SECONDS = metrics.histogram("tamagotchi_render_seconds", "Widget updates per game tick")
+AFTER_LAG_SECONDS = metrics.histogram(
+    "tamagotchi_after_lag_seconds", "How late Tk ran an after() callback"
+)
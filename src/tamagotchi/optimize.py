@@ -0,0 +1,474 @@
+"""Search care schedules for the fewest interactions that keep pets alive and happy.
+
+Run with ``python -m src.tamagotchi.optimize --policies 10000 --days 30``.
+
+A Schedule visits a pet every ``every`` seconds and cares for it like a
+ThresholdPolicy. All candidates are simulated at once as one pet each in
+column arrays, stepping every pet to its own next visit per iteration. A
+schedule is deterministic, so once a pet's state after a visit matches the
+one saved after visit 1, 2, 4, 8, ... the remaining whole cycles are added
+arithmetically instead of simulated. Pets that die or finish are compacted
+away, and the last few are finished in plain floats. Outcomes are cached per
+settings, schedule and duration.
+"""
+from dataclasses import astuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import numpy as np
+from .core.population import advance_columns
+from .config.settings import PetSettings, settings
+from .sim import SECONDS_PER_DAY, ThresholdPolicy, _parse_overrides
+from .storage.atomic import atomic_write_json
+
+class Schedule(NamedTuple):
+    """A care policy to search over: visit every ``every`` seconds and top up low stats."""
+    every: float
+    feed_below: float
+    play_below: float
+    sleep_below: float
+
+    def policy(self) -> ThresholdPolicy:
+        """The ThresholdPolicy to run this schedule in the simulator, with step=every."""
+        return ThresholdPolicy(self.feed_below, self.play_below, self.sleep_below)
+
+class Outcome(NamedTuple):
+    """How one fresh pet fared under a schedule."""
+    schedule: Schedule
+    duration: float
+    actions: int  # Accepted actions over the whole run
+    survival: float  # Seconds alive, at most ``duration``
+    happiness: float  # Mean happiness found on the visits it was alive for
+
+    @property
+    def actions_per_day(self) -> float:
+        """Accepted actions per simulated day."""
+        return self.actions * SECONDS_PER_DAY / self.duration
+
+    @property
+    def survived(self) -> bool:
+        """Whether the pet lived to the end of the run."""
+        return self.survival >= self.duration
+
+class ResultCache:
+    """Simulated outcomes by settings, schedule and duration, optionally kept in a JSON file."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Start empty, or from ``path`` if it exists; save() writes back to it."""
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._results: Dict[str, Tuple[int, float, float]] = {}
+        if path is not None and os.path.exists(path):
+            with open(path, 'r') as f:
+                self._results = {key: tuple(value) for key, value in json.load(f).items()}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @staticmethod
+    def key(pet_settings: PetSettings, schedule: Schedule, duration: float) -> str:
+        """The cache key for one evaluation."""
+        return json.dumps([astuple(pet_settings), list(schedule), duration])
+
+    def get(self, key: str) -> Optional[Tuple[int, float, float]]:
+        """Return ``(actions, survival, happiness)`` for ``key``, or None."""
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, result: Tuple[int, float, float]) -> None:
+        """Remember one evaluation."""
+        self._results[key] = result
+
+    def save(self) -> None:
+        """Write the cache to its file, atomically."""
+        if self.path is not None:
+            atomic_write_json(self.path, self._results)
+
+CACHE = ResultCache()
+
+# Stats this close after a visit count as a repeat; rounding keeps exact repeats rare
+REPEAT_TOLERANCE = 1e-7
+# Once this few pets are left, numpy call overhead outweighs the work per visit
+SCALAR_PETS = 32
+
+def _time_to_empty(value: float, rate: float) -> float:
+    return value / rate if rate else math.inf
+
+def _finish(
+    pet: Dict[str, Any], saved: int, duration: float, rates: PetSettings
+) -> Tuple[int, float, float]:
+    """Run one pet's remaining visits in plain floats, step for step as simulate() does."""
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    every, visit = pet["every"], pet["visit"]
+    hunger, happiness, energy = pet["hunger"], pet["happiness"], pet["energy"]
+    last_update, sleeping = pet["last_update"], pet["is_sleeping"]
+    actions, happiness_sum = pet["actions"], pet["happiness_sum"]
+    searching = saved == 0 or not math.isnan(pet["saved_hunger"][0])
+    checkpoints = [
+        tuple(pet["saved_" + column][j] for column in
+              ("hunger", "happiness", "energy", "sleeping", "actions", "happiness_sum"))
+        for j in range(saved if searching else 0)
+    ]
+
+    while visit < pet["last_visit"]:
+        visit += 1
+        now = min(visit * every, duration)
+        time_passed = now - last_update
+        hunger_before, happiness_before = hunger, happiness
+        hunger = max(0.0, hunger - time_passed * rates.HUNGER_RATE)
+        happiness = max(0.0, happiness - time_passed * rates.HAPPINESS_RATE)
+        if not sleeping:
+            energy = max(0.0, energy - time_passed * rates.ENERGY_RATE)
+        else:
+            time_to_wake = _time_to_empty(100.0 - energy, rates.SLEEP_ENERGY_RECOVERY)
+            if time_passed >= time_to_wake:
+                energy = max(0.0, 100.0 - (time_passed - time_to_wake) * rates.ENERGY_RATE)
+                sleeping = False
+            else:
+                energy = min(100.0, energy + time_passed * rates.SLEEP_ENERGY_RECOVERY)
+        if not (hunger > 0.0 and happiness > 0.0):
+            survival = last_update + min(
+                _time_to_empty(hunger_before, rates.HUNGER_RATE),
+                _time_to_empty(happiness_before, rates.HAPPINESS_RATE),
+            )
+            return actions, survival, happiness_sum / max(visit - 1, 1)
+        last_update = now
+        happiness_sum += happiness
+
+        if not sleeping:
+            if hunger < pet["feed_below"]:
+                hunger = min(hunger + rates.FEED_HUNGER_RECOVERY, 100.0)
+                actions += 1
+            if happiness < pet["play_below"] and energy >= rates.PLAY_ENERGY_COST:
+                happiness = min(happiness + rates.PLAY_HAPPINESS_RECOVERY, 100.0)
+                energy = max(energy - rates.PLAY_ENERGY_COST, 0.0)
+                actions += 1
+            if energy < pet["sleep_below"]:
+                sleeping = True
+                energy = min(energy + rates.SLEEP_ENERGY_RECOVERY, 100.0)
+                actions += 1
+
+        if not searching:
+            continue
+        for checkpoint in range(len(checkpoints) - 1, -1, -1):
+            old = checkpoints[checkpoint]
+            if (abs(old[0] - hunger) <= REPEAT_TOLERANCE and old[3] == sleeping
+                    and abs(old[1] - happiness) <= REPEAT_TOLERANCE
+                    and abs(old[2] - energy) <= REPEAT_TOLERANCE):
+                period = visit - (1 << checkpoint)
+                cycles = max(pet["whole_visits"] - visit, 0) // period
+                visit += cycles * period
+                actions += cycles * (actions - old[4])
+                happiness_sum += cycles * (happiness_sum - old[5])
+                last_update = min(visit * every, duration)
+                searching = False
+                break
+        if searching and visit == 1 << len(checkpoints):
+            checkpoints.append((hunger, happiness, energy, sleeping, actions, happiness_sum))
+    return actions, duration, happiness_sum / max(visit, 1)
+
+def simulate(
+    schedules: Sequence[Schedule],
+    duration: float,
+    pet_settings: Optional[PetSettings] = None,
+) -> List[Tuple[int, float, float]]:
+    """Run one fresh pet per schedule for ``duration`` seconds, without the cache.
+
+    Visits land at ``min(k * every, duration)`` like Simulation steps, so a
+    schedule's result matches Simulation.with_new_pets(1, schedule.policy(),
+    step=schedule.every). Returns ``(actions, survival, happiness)`` per schedule.
+    """
+    # pylint: disable=too-many-locals,too-many-statements
+    rates = settings.pet if pet_settings is None else pet_settings
+    count = len(schedules)
+    table = np.array(schedules, dtype=float).reshape(count, len(Schedule._fields))
+    actions_out = np.zeros(count, dtype=np.int64)
+    survival_out = np.full(count, float(duration))
+    happiness_out = np.zeros(count)
+
+    every = table[:, 0]
+    last_visit = np.ceil(duration / every).astype(np.int64)
+    # Checkpoints are taken after visits 1, 2, 4, 8, ...
+    checkpoints = int(last_visit.max()).bit_length() if count else 0
+    # One row per pet still running; finished rows are compacted away
+    pets = {
+        "row": np.arange(count),
+        "every": every,
+        "feed_below": table[:, 1],
+        "play_below": table[:, 2],
+        "sleep_below": table[:, 3],
+        "last_visit": last_visit,
+        # Cycles may only be skipped over whole intervals, not the short last one
+        "whole_visits": np.floor(duration / every).astype(np.int64),
+        "hunger": np.full(count, 100.0),
+        "happiness": np.full(count, 100.0),
+        "energy": np.full(count, 100.0),
+        "last_update": np.zeros(count),
+        "is_sleeping": np.zeros(count, dtype=bool),
+        "is_alive": np.ones(count, dtype=bool),
+        "visit": np.zeros(count, dtype=np.int64),
+        "actions": np.zeros(count, dtype=np.int64),
+        "happiness_sum": np.zeros(count),
+        # State and totals at each checkpoint; NaN hunger once a pet's cycle is found
+        "saved_hunger": np.full((count, checkpoints), np.nan),
+        "saved_happiness": np.zeros((count, checkpoints)),
+        "saved_energy": np.zeros((count, checkpoints)),
+        "saved_sleeping": np.zeros((count, checkpoints), dtype=bool),
+        "saved_actions": np.zeros((count, checkpoints), dtype=np.int64),
+        "saved_happiness_sum": np.zeros((count, checkpoints)),
+    }
+    saved = 0
+    iteration = 0
+
+    while len(pets["row"]) > SCALAR_PETS:
+        hunger, happiness, energy = pets["hunger"], pets["happiness"], pets["energy"]
+        sleeping, alive, visit = pets["is_sleeping"], pets["is_alive"], pets["visit"]
+        iteration += 1
+        visit += 1
+        hunger_before, happiness_before = hunger.copy(), happiness.copy()
+        time_before = pets["last_update"].copy()
+        advance_columns(
+            hunger, happiness, energy, pets["last_update"], sleeping, alive,
+            np.minimum(visit * pets["every"], duration), rates,
+        )
+        died = ~alive
+        if died.any():
+            # Pets die the moment hunger or happiness hits zero, as in Simulation
+            with np.errstate(divide='ignore'):
+                survival_out[pets["row"][died]] = time_before[died] + np.minimum(
+                    hunger_before[died] / rates.HUNGER_RATE,
+                    happiness_before[died] / rates.HAPPINESS_RATE,
+                )
+        pets["happiness_sum"] += happiness * alive
+
+        # Care as ThresholdPolicy and PetPopulation do: feed, play, then put the tired to bed
+        awake = alive & ~sleeping
+        fed = awake & (hunger < pets["feed_below"])
+        np.minimum(hunger + rates.FEED_HUNGER_RECOVERY, 100.0, out=hunger, where=fed)
+        played = awake & (happiness < pets["play_below"]) & (energy >= rates.PLAY_ENERGY_COST)
+        np.minimum(happiness + rates.PLAY_HAPPINESS_RECOVERY, 100.0, out=happiness, where=played)
+        np.maximum(energy - rates.PLAY_ENERGY_COST, 0.0, out=energy, where=played)
+        tired = awake & (energy < pets["sleep_below"])
+        sleeping |= tired
+        np.minimum(energy + rates.SLEEP_ENERGY_RECOVERY, 100.0, out=energy, where=tired)
+        actions = pets["actions"]
+        actions += fed
+        actions += played
+        actions += tired
+
+        if saved:
+            # A pet back in a checkpoint's state repeats everything since, forever
+            close = np.abs(pets["saved_hunger"][:, :saved] - hunger[:, None]) <= REPEAT_TOLERANCE
+            candidates = np.flatnonzero(close.any(axis=1))
+            if len(candidates):
+                same = (
+                    close[candidates]
+                    & alive[candidates, None]
+                    & (pets["saved_sleeping"][candidates, :saved] == sleeping[candidates, None])
+                    & (np.abs(pets["saved_happiness"][candidates, :saved]
+                              - happiness[candidates, None]) <= REPEAT_TOLERANCE)
+                    & (np.abs(pets["saved_energy"][candidates, :saved]
+                              - energy[candidates, None]) <= REPEAT_TOLERANCE)
+                )
+                found = same.any(axis=1)
+                if found.any():
+                    repeat = candidates[found]
+                    # The latest matching checkpoint gives the shortest stretch to repeat
+                    checkpoint = saved - 1 - np.argmax(same[found, ::-1], axis=1)
+                    period = visit[repeat] - (1 << checkpoint)
+                    cycles = np.maximum(pets["whole_visits"][repeat] - visit[repeat], 0) // period
+                    visit[repeat] += cycles * period
+                    actions[repeat] += cycles * (
+                        actions[repeat] - pets["saved_actions"][repeat, checkpoint]
+                    )
+                    pets["happiness_sum"][repeat] += cycles * (
+                        pets["happiness_sum"][repeat]
+                        - pets["saved_happiness_sum"][repeat, checkpoint]
+                    )
+                    pets["last_update"][repeat] = np.minimum(
+                        visit[repeat] * pets["every"][repeat], duration
+                    )
+                    pets["saved_hunger"][repeat] = np.nan
+        if iteration == 1 << saved and saved < checkpoints:
+            searching = ~np.isnan(pets["saved_hunger"][:, 0]) | (saved == 0)
+            pets["saved_hunger"][:, saved] = np.where(searching, hunger, np.nan)
+            for column in ("happiness", "energy", "actions", "happiness_sum"):
+                pets["saved_" + column][:, saved] = pets[column]
+            pets["saved_sleeping"][:, saved] = sleeping
+            saved += 1
+
+        done = died | (visit >= pets["last_visit"])
+        if done.any():
+            finished = pets["row"][done]
+            actions_out[finished] = actions[done]
+            lived = visit[done] - died[done]
+            happiness_out[finished] = pets["happiness_sum"][done] / np.maximum(lived, 1)
+            keep = ~done
+            pets = {name: column[keep] for name, column in pets.items()}
+
+    for index, row in enumerate(pets["row"].tolist()):
+        pet = {name: column[index].tolist() for name, column in pets.items()}
+        actions_out[row], survival_out[row], happiness_out[row] = _finish(
+            pet, saved, duration, rates
+        )
+    return list(zip(actions_out.tolist(), survival_out.tolist(), happiness_out.tolist()))
+
+def evaluate(
+    schedules: Sequence[Schedule],
+    duration: float,
+    pet_settings: Optional[PetSettings] = None,
+    cache: Optional[ResultCache] = None,
+) -> List[Outcome]:
+    """Score every schedule, simulating only the ones ``cache`` (default: CACHE) lacks."""
+    pet_settings = settings.pet if pet_settings is None else pet_settings
+    cache = CACHE if cache is None else cache
+    keys = [cache.key(pet_settings, schedule, duration) for schedule in schedules]
+    results: Dict[str, Tuple[int, float, float]] = {}
+    missing: Dict[str, Schedule] = {}
+    for key, schedule in zip(keys, schedules):
+        if key in results or key in missing:
+            continue
+        result = cache.get(key)
+        if result is None:
+            missing[key] = schedule
+        else:
+            results[key] = result
+    if missing:
+        simulated = simulate(list(missing.values()), duration, pet_settings)
+        for key, result in zip(missing, simulated):
+            cache.put(key, result)
+            results[key] = result
+    return [
+        Outcome(Schedule(*schedule), duration, *results[key])
+        for key, schedule in zip(keys, schedules)
+    ]
+
+def pareto_front(outcomes: Sequence[Outcome]) -> List[Outcome]:
+    """The outcomes no other beats on actions, survival and happiness together, cheapest first.
+
+    Only schedules that keep the pet alive throughout are ranked, if any do.
+    Otherwise pets that die within minutes having had no care would fill the
+    front, since nothing needs fewer actions.
+    """
+    candidates = [outcome for outcome in outcomes if outcome.survived] or outcomes
+    ranked = sorted(candidates, key=lambda o: (o.actions, -o.survival, -o.happiness))
+    front: List[Outcome] = []
+    survival = np.empty(len(ranked))
+    happiness = np.empty(len(ranked))
+    for outcome in ranked:
+        kept = len(front)
+        # Everything kept so far needs no more actions, so it only has to be no worse
+        if np.any((survival[:kept] >= outcome.survival) & (happiness[:kept] >= outcome.happiness)):
+            continue
+        survival[kept], happiness[kept] = outcome.survival, outcome.happiness
+        front.append(outcome)
+    return front
+
+def cheapest_survivor(outcomes: Sequence[Outcome]) -> Optional[Outcome]:
+    """The schedule that keeps the pet alive throughout with the fewest actions."""
+    survivors = [outcome for outcome in outcomes if outcome.survived]
+    if not survivors:
+        return None
+    return min(survivors, key=lambda o: (o.actions, -o.happiness))
+
+def _neglected_lifetime(pet_settings: PetSettings) -> float:
+    return min(100.0 / pet_settings.HUNGER_RATE, 100.0 / pet_settings.HAPPINESS_RATE)
+
+def random_schedules(
+    count: int,
+    pet_settings: Optional[PetSettings] = None,
+    seed: int = 0,
+    every: Optional[Tuple[float, float]] = None,
+) -> List[Schedule]:
+    """Draw ``count`` schedules: log-uniform visit intervals and uniform thresholds.
+
+    ``every`` bounds the interval; by default it runs up to how long a
+    neglected pet lives and down to a twentieth of that.
+    """
+    pet_settings = settings.pet if pet_settings is None else pet_settings
+    if every is None:
+        longest = _neglected_lifetime(pet_settings)
+        every = (longest / 20, longest)
+    rng = np.random.default_rng(seed)
+    intervals = np.round(np.exp(rng.uniform(np.log(every[0]), np.log(every[1]), count)))
+    thresholds = np.round(rng.uniform(0.0, 100.0, (count, 3)), 1)
+    return [
+        Schedule(float(interval), *map(float, row))
+        for interval, row in zip(intervals, thresholds)
+    ]
+
+def _as_json(outcome: Outcome) -> Dict[str, Any]:
+    return dict(outcome._asdict(), schedule=outcome.schedule._asdict(),
+                actions_per_day=outcome.actions_per_day)
+
+def _describe(outcome: Outcome) -> str:
+    schedule = outcome.schedule
+    return (f"{outcome.actions_per_day:9.1f} actions/day  "
+            f"{outcome.survival / SECONDS_PER_DAY:7.2f} days  "
+            f"happiness {outcome.happiness:5.1f}  "
+            f"every {schedule.every:g}s, feed<{schedule.feed_below:g} "
+            f"play<{schedule.play_below:g} sleep<{schedule.sleep_below:g}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--policies", type=int, default=10000,
+                        help="number of random schedules to try")
+    parser.add_argument("--days", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-every", type=float, help="shortest visit interval, in seconds")
+    parser.add_argument("--max-every", type=float, help="longest visit interval, in seconds")
+    parser.add_argument("--set", metavar="NAME=VALUE", action="append", default=[],
+                        help="override a PetSettings rate, e.g. HUNGER_RATE=0.4")
+    parser.add_argument("--cache", help="JSON file to reuse and extend with outcomes")
+    parser.add_argument("--json", action="store_true", help="print the Pareto front as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        pet_settings = _parse_overrides(args.set)
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        parser.error(str(e))
+    longest = _neglected_lifetime(pet_settings)
+    every = (args.min_every or longest / 20, args.max_every or longest)
+    schedules = random_schedules(args.policies, pet_settings, args.seed, every)
+    cache = ResultCache(args.cache)
+    started = time.perf_counter()
+    outcomes = evaluate(schedules, args.days * SECONDS_PER_DAY, pet_settings, cache)
+    elapsed = time.perf_counter() - started
+    cache.save()
+    front = pareto_front(outcomes)
+    best = cheapest_survivor(outcomes)
+
+    if args.json:
+        json.dump({
+            "elapsed": elapsed,
+            "cached": cache.hits,
+            "best": _as_json(best) if best is not None else None,
+            "front": [_as_json(outcome) for outcome in front],
+        }, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"Evaluated {len(outcomes)} schedules over {args.days:g} days in {elapsed:.2f}s "
+          f"({cache.hits} from cache)")
+    if best is None:
+        print("No schedule kept a pet alive throughout")
+    else:
+        print("Fewest actions that keep a pet alive:")
+        print("  " + _describe(best))
+    survivors = " that keep a pet alive" if best is not None else ""
+    print(f"Pareto front of the schedules{survivors} ({len(front)} schedules):")
+    for outcome in front:
+        print("  " + _describe(outcome))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,150 +1,381 @@
-import tkinter as tk
-from PIL import Image, ImageTk, ImageDraw
+from typing import NamedTuple
+import hashlib
+import json
 import os
 import math
+import tempfile
+import time
+import zlib
+from .clock import MonotonicClock
+from .config.settings import settings
+from .storage.atomic import atomic_write_json
+from .ui.frame_cache import FrameCache
+from .ui.retained import RetainedImage
+
+SPRITE_SIZE = (64, 64)
+FRAME_COUNT = 8
+# Bump whenever draw_pixel_art() changes so cached atlases are redrawn
+ATLAS_VERSION = 1
+
+# Base colors for different states
+STATE_COLORS = {
+    "idle": "#4CAF50",    # Green
+    "happy": "#FFC107",   # Yellow
+    "sleep": "#2196F3",   # Blue
+    "eat": "#FF5722",     # Orange
+    "walk": "#4CAF50",    # Green
+    "play": "#FFC107",    # Yellow
+    "sick": "#9E9E9E"     # Gray
+}
+
+def mood(pet):
+    """Pick the sprite state the game window shows for a pet's current stats."""
+    if pet.is_sleeping:
+        return "sleep"
+    if pet.happiness > settings.ui.HAPPY_THRESHOLD:
+        return "happy"
+    if pet.hunger < settings.ui.SICK_THRESHOLD:
+        return "sick"
+    return "idle"
+
+# State colors per palette; "classic" is the original look
+PALETTES = {
+    "classic": STATE_COLORS,
+    "pastel": {
+        "idle": "#A5D6A7", "happy": "#FFE082", "sleep": "#90CAF9", "eat": "#FFAB91",
+        "walk": "#A5D6A7", "play": "#FFE082", "sick": "#CFD8DC",
+    },
+    "night": {
+        "idle": "#7E57C2", "happy": "#EC407A", "sleep": "#3949AB", "eat": "#D81B60",
+        "walk": "#7E57C2", "play": "#EC407A", "sick": "#546E7A",
+    },
+    "ember": {
+        "idle": "#E65100", "happy": "#FFB300", "sleep": "#6D4C41", "eat": "#BF360C",
+        "walk": "#E65100", "play": "#FFB300", "sick": "#8D6E63",
+    },
+}
+
+# Body outlines before each state's animation offsets are applied
+BODY_SHAPES = {
+    "classic": [(24, 32), (20, 40), (28, 40), (24, 48)],
+    "round": [(24, 32), (29, 34), (31, 40), (29, 46), (24, 48), (19, 46), (17, 40), (19, 34)],
+    "tall": [(24, 26), (29, 38), (26, 50), (22, 50), (19, 38)],
+}
+
+# Open-eye bounding boxes, left then right
+EYE_STYLES = {
+    "dots": [[(22, 28), (24, 30)], [(26, 28), (28, 30)]],
+    "wide": [[(20, 27), (23, 30)], [(25, 27), (28, 30)]],
+    "beady": [[(22, 29), (23, 30)], [(27, 29), (28, 30)]],
+}
+
+class Appearance(NamedTuple):
+    """How one pet looks: a palette, a body shape and an eye style, by name."""
+    palette: str = "classic"
+    body: str = "classic"
+    eyes: str = "dots"
+
+DEFAULT_APPEARANCE = Appearance()
+
+def appearance_for(name):
+    """Pick a stable appearance from a pet's name, so the same pet always looks the same."""
+    seed = zlib.crc32(name.lower().encode())
+    palettes, bodies, eyes = sorted(PALETTES), sorted(BODY_SHAPES), sorted(EYE_STYLES)
+    return Appearance(
+        palettes[seed % len(palettes)],
+        bodies[seed // len(palettes) % len(bodies)],
+        eyes[seed // (len(palettes) * len(bodies)) % len(eyes)],
+    )
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "tamagotchi",
+    "sprites"
+)
+
+def draw_pixel_art(state, frame, appearance=DEFAULT_APPEARANCE):
+    """Draw one animation frame of ``appearance`` as a PIL image."""
+    # PIL is imported on first draw so importing this module stays cheap
+    from PIL import Image, ImageDraw  # pylint: disable=import-outside-toplevel
+    # Create a larger canvas for more detailed pixel art
+    img = Image.new('RGBA', SPRITE_SIZE, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    base_color = PALETTES[appearance.palette][state]
+
+    # Draw the basic body shape
+    body_points = list(BODY_SHAPES[appearance.body])
+
+    # Add animation-specific modifications
+    if state == "idle":
+        # Gentle breathing animation
+        y_offset = math.sin(frame * 0.5) * 2
+        body_points = [(x, y + y_offset) for x, y in body_points]
+    elif state == "happy":
+        # Bouncing animation
+        y_offset = math.sin(frame * 0.8) * 3
+        body_points = [(x, y + y_offset) for x, y in body_points]
+    elif state == "sleep":
+        # Sleeping animation with z's
+        y_offset = math.sin(frame * 0.3) * 1
+        body_points = [(x, y + y_offset) for x, y in body_points]
+        # Draw Z's
+        if frame % 2 == 0:
+            draw.text((32, 20), "z", fill=base_color, font=None)
+    elif state == "eat":
+        # Eating animation
+        y_offset = math.sin(frame * 0.7) * 2
+        body_points = [(x, y + y_offset) for x, y in body_points]
+    elif state == "walk":
+        # Walking animation
+        x_offset = math.sin(frame * 0.8) * 3
+        body_points = [(x + x_offset, y) for x, y in body_points]
+    elif state == "play":
+        # Playing animation
+        y_offset = math.sin(frame * 0.9) * 4
+        x_offset = math.cos(frame * 0.9) * 2
+        body_points = [(x + x_offset, y + y_offset) for x, y in body_points]
+    elif state == "sick":
+        # Sick animation
+        y_offset = math.sin(frame * 0.4) * 1
+        body_points = [(x, y + y_offset) for x, y in body_points]
+
+    # Draw the body
+    draw.polygon(body_points, fill=base_color)
+
+    # Add eyes
+    eye_color = "#FFFFFF"
+    if state == "sleep":
+        # Closed eyes
+        draw.line([(22, 30), (26, 30)], fill=eye_color, width=2)
+    else:
+        # Open eyes
+        for eye in EYE_STYLES[appearance.eyes]:
+            draw.ellipse(eye, fill=eye_color)
+
+    # Add mouth based on state
+    if state == "happy":
+        # Smile
+        draw.arc([(22, 32), (28, 36)], 0, 180, fill="#000000", width=2)
+    elif state == "eat":
+        # Open mouth
+        draw.ellipse([(23, 34), (27, 36)], fill="#000000")
+    elif state == "sick":
+        # Frown (fixed coordinates to ensure y1 > y0)
+        draw.arc([(22, 32), (28, 36)], 180, 360, fill="#000000", width=2)
+    else:
+        # Neutral mouth
+        draw.line([(23, 34), (27, 34)], fill="#000000", width=2)
+
+    return img
+
+class SpriteAtlas:
+    """Versioned on-disk sprite sheet, one row of frames per animation state.
+
+    Rows are drawn the first time a state is requested and appended to the
+    sheet, so later launches crop frames from the PNG instead of redrawing.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, appearance=DEFAULT_APPEARANCE):
+        self.cache_dir = cache_dir
+        self.appearance = appearance
+        self.key = self.parameters_key(appearance)
+        self.sheet_path = os.path.join(cache_dir, f"sprites-{self.key}.png")
+        self.index_path = os.path.join(cache_dir, f"sprites-{self.key}.json")
+        self.rows = {}
+        self.sheet = None
+        self._loaded = False
+
+    @staticmethod
+    def parameters_key(appearance=DEFAULT_APPEARANCE):
+        """Hash every input of draw_pixel_art() that affects its output."""
+        parameters = {
+            "version": ATLAS_VERSION,
+            "size": SPRITE_SIZE,
+            "frames": FRAME_COUNT,
+            "colors": PALETTES[appearance.palette]
+        }
+        # The classic look keeps the key sheets were cached under before variants
+        if appearance != DEFAULT_APPEARANCE:
+            parameters["body"] = BODY_SHAPES[appearance.body]
+            parameters["eyes"] = EYE_STYLES[appearance.eyes]
+        encoded = json.dumps(parameters, sort_keys=True).encode()
+        return hashlib.sha1(encoded).hexdigest()[:16]
+
+    def _load(self):
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+        self._loaded = True
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            if index.get("key") != self.key:
+                return
+            with Image.open(self.sheet_path) as sheet:
+                sheet.load()
+                self.sheet = sheet.convert('RGBA')
+            self.rows = index["rows"]
+        except (OSError, ValueError, KeyError):
+            self.rows = {}
+            self.sheet = None
+
+    def _save(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".png", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    self.sheet.save(f, format='PNG')
+                os.replace(tmp_path, self.sheet_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            atomic_write_json(self.index_path, {
+                "version": ATLAS_VERSION,
+                "key": self.key,
+                "frame_size": list(SPRITE_SIZE),
+                "frames": FRAME_COUNT,
+                "rows": self.rows
+            })
+        except OSError:
+            pass  # The cache is an optimization; keep the frames in memory
+
+    def _row_top(self, state):
+        """Return the y offset of a state's row, drawing and caching the row if needed."""
+        if not self._loaded:
+            self._load()
+        width, height = SPRITE_SIZE
+        if state not in self.rows:
+            from PIL import Image  # pylint: disable=import-outside-toplevel
+            row = len(self.rows)
+            sheet = Image.new('RGBA', (width * FRAME_COUNT, height * (row + 1)), (0, 0, 0, 0))
+            if self.sheet is not None:
+                sheet.paste(self.sheet, (0, 0))
+            for frame in range(FRAME_COUNT):
+                sheet.paste(
+                    draw_pixel_art(state, frame, self.appearance), (frame * width, row * height)
+                )
+            self.sheet = sheet
+            self.rows[state] = row
+            self._save()
+        return self.rows[state] * height
+
+    def frames(self, state):
+        """Return the PIL frames for a state, drawing and caching them if needed."""
+        return [self.frame(state, index) for index in range(FRAME_COUNT)]
+
+    def frame(self, state, index):
+        """Return one PIL frame of a state, cropping only that frame from the sheet."""
+        top = self._row_top(state)
+        width, height = SPRITE_SIZE
+        return self.sheet.crop((index * width, top, (index + 1) * width, top + height))
+
+# One atlas per appearance, shared by every sprite that looks that way
+_ATLASES = {}
+
+def atlas_for(appearance=DEFAULT_APPEARANCE):
+    """Return the process-wide atlas for ``appearance``."""
+    atlas = _ATLASES.get(appearance)
+    if atlas is None:
+        atlas = _ATLASES[appearance] = SpriteAtlas(appearance=appearance)
+    return atlas
+
+# Tk images of rendered frames, keyed by (appearance, state, frame) and shared by all sprites
+FRAME_CACHE = FrameCache(settings.ui.SPRITE_CACHE_BYTES)
+
+def claim_frame_cache(canvas):
+    """Empty FRAME_CACHE if its images belong to another Tk interpreter than ``canvas``."""
+    interpreter = getattr(canvas, "tk", None)
+    if FRAME_CACHE.owner is not interpreter:
+        FRAME_CACHE.clear()
+        FRAME_CACHE.owner = interpreter
+
+def render_frame(atlas, state, frame):
+    """Convert one atlas frame to a PhotoImage; returns it and its size in bytes."""
+    from PIL import ImageTk  # pylint: disable=import-outside-toplevel
+    picture = atlas.frame(state, frame)
+    return ImageTk.PhotoImage(picture), picture.width * picture.height * 4
+
+def shared_frame(appearance, state, frame, render=None):
+    """Return one frame's PhotoImage from FRAME_CACHE, rendering it on a miss.
+
+    ``render(state, frame)`` defaults to render_frame() from the process-wide
+    atlas for ``appearance``.
+    """
+    key = (appearance, state, frame)
+    image = FRAME_CACHE.get(key)
+    if image is None:
+        if render is None:
+            image, size = render_frame(atlas_for(appearance), state, frame)
+        else:
+            image, size = render(state, frame)
+        FRAME_CACHE.put(key, image, size)
+    return image
 
 class PetSprite:
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, atlas=None, stats=None, clock=None, appearance=None):
         self.canvas = canvas
         self.x = x
         self.y = y
         self.current_frame = 0
         self.animation_frames = []
         self.current_animation = "idle"
-        self.animations = {
-            "idle": [],
-            "happy": [],
-            "sleep": [],
-            "eat": [],
-            "walk": [],
-            "play": [],
-            "sick": []
-        }
-        self.sprite_id = None
+        if appearance is None:
+            appearance = atlas.appearance if atlas is not None else DEFAULT_APPEARANCE
+        self.appearance = appearance
+        self.atlas = atlas if atlas is not None else atlas_for(appearance)
+        # Tk images belong to one interpreter, so a new root starts the shared cache afresh
+        claim_frame_cache(canvas)
+        self.sprite = RetainedImage(canvas, x, y)
         self.frame_delay = 150  # milliseconds between frames
-        self.load_sprites()
+        # Optional FrameStats that records each animate() as the "animate" phase
+        self.stats = stats
+        # Frames follow this clock, not the game's, so an accelerated pet still animates at 1x
+        self.clock = clock if clock is not None else MonotonicClock()
+        self._animation_started = self.clock()
         self.start_animation()
 
-    def create_pixel_art(self, state, frame):
-        # Create a larger canvas for more detailed pixel art
-        size = (64, 64)
-        img = Image.new('RGBA', size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Base colors for different states
-        colors = {
-            "idle": "#4CAF50",    # Green
-            "happy": "#FFC107",   # Yellow
-            "sleep": "#2196F3",   # Blue
-            "eat": "#FF5722",     # Orange
-            "walk": "#4CAF50",    # Green
-            "play": "#FFC107",    # Yellow
-            "sick": "#9E9E9E"     # Gray
-        }
-        
-        base_color = colors[state]
-        
-        # Draw the basic body shape
-        body_points = [
-            (24, 32),  # Head
-            (20, 40),  # Body
-            (28, 40),  # Body
-            (24, 48),  # Bottom
-        ]
-        
-        # Add animation-specific modifications
-        if state == "idle":
-            # Gentle breathing animation
-            y_offset = math.sin(frame * 0.5) * 2
-            body_points = [(x, y + y_offset) for x, y in body_points]
-        elif state == "happy":
-            # Bouncing animation
-            y_offset = math.sin(frame * 0.8) * 3
-            body_points = [(x, y + y_offset) for x, y in body_points]
-        elif state == "sleep":
-            # Sleeping animation with z's
-            y_offset = math.sin(frame * 0.3) * 1
-            body_points = [(x, y + y_offset) for x, y in body_points]
-            # Draw Z's
-            if frame % 2 == 0:
-                draw.text((32, 20), "z", fill=base_color, font=None)
-        elif state == "eat":
-            # Eating animation
-            y_offset = math.sin(frame * 0.7) * 2
-            body_points = [(x, y + y_offset) for x, y in body_points]
-        elif state == "walk":
-            # Walking animation
-            x_offset = math.sin(frame * 0.8) * 3
-            body_points = [(x + x_offset, y) for x, y in body_points]
-        elif state == "play":
-            # Playing animation
-            y_offset = math.sin(frame * 0.9) * 4
-            x_offset = math.cos(frame * 0.9) * 2
-            body_points = [(x + x_offset, y + y_offset) for x, y in body_points]
-        elif state == "sick":
-            # Sick animation
-            y_offset = math.sin(frame * 0.4) * 1
-            body_points = [(x, y + y_offset) for x, y in body_points]
-        
-        # Draw the body
-        draw.polygon(body_points, fill=base_color)
-        
-        # Add eyes
-        eye_color = "#FFFFFF"
-        if state == "sleep":
-            # Closed eyes
-            draw.line([(22, 30), (26, 30)], fill=eye_color, width=2)
-        else:
-            # Open eyes
-            draw.ellipse([(22, 28), (24, 30)], fill=eye_color)
-            draw.ellipse([(26, 28), (28, 30)], fill=eye_color)
-        
-        # Add mouth based on state
-        if state == "happy":
-            # Smile
-            draw.arc([(22, 32), (28, 36)], 0, 180, fill="#000000", width=2)
-        elif state == "eat":
-            # Open mouth
-            draw.ellipse([(23, 34), (27, 36)], fill="#000000")
-        elif state == "sick":
-            # Frown (fixed coordinates to ensure y1 > y0)
-            draw.arc([(22, 32), (28, 36)], 180, 360, fill="#000000", width=2)
-        else:
-            # Neutral mouth
-            draw.line([(23, 34), (27, 34)], fill="#000000", width=2)
-        
-        return ImageTk.PhotoImage(img)
+    def render_frame(self, state, frame):
+        """Convert one frame of this sprite's atlas to a PhotoImage; returns it and its size."""
+        return render_frame(self.atlas, state, frame)
+
+    def get_frame(self, state, frame):
+        """Return one frame's PhotoImage, shared with every sprite of the same appearance."""
+        return shared_frame(self.appearance, state, frame, self.render_frame)
+
+    def get_frames(self, state):
+        """Return the PhotoImages for a state, creating them on first use."""
+        return [self.get_frame(state, frame) for frame in range(FRAME_COUNT)]
 
     def load_sprites(self):
-        # Create 8 frames for each animation state
-        for state in self.animations:
-            for frame in range(8):
-                photo = self.create_pixel_art(state, frame)
-                self.animations[state].append(photo)
+        # Eagerly create 8 frames for each animation state
+        for state in STATE_COLORS:
+            self.get_frames(state)
 
     def start_animation(self):
         self.animate()
 
+    @property
+    def sprite_id(self):
+        return self.sprite.item_id
+
     def animate(self):
-        if self.sprite_id:
-            self.canvas.delete(self.sprite_id)
-        
-        # Get current animation frames
-        frames = self.animations[self.current_animation]
-        
-        # Display current frame
-        self.sprite_id = self.canvas.create_image(
-            self.x, self.y,
-            image=frames[self.current_frame]
-        )
-        
-        # Update frame counter
-        self.current_frame = (self.current_frame + 1) % len(frames)
-        
+        started = time.perf_counter()
+        # Pick the frame from elapsed time, so late callbacks skip frames instead of slowing down
+        elapsed_ms = (self.clock() - self._animation_started) * 1000
+        self.current_frame = int(elapsed_ms // self.frame_delay) % FRAME_COUNT
+
+        # Display current frame, reusing the same canvas item
+        self.sprite.show(self.get_frame(self.current_animation, self.current_frame))
+
+        if self.stats is not None:
+            self.stats.record("animate", time.perf_counter() - started)
+
         # Schedule next frame
         self.canvas.after(self.frame_delay, self.animate)
 
     def set_animation(self, animation_name):
-        if animation_name in self.animations:
+        if animation_name in STATE_COLORS:
             self.current_animation = animation_name
-            self.current_frame = 0 
\ No newline at end of file
+            self.current_frame = 0
+            self._animation_started = self.clock()
@@ -0,0 +1,252 @@
+"""Asyncio server hosting many pets behind one socket.
+
+Clients send newline-delimited JSON commands such as
+``{"id": 1, "op": "feed", "name": "Tama"}`` and get one JSON reply per
+command. Supported ops: create (with an optional rate ``profile``), get,
+feed, play, sleep, subscribe and unsubscribe. Commands that arrive together are applied as one batch with a
+single timestamp, and subscribers receive ``{"event": "state", ...}`` pushes
+whenever a batch or the periodic tick changes a pet they follow.
+
+    python -m src.tamagotchi.server --port 8765 --pets 1000
+"""
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from .clock import Clock, get_clock
+from .core.pet import Tamagotchi
+from .config.profiles import DEFAULT_PROFILE
+
+logger = logging.getLogger(__name__)
+
+# Replies queued for a client beyond this many bytes mean it stopped reading
+MAX_CLIENT_BUFFER = 1 << 20
+
+class Client:
+    """One connected socket and the pets it follows."""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.subscriptions: Set[str] = set()
+
+    def send(self, message: Dict[str, Any]) -> None:
+        """Queue a message without waiting for the socket to drain."""
+        if self.writer.is_closing():
+            return
+        self.writer.write(json.dumps(message, separators=(',', ':')).encode() + b"\n")
+        if self.writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+            self.writer.close()
+
+_FIELDS = [f.name for f in fields(Tamagotchi)]
+
+# One precondition check per action, shared with bulk care jobs
+_ACTIONS = {
+    "feed": Tamagotchi.feed_many,
+    "play": Tamagotchi.play_many,
+    "sleep": Tamagotchi.sleep_many,
+}
+
+def _state(pet: Tamagotchi) -> Dict[str, Any]:
+    # Same result as asdict() for this flat dataclass, without its deep copies
+    return {name: getattr(pet, name) for name in _FIELDS}
+
+class PetServer:
+    """Owns a set of pets and applies client commands to them in batches."""
+
+    def __init__(
+        self,
+        pets: Iterable[Tamagotchi] = (),
+        tick_interval: float = 1.0,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        """Host ``pets``; subscribers get decay updates every ``tick_interval`` seconds."""
+        self.pets: Dict[str, Tamagotchi] = {pet.name.lower(): pet for pet in pets}
+        self.tick_interval = tick_interval
+        self.clock = clock if clock is not None else get_clock()
+        self.clients: Set[Client] = set()
+        self.subscribers: Dict[str, Set[Client]] = {}
+        self._queue: List[Tuple[Client, Dict[str, Any]]] = []
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.batches = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765,
+                    path: Optional[str] = None) -> asyncio.AbstractServer:
+        """Listen on a TCP port, or on a Unix socket if ``path`` is given."""
+        # Created here so it belongs to the running event loop
+        self._wake = asyncio.Event()
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port)
+        self._tasks = [
+            asyncio.ensure_future(self._batch_loop()),
+            asyncio.ensure_future(self._tick_loop()),
+        ]
+        return self._server
+
+    async def close(self) -> None:
+        """Stop listening and disconnect every client."""
+        for task in self._tasks:
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for client in list(self.clients):
+            client.writer.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        client = Client(writer)
+        self.clients.add(client)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    command = json.loads(line)
+                except ValueError:
+                    client.send({"ok": False, "error": "invalid JSON"})
+                    continue
+                if not isinstance(command, dict):
+                    client.send({"ok": False, "error": "command must be a JSON object"})
+                    continue
+                self._queue.append((client, command))
+                self._wake.set()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.clients.discard(client)
+            for name in client.subscriptions:
+                self.subscribers.get(name, set()).discard(client)
+            writer.close()
+
+    async def _batch_loop(self) -> None:
+        while True:
+            await self._wake.wait()
+            # Yield once so commands arriving in the same loop iteration join the batch
+            await asyncio.sleep(0)
+            self._wake.clear()
+            batch, self._queue = self._queue, []
+            self.process_batch(batch)
+
+    async def _tick_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            now = self.clock()
+            for name, followers in self.subscribers.items():
+                if not followers:
+                    continue
+                pet = self.pets[name]
+                pet.update(now)
+                self._push(pet, followers)
+
+    def _push(self, pet: Tamagotchi, followers: Iterable[Client]) -> None:
+        message = {"event": "state", "pet": _state(pet)}
+        for follower in followers:
+            follower.send(message)
+
+    def process_batch(self, batch: List[Tuple[Client, Dict[str, Any]]],
+                      now: Optional[float] = None) -> None:
+        """Apply a batch of commands at one timestamp and send every reply."""
+        if now is None:
+            now = self.clock()
+        self.batches += 1
+        updated: Set[str] = set()
+        changed: Set[str] = set()
+        for client, command in batch:
+            try:
+                reply = self._apply(client, command, now, updated, changed)
+            except Exception:  # pylint: disable=broad-except
+                # One bad command must not stop the batch loop serving everyone else
+                logger.exception("Command %r failed", command)
+                reply = {"ok": False, "error": "internal error"}
+            if "id" in command:
+                reply["id"] = command["id"]
+            client.send(reply)
+        for name in changed:
+            followers = self.subscribers.get(name)
+            if followers:
+                self._push(self.pets[name], followers)
+
+    def _apply(self, client: Client, command: Dict[str, Any], now: float,
+               updated: Set[str], changed: Set[str]) -> Dict[str, Any]:
+        # pylint: disable=too-many-arguments,too-many-return-statements
+        op = command.get("op")
+        name = str(command.get("name", ""))
+        key = name.lower()
+        if op == "create":
+            if not name or key in self.pets:
+                return {"ok": False, "error": "name missing or taken"}
+            try:
+                self.pets[key] = Tamagotchi(
+                    name, last_update=now, profile=str(command.get("profile", DEFAULT_PROFILE))
+                )
+            except ValueError as error:
+                return {"ok": False, "error": str(error)}
+            updated.add(key)
+            changed.add(key)
+            return {"ok": True, "pet": _state(self.pets[key])}
+
+        pet = self.pets.get(key)
+        if pet is None:
+            return {"ok": False, "error": f"unknown pet: {name}"}
+        # Bring each pet up to the batch timestamp once, however many commands touch it
+        if key not in updated:
+            pet.update(now)
+            updated.add(key)
+
+        if op == "get":
+            return {"ok": True, "pet": _state(pet)}
+        if op == "subscribe":
+            client.subscriptions.add(key)
+            self.subscribers.setdefault(key, set()).add(client)
+            return {"ok": True, "pet": _state(pet)}
+        if op == "unsubscribe":
+            client.subscriptions.discard(key)
+            self.subscribers.get(key, set()).discard(client)
+            return {"ok": True}
+        if op in _ACTIONS:
+            accepted = self._act(pet, op)
+            if accepted:
+                changed.add(key)
+            return {"ok": accepted, "pet": _state(pet)}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+    @staticmethod
+    def _act(pet: Tamagotchi, op: str) -> bool:
+        """Apply an action if the pet's state allows it, as the Tk UI does."""
+        return _ACTIONS[op]([pet])[0]
+
+async def _serve(args: argparse.Namespace) -> None:
+    pets = [Tamagotchi(f"Pet{i}") for i in range(args.pets)]
+    server = PetServer(pets, tick_interval=args.tick)
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Hosting {len(server.pets)} pets on {where}")
+    async with listener:
+        await listener.serve_forever()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Host many pets over newline-delimited JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead")
+    parser.add_argument("--pets", type=int, default=0, help="pre-create Pet0..PetN-1")
+    parser.add_argument("--tick", type=float, default=1.0,
+                        help="seconds between pushes of decayed stats to subscribers")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""Headless pet simulation for capacity planning and tuning PetSettings rates.
+
+Run with ``python -m src.tamagotchi.sim --pets 100000 --days 7``.
+"""
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import math
+import sys
+import time
+import numpy as np
+from .core.pet import Tamagotchi
+from .core.population import PetPopulation
+from .config.settings import PetSettings, settings
+
+SECONDS_PER_DAY = 86400.0
+
+@dataclass
+class ThresholdPolicy:
+    """Scripted care: each visit, top up whichever stats fell below a threshold."""
+    feed_below: float = 40.0
+    play_below: float = 40.0
+    sleep_below: float = 20.0
+
+    def act(
+        self,
+        population: PetPopulation,
+        rng: np.random.Generator,
+        pet_settings: PetSettings,
+    ) -> int:
+        """Care for the population once and return the number of accepted actions."""
+        # pylint: disable=unused-argument
+        actions = 0
+        actions += population.feed(population.hunger < self.feed_below, pet_settings).sum()
+        actions += population.play(population.happiness < self.play_below, pet_settings).sum()
+        tired = ~population.is_sleeping & (population.energy < self.sleep_below)
+        actions += population.sleep(tired, pet_settings).sum()
+        return int(actions)
+
+@dataclass
+class RandomPolicy:
+    """Random care: each visit, each pet gets one action with the given odds."""
+    feed_chance: float = 0.3
+    play_chance: float = 0.3
+    sleep_chance: float = 0.1
+
+    def act(
+        self,
+        population: PetPopulation,
+        rng: np.random.Generator,
+        pet_settings: PetSettings,
+    ) -> int:
+        """Care for the population once and return the number of accepted actions."""
+        roll = rng.random(len(population))
+        feed_until = self.feed_chance
+        play_until = feed_until + self.play_chance
+        sleep_until = play_until + self.sleep_chance
+        actions = population.feed(roll < feed_until, pet_settings).sum()
+        actions += population.play((roll >= feed_until) & (roll < play_until), pet_settings).sum()
+        actions += population.sleep((roll >= play_until) & (roll < sleep_until), pet_settings).sum()
+        return int(actions)
+
+@dataclass
+class NoCarePolicy:
+    """Neglect: never interact with the pets."""
+
+    def act(
+        self,
+        population: PetPopulation,
+        rng: np.random.Generator,
+        pet_settings: PetSettings,
+    ) -> int:
+        """Do nothing."""
+        # pylint: disable=unused-argument
+        return 0
+
+POLICIES = {
+    "threshold": ThresholdPolicy,
+    "random": RandomPolicy,
+    "none": NoCarePolicy,
+}
+
+def _distribution(values: np.ndarray) -> Dict[str, float]:
+    if len(values) == 0:
+        return {}
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        "mean": float(values.mean()),
+        "std": float(values.std()),
+        "p10": float(p10),
+        "p50": float(p50),
+        "p90": float(p90),
+    }
+
+@dataclass
+class SimulationReport:
+    """Outcome of a simulation run."""
+    pets: int
+    duration: float
+    steps: int
+    actions: int
+    alive: int
+    elapsed: float
+    survival: Dict[str, float]
+    stats: Dict[str, Dict[str, float]]
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Pet update steps per wall-clock second; 0 if the run took no measurable time."""
+        return self.pets * self.steps / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """Render the report as human-readable text."""
+        lines = [
+            f"Simulated {self.pets} pets for {self.duration / SECONDS_PER_DAY:.2f} days "
+            f"in {self.elapsed:.3f}s ({self.ticks_per_second:,.0f} pet-ticks/s)",
+            f"Alive at end: {self.alive} ({self.alive / max(self.pets, 1):.1%}), "
+            f"actions: {self.actions}",
+        ]
+        if self.survival:
+            lines.append(
+                "Survival (h): " + ", ".join(
+                    f"{key}={value / 3600:.2f}" for key, value in self.survival.items()
+                    if key != "std"
+                )
+            )
+        for stat, distribution in self.stats.items():
+            if not distribution:
+                continue
+            lines.append(
+                f"{stat.capitalize()}: " + ", ".join(
+                    f"{key}={value:.1f}" for key, value in distribution.items()
+                )
+            )
+        return "\n".join(lines)
+
+class Simulation:
+    """Drives a PetPopulation with a care policy in simulated time, without Tk."""
+
+    def __init__(
+        self,
+        population: PetPopulation,
+        policy: Any,
+        pet_settings: Optional[PetSettings] = None,
+        step: float = 30.0,
+        seed: int = 0,
+    ) -> None:
+        """Prepare a run; ``step`` is the simulated seconds between caretaker visits."""
+        self.population = population
+        self.policy = policy
+        self.pet_settings = settings.pet if pet_settings is None else pet_settings
+        self.step = step
+        self.rng = np.random.default_rng(seed)
+        self.start_time = float(population.last_update.min()) if len(population) else 0.0
+        self.death_time = np.where(population.is_alive, np.inf, self.start_time)
+
+    @classmethod
+    def with_new_pets(cls, count: int, policy: Any, **kwargs: Any) -> 'Simulation':
+        """Simulate ``count`` fresh pets starting at time zero."""
+        population = PetPopulation(count)
+        population.extend(Tamagotchi(f"Pet{i}", last_update=0.0) for i in range(count))
+        return cls(population, policy, **kwargs)
+
+    def run(self, duration: float) -> SimulationReport:
+        """Simulate ``duration`` seconds and report survival and stat distributions."""
+        population = self.population
+        pet_settings = self.pet_settings
+        steps = int(np.ceil(duration / self.step))
+        actions = 0
+        started = time.perf_counter()
+        now = self.start_time
+        for step in range(1, steps + 1):
+            # Pets die the moment hunger or happiness hits zero, whatever happens to energy
+            alive = population.is_alive.copy()
+            # Zero rates mean a stat never runs out: x/0 is inf, and 0/0 only hits pets already dead
+            with np.errstate(divide='ignore', invalid='ignore'):
+                time_to_death = np.minimum(
+                    population.hunger / pet_settings.HUNGER_RATE,
+                    population.happiness / pet_settings.HAPPINESS_RATE,
+                )
+            now = self.start_time + min(step * self.step, duration)
+            previous = population.last_update.copy()
+            population.update(now, pet_settings)
+            died = alive & ~population.is_alive
+            self.death_time[died] = previous[died] + time_to_death[died]
+            actions += self.policy.act(population, self.rng, pet_settings)
+        elapsed = time.perf_counter() - started
+
+        survival = np.minimum(self.death_time, now) - self.start_time
+        living = population.is_alive
+        return SimulationReport(
+            pets=len(population),
+            duration=duration,
+            steps=steps,
+            actions=actions,
+            alive=int(living.sum()),
+            elapsed=elapsed,
+            survival=_distribution(survival),
+            stats={
+                "hunger": _distribution(population.hunger[living]),
+                "happiness": _distribution(population.happiness[living]),
+                "energy": _distribution(population.energy[living]),
+            },
+        )
+
+def _parse_overrides(pairs: List[str]) -> PetSettings:
+    """Build PetSettings from NAME=VALUE overrides of the global settings."""
+    known = {f.name for f in fields(PetSettings)}
+    overrides = {}
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        name = name.upper()
+        if name not in known:
+            raise argparse.ArgumentTypeError(f"unknown PetSettings field: {name}")
+        overrides[name] = float(value)
+    return replace(settings.pet, **overrides)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pets", type=int, default=10000)
+    parser.add_argument("--days", type=float, default=1.0)
+    parser.add_argument("--step", type=float, default=30.0,
+                        help="simulated seconds between caretaker visits")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="threshold")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", metavar="NAME=VALUE", action="append", default=[],
+                        help="override a PetSettings rate, e.g. HUNGER_RATE=0.4")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    if args.pets < 0:
+        parser.error("--pets must not be negative")
+    if not 0 <= args.days < math.inf:
+        parser.error("--days must be a finite number, not negative")
+    if not 0 < args.step < math.inf:
+        parser.error("--step must be a finite number above 0")
+
+    try:
+        pet_settings = _parse_overrides(args.set)
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        parser.error(str(e))
+    simulation = Simulation.with_new_pets(
+        args.pets,
+        POLICIES[args.policy](),
+        pet_settings=pet_settings,
+        step=args.step,
+        seed=args.seed,
+    )
+    report = simulation.run(args.days * SECONDS_PER_DAY)
+    if args.json:
+        json.dump(
+            dict(asdict(report), ticks_per_second=report.ticks_per_second),
+            sys.stdout,
+            indent=2,
+        )
+        print()
+    else:
+        print(report.summary())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+"""Chunked, zlib-compressed column files for bulk export and import of pets.
+
+    python -m src.tamagotchi.storage.columnar export saves/pets.db backup.tcol
+    python -m src.tamagotchi.storage.columnar import backup.tcol restored.db
+
+Layout: an 8-byte magic, a header of ``version, chunk size, schema length``
+and a JSON schema listing every Tamagotchi field with its dtype. Then come
+chunks of at most ``chunk size`` pets. Each chunk is a pet count followed by
+one ``length, zlib data`` block per column. A zero-count chunk and the total
+pet count end the file. A string column is the UTF-8 byte length of each
+value as a uint32, then the values back to back. Writers and readers hold
+one chunk at a time, and readers can skip the columns they don't need.
+"""
+from dataclasses import fields
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+import numpy as np
+from ..core.pet import Tamagotchi
+from ..core.population import COLUMNS, PetPopulation
+from ..config.settings import settings
+
+MAGIC = b"TAMACOL1"
+# Version 1 joined strings on NUL, which a name containing NUL could shift; it can still be read
+VERSION = 2
+# version, chunk size, schema length
+HEADER = struct.Struct("<III")
+COUNT = struct.Struct("<I")
+LENGTH = struct.Struct("<Q")
+STRING = "str"
+
+# Every Tamagotchi field, in field order: numeric columns as PetPopulation keeps them
+SCHEMA: List[Tuple[str, str]] = [
+    (f.name, np.dtype(COLUMNS[f.name]).newbyteorder("<").str if f.name in COLUMNS else STRING)
+    for f in fields(Tamagotchi)
+]
+
+STRING_LENGTH = np.dtype("<u4")
+
+def _encode(values: Any, dtype: str) -> bytes:
+    if dtype == STRING:
+        text = "".join(values)
+        data = text.encode("utf-8")
+        if len(data) == len(text):  # All ASCII, so characters are bytes
+            lengths = map(len, values)
+        else:
+            lengths = (len(value.encode("utf-8")) for value in values)
+        return np.fromiter(lengths, dtype=STRING_LENGTH, count=len(values)).tobytes() + data
+    return np.ascontiguousarray(values, dtype=dtype).tobytes()
+
+def _decode(data: bytes, dtype: str, count: int, version: int = VERSION) -> Any:
+    if dtype != STRING:
+        return np.frombuffer(data, dtype=dtype, count=count)
+    if not count:
+        return []
+    if version == 1:
+        values = data.decode("utf-8").split("\0")
+        if len(values) != count:
+            raise ValueError(f"expected {count} strings, found {len(values)}")
+        return values
+    ends = np.cumsum(np.frombuffer(data, dtype=STRING_LENGTH, count=count), dtype=np.int64)
+    blob = data[count * STRING_LENGTH.itemsize:]
+    if ends[-1] != len(blob):
+        raise ValueError(f"string lengths add up to {ends[-1]} bytes, not {len(blob)}")
+    if b"\0" not in blob:
+        # Put a NUL at every boundary so one decode and split does the work
+        separated = np.insert(np.frombuffer(blob, dtype=np.uint8), ends[:-1], 0)
+        return separated.tobytes().decode("utf-8").split("\0")
+    starts = [0] + ends[:-1].tolist()
+    return [blob[start:end].decode("utf-8") for start, end in zip(starts, ends.tolist())]
+
+class ColumnWriter:
+    """Streams pets into a column file, one chunk in memory at a time.
+
+    The file appears at ``path`` atomically on close(); leaving the block with
+    an exception discards it.
+    """
+
+    def __init__(self, path: str, chunk_size: Optional[int] = None, level: int = 6) -> None:
+        self.path = path
+        self.chunk_size = settings.save.EXPORT_CHUNK_SIZE if chunk_size is None else chunk_size
+        if self.chunk_size < 1:
+            raise ValueError(f"chunk size must be at least 1, got {self.chunk_size}")
+        self.level = level
+        self.count = 0
+        self._pending: List[Tamagotchi] = []
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, self._tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        self._file: Optional[BinaryIO] = os.fdopen(fd, 'wb')
+        schema = json.dumps(SCHEMA).encode("utf-8")
+        self._file.write(MAGIC + HEADER.pack(VERSION, self.chunk_size, len(schema)) + schema)
+
+    def __enter__(self) -> 'ColumnWriter':
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def _write_chunk(self, columns: Dict[str, Any], count: int) -> None:
+        blocks = [COUNT.pack(count)]
+        for name, dtype in SCHEMA:
+            data = zlib.compress(_encode(columns[name], dtype), self.level)
+            blocks.append(LENGTH.pack(len(data)))
+            blocks.append(data)
+        self._file.write(b"".join(blocks))
+        self.count += count
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        pets, self._pending = self._pending, []
+        columns = {name: [getattr(pet, name) for pet in pets] for name, _ in SCHEMA}
+        self._write_chunk(columns, len(pets))
+
+    def write(self, pets: Iterable[Tamagotchi]) -> None:
+        """Append pets, writing a chunk whenever ``chunk_size`` have built up."""
+        for pet in pets:
+            self._pending.append(pet)
+            if len(self._pending) >= self.chunk_size:
+                self._flush_pending()
+
+    def write_population(self, population: PetPopulation) -> None:
+        """Append a whole population straight from its columns."""
+        self._flush_pending()
+        for start in range(0, len(population), self.chunk_size):
+            stop = min(start + self.chunk_size, len(population))
+            columns: Dict[str, Any] = {
+                "name": population.names[start:stop],
+                "profile": population.profiles[start:stop],
+            }
+            for column in COLUMNS:
+                columns[column] = getattr(population, column)[start:stop]
+            self._write_chunk(columns, stop - start)
+
+    def close(self) -> int:
+        """Finish the file and move it into place; returns the pet count."""
+        if self._file is None:
+            return self.count
+        try:
+            self._flush_pending()
+            self._file.write(COUNT.pack(0) + LENGTH.pack(self.count))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+        return self.count
+
+    def discard(self) -> None:
+        """Abandon the file without touching ``path``."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+class ColumnReader:
+    """Reads a column file back one chunk at a time."""
+
+    def __init__(self, path: str) -> None:
+        """Open ``path`` and read its schema."""
+        self.path = path
+        self._file = open(path, 'rb')  # pylint: disable=consider-using-with
+        try:
+            start = self._file.read(len(MAGIC) + HEADER.size)
+            if len(start) < len(MAGIC) + HEADER.size or not start.startswith(MAGIC):
+                raise ValueError(f"{path} is not a pet column file")
+            self.version, self.chunk_size, schema_length = HEADER.unpack_from(start, len(MAGIC))
+            if not 1 <= self.version <= VERSION:
+                raise ValueError(f"{path} is column file version {self.version}, not {VERSION}")
+            self.schema = [tuple(column) for column in json.loads(self._file.read(schema_length))]
+        except BaseException:
+            self._file.close()
+            raise
+        self._data_offset = self._file.tell()
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> 'ColumnReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read(self, size: int) -> bytes:
+        data = self._file.read(size)
+        if len(data) < size:
+            raise ValueError(f"{self.path} is truncated")
+        return data
+
+    def chunks(self, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield each chunk as ``{column: values}``, decoding only ``columns`` (default: all).
+
+        Raises ValueError if the file is truncated or corrupt.
+        """
+        wanted = set(name for name, _ in self.schema) if columns is None else set(columns)
+        self._file.seek(self._data_offset)
+        seen = 0
+        while True:
+            (count,) = COUNT.unpack(self._read(COUNT.size))
+            if count == 0:
+                (total,) = LENGTH.unpack(self._read(LENGTH.size))
+                if total != seen:
+                    raise ValueError(f"{self.path} holds {seen} pets but records {total}")
+                return
+            chunk = {}
+            for name, dtype in self.schema:
+                (length,) = LENGTH.unpack(self._read(LENGTH.size))
+                if name not in wanted:
+                    self._file.seek(length, os.SEEK_CUR)
+                    continue
+                data = self._read(length)
+                try:
+                    chunk[name] = _decode(zlib.decompress(data), dtype, count, self.version)
+                except (zlib.error, ValueError) as error:
+                    raise ValueError(f"{self.path} has a corrupt {name} column") from error
+            seen += count
+            yield chunk
+
+    def populations(self) -> Iterator[PetPopulation]:
+        """Yield each chunk as a PetPopulation."""
+        for chunk in self.chunks():
+            yield PetPopulation.from_columns(
+                chunk["name"], chunk["profile"], **{column: chunk[column] for column in COLUMNS}
+            )
+
+    def pets(self) -> Iterator[Tamagotchi]:
+        """Yield every pet."""
+        for population in self.populations():
+            yield from population.to_pets()
+
+def export_pets(path: str, pets: Iterable[Tamagotchi], chunk_size: Optional[int] = None) -> int:
+    """Write pets from any iterable, e.g. a store's load_many(); returns the pet count."""
+    with ColumnWriter(path, chunk_size) as writer:
+        writer.write(pets)
+    return writer.count
+
+def export_population(path: str, population: PetPopulation, chunk_size: Optional[int] = None) -> int:
+    """Write a whole population; returns the pet count."""
+    with ColumnWriter(path, chunk_size) as writer:
+        writer.write_population(population)
+    return writer.count
+
+def import_population(path: str) -> PetPopulation:
+    """Read a whole column file into one population."""
+    with ColumnReader(path) as reader:
+        chunks = list(reader.chunks())
+    if not chunks:
+        return PetPopulation()
+    return PetPopulation.from_columns(
+        [name for chunk in chunks for name in chunk["name"]],
+        [profile for chunk in chunks for profile in chunk["profile"]],
+        **{column: np.concatenate([chunk[column] for chunk in chunks]) for column in COLUMNS}
+    )
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    # pylint: disable=import-outside-toplevel
+    from .sqlite_store import JSONDirectoryStore, SQLiteStore
+    parser = argparse.ArgumentParser(description="Bulk export and import of pets")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="write every pet to a column file")
+    export.add_argument("source", help="SQLite database or directory of JSON saves")
+    export.add_argument("output", help="column file to write")
+    export.add_argument("--chunk-size", type=int, help="pets per chunk")
+    restore = commands.add_parser("import", help="load a column file into a SQLite database")
+    restore.add_argument("input", help="column file to read")
+    restore.add_argument("database", help="SQLite database to create or update")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        if not os.path.exists(args.source):
+            parser.error(f"{args.source} does not exist")
+        if args.chunk_size is not None and args.chunk_size < 1:
+            parser.error("--chunk-size must be at least 1")
+        if os.path.isdir(args.source):
+            count = export_pets(args.output, JSONDirectoryStore(args.source).load_many(),
+                                args.chunk_size)
+        else:
+            with SQLiteStore(args.source) as store:
+                count = export_pets(args.output, store.load_many(), args.chunk_size)
+        print(f"Exported {count} pets to {args.output}")
+        return 0
+
+    with ColumnReader(args.input) as reader, SQLiteStore(args.database) as store:
+        count = 0
+        for population in reader.populations():
+            store.save_many(population.to_pets())
+            count += len(population)
+    print(f"Imported {count} pets into {args.database}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Append-only binary log of every pet action, with snapshots, compaction and replay.
+
+Each pet has a ``<name>.events`` file: an 8-byte magic, then framed records
+of ``kind, model time, payload length, CRC32`` followed by the payload.
+Actions carry no payload. Snapshots and loads carry the full pet state, and
+the log starts with one. Times are model time (``pet.last_update``), so
+replaying ``update(t)`` then the action reproduces what the player saw.
+"""
+from typing import Dict, Iterator, List, NamedTuple, Optional
+import logging
+import os
+import struct
+import tempfile
+import zlib
+from ..core.pet import Tamagotchi
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TAMAEVT1"
+# kind, model time, payload length; each record is these, a CRC32 and the payload
+FIELDS = struct.Struct("<BdH")
+MAX_PAYLOAD = 0xFFFF
+CRC = struct.Struct("<I")
+RECORD_HEADER_SIZE = FIELDS.size + CRC.size
+# hunger, happiness, energy, last_update, age, is_sleeping, is_alive
+STATE = struct.Struct("<ddddqBB")
+
+KINDS = ("snapshot", "load", "feed", "play", "sleep")
+ACTIONS = ("feed", "play", "sleep")
+_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+class Event(NamedTuple):
+    """One decoded record; ``pet`` is set for snapshots and loads."""
+    kind: str
+    time: float
+    pet: Optional[Tamagotchi]
+
+def _encode_state(pet: Tamagotchi) -> bytes:
+    return STATE.pack(
+        pet.hunger, pet.happiness, pet.energy, pet.last_update, pet.age,
+        pet.is_sleeping, pet.is_alive
+    ) + f"{pet.name}\0{pet.profile}".encode("utf-8")
+
+def _decode_state(payload: bytes) -> Tamagotchi:
+    hunger, happiness, energy, last_update, age, is_sleeping, is_alive = STATE.unpack_from(payload)
+    # Profile names never contain NUL, but pet names may
+    name, profile = payload[STATE.size:].decode("utf-8").rsplit("\0", 1)
+    return Tamagotchi(
+        name, hunger, happiness, energy, last_update, age,
+        bool(is_sleeping), bool(is_alive), profile
+    )
+
+def _frame(kind: str, time: float, payload: bytes = b"") -> bytes:
+    if len(payload) > MAX_PAYLOAD:
+        raise ValueError(
+            f"pet state is {len(payload)} bytes; event log records hold at most {MAX_PAYLOAD}"
+        )
+    fields = FIELDS.pack(_CODES[kind], time, len(payload))
+    return fields + CRC.pack(zlib.crc32(payload, zlib.crc32(fields))) + payload
+
+class EventLog:
+    """Records pet actions and rebuilds a pet's state at any logged time."""
+
+    def __init__(self, save_dir: str = "saves", snapshot_every: Optional[int] = None) -> None:
+        """Log into ``save_dir``, snapshotting after every ``snapshot_every`` actions."""
+        self.save_dir = save_dir
+        self.snapshot_every = (
+            settings.save.EVENT_SNAPSHOT_EVERY if snapshot_every is None else snapshot_every
+        )
+        # Actions since the last state record, per pet seen by this process
+        self._since_state: Dict[str, int] = {}
+        os.makedirs(save_dir, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        """Return the event log file for a pet."""
+        return os.path.join(self.save_dir, f"{name.lower()}.events")
+
+    def _append(self, name: str, data: bytes) -> None:
+        path = self.path(name)
+        with open(path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(MAGIC)
+            f.write(data)
+
+    def _write_state(self, pet: Tamagotchi, kind: str) -> None:
+        self._append(pet.name, _frame(kind, pet.last_update, _encode_state(pet)))
+        self._since_state[pet.name.lower()] = 0
+
+    def snapshot(self, pet: Tamagotchi) -> None:
+        """Record the pet's full state."""
+        self._write_state(pet, "snapshot")
+
+    def loaded(self, pet: Tamagotchi) -> None:
+        """Record that the pet was loaded, with the state it was loaded in."""
+        self._write_state(pet, "load")
+
+    def apply(self, pet: Tamagotchi, action: str) -> None:
+        """Record ``action`` at the pet's model time, then perform it."""
+        if action not in ACTIONS:
+            raise ValueError(f"unknown action: {action}")
+        since = self._since_state.get(pet.name.lower())
+        # Start each process's history with a state, so replay never depends on older records
+        if since is None or since >= self.snapshot_every:
+            self.snapshot(pet)
+        self._append(pet.name, _frame(action, pet.last_update))
+        self._since_state[pet.name.lower()] += 1
+        getattr(pet, action)()
+
+    def events(self, name: str) -> Iterator[Event]:
+        """Yield the pet's records in order, stopping at the first torn or corrupt one."""
+        try:
+            with open(self.path(name), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+        if not data.startswith(MAGIC):
+            logger.warning("%s is not an event log", self.path(name))
+            return
+        offset = len(MAGIC)
+        while offset < len(data):
+            if offset + RECORD_HEADER_SIZE > len(data):
+                logger.warning("Torn record at byte %d of %s", offset, self.path(name))
+                return
+            code, time, length = FIELDS.unpack_from(data, offset)
+            (crc,) = CRC.unpack_from(data, offset + FIELDS.size)
+            start = offset + RECORD_HEADER_SIZE
+            payload = data[start:start + length]
+            expected = zlib.crc32(payload, zlib.crc32(data[offset:offset + FIELDS.size]))
+            if len(payload) < length or crc != expected or code >= len(KINDS):
+                logger.warning("Corrupt record at byte %d of %s", offset, self.path(name))
+                return
+            try:
+                pet = _decode_state(payload) if length else None
+            except (ValueError, struct.error):
+                # Intact but unusable, e.g. a profile that has since been removed
+                logger.warning("Unreadable pet state at byte %d of %s", offset, self.path(name))
+                return
+            yield Event(KINDS[code], time, pet)
+            offset = start + length
+
+    def replay(self, name: str, at: Optional[float] = None) -> Optional[Tamagotchi]:
+        """Rebuild the pet's state at model time ``at`` (default: its last event).
+
+        Returns None if nothing was logged at or before ``at``.
+        """
+        pet = None
+        for event in self.events(name):
+            if at is not None and event.time > at:
+                break
+            if event.pet is not None:
+                pet = event.pet
+            elif pet is not None:
+                pet.update(event.time)
+                getattr(pet, event.kind)()
+        if pet is not None and at is not None:
+            pet.update(at)
+        return pet
+
+    def compact(self, name: str, before: float) -> int:
+        """Drop history before model time ``before``; returns how many records went.
+
+        The rewritten log starts with a snapshot of the state at ``before``.
+        """
+        events: List[Event] = list(self.events(name))
+        kept = [event for event in events if event.time > before]
+        if len(kept) == len(events):
+            return 0
+        start = self.replay(name, before)
+        if start is None:
+            return 0
+        records = [MAGIC, _frame("snapshot", start.last_update, _encode_state(start))]
+        for event in kept:
+            payload = _encode_state(event.pet) if event.pet is not None else b""
+            records.append(_frame(event.kind, event.time, payload))
+
+        path = self.path(name)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b"".join(records))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return len(events) - len(kept)
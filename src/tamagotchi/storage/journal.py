@@ -0,0 +1,165 @@
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional
+import json
+import logging
+import os
+import time
+from .atomic import atomic_write_json
+from ..core.pet import Tamagotchi
+from ..config.settings import settings
+from ..metrics import LOAD_SECONDS, PET_LOADS, PET_SAVES, SAVE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+class SaveJournal:
+    """Write-behind pet persistence: coalesced journal appends compacted into atomic snapshots.
+
+    Each pet has a ``<name>.json`` snapshot (the same file Tamagotchi.save
+    writes) and a ``<name>.journal`` of newline-delimited JSON deltas holding
+    only the fields that changed since the previous write.
+    """
+
+    def __init__(
+        self,
+        save_dir: str = "saves",
+        flush_interval: Optional[float] = None,
+        compact_after: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a journal writing into ``save_dir``."""
+        self.save_dir = save_dir
+        self.flush_interval = (
+            settings.save.FLUSH_INTERVAL if flush_interval is None else flush_interval
+        )
+        self.compact_after = (
+            settings.save.JOURNAL_COMPACT_ENTRIES if compact_after is None else compact_after
+        )
+        self._clock = clock
+        self._persisted: Dict[str, Dict[str, Any]] = {}
+        self._entries: Dict[str, int] = {}
+        self._last_flush: Dict[str, float] = {}
+        os.makedirs(save_dir, exist_ok=True)
+
+    def snapshot_path(self, name: str) -> str:
+        """Return the snapshot file for a pet."""
+        return os.path.join(self.save_dir, f"{name.lower()}.json")
+
+    def journal_path(self, name: str) -> str:
+        """Return the delta journal file for a pet."""
+        return os.path.join(self.save_dir, f"{name.lower()}.journal")
+
+    def load(self, name: str, remember: bool = True) -> Optional[Tamagotchi]:
+        """Load a pet from its snapshot and replay its journal on top.
+
+        With ``remember=False`` the loaded state is not kept for flush(), so
+        reading many pets in one pass holds no per-pet state.
+        """
+        with LOAD_SECONDS.time():
+            pet = self._replay(name, remember)
+        if pet is not None:
+            PET_LOADS.inc()
+        return pet
+
+    def _replay(self, name: str, remember: bool) -> Optional[Tamagotchi]:
+        path = self.snapshot_path(name)
+        try:
+            with open(path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            snapshot_time = state["last_update"]
+        except (KeyError, TypeError):
+            logger.exception("Invalid pet snapshot in %s", path)
+            return None
+
+        entries = 0
+        try:
+            with open(self.journal_path(name), 'r') as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                        # Older deltas are left over from an interrupted compaction
+                        fresh = delta["last_update"] >= snapshot_time
+                    except (ValueError, KeyError, TypeError):
+                        break  # Torn or garbled final append from a crash
+                    if fresh:
+                        state.update(delta)
+                        entries += 1
+        except OSError:
+            pass
+
+        try:
+            pet = Tamagotchi(**state)
+        except (TypeError, ValueError):
+            logger.exception("Invalid pet data in %s", path)
+            return None
+        if not remember:
+            return pet
+        key = pet.name.lower()
+        self._persisted[key] = state
+        self._entries[key] = entries
+        self._last_flush[key] = self._clock()
+        return pet
+
+    def is_dirty(self, pet: Tamagotchi) -> bool:
+        """Return True if the pet changed since it was last written.
+
+        A change of ``last_update`` alone is not worth writing: replaying
+        the older state through Tamagotchi.update() gives the same result.
+        """
+        persisted = self._persisted.get(pet.name.lower())
+        if persisted is None:
+            return True
+        state = asdict(pet)
+        return any(
+            value != persisted.get(field)
+            for field, value in state.items()
+            if field != "last_update"
+        )
+
+    def maybe_flush(self, pet: Tamagotchi) -> bool:
+        """Flush the pet if it is dirty and the flush interval has elapsed."""
+        last_flush = self._last_flush.get(pet.name.lower())
+        if last_flush is not None and self._clock() - last_flush < self.flush_interval:
+            return False
+        return self.flush(pet)
+
+    def flush(self, pet: Tamagotchi) -> bool:
+        """Append the pet's changed fields to its journal if it is dirty."""
+        if not self.is_dirty(pet):
+            return False
+        key = pet.name.lower()
+        persisted = self._persisted.get(key)
+        if persisted is None or self._entries[key] >= self.compact_after:
+            self.snapshot(pet)
+            return True
+
+        with SAVE_SECONDS.time():
+            state = asdict(pet)
+            delta = {
+                field: value
+                for field, value in state.items()
+                if value != persisted.get(field) or field == "last_update"
+            }
+            with open(self.journal_path(pet.name), 'a') as f:
+                f.write(json.dumps(delta, separators=(',', ':')) + "\n")
+        PET_SAVES.inc()
+        self._persisted[key] = state
+        self._entries[key] += 1
+        self._last_flush[key] = self._clock()
+        return True
+
+    def snapshot(self, pet: Tamagotchi) -> None:
+        """Compact the journal into a fresh snapshot of the pet."""
+        key = pet.name.lower()
+        with SAVE_SECONDS.time():
+            state = asdict(pet)
+            atomic_write_json(self.snapshot_path(pet.name), state)
+            # Truncate only after the snapshot is in place; stale deltas are skipped on load
+            with open(self.journal_path(pet.name), 'w'):
+                pass
+        PET_SAVES.inc()
+        self._persisted[key] = state
+        self._entries[key] = 0
+        self._last_flush[key] = self._clock()
@@ -0,0 +1,23 @@
+"""Import JSON pet saves into a SQLite store.
+
+    python -m src.tamagotchi.storage.migrate saves saves/pets.db
+"""
+from typing import List, Optional
+import argparse
+import sys
+from .sqlite_store import SQLiteStore, migrate_json
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Import JSON pet saves into SQLite")
+    parser.add_argument("save_dir", help="directory holding <name>.json saves")
+    parser.add_argument("database", help="SQLite database to create or update")
+    args = parser.parse_args(argv)
+
+    with SQLiteStore(args.database) as store:
+        imported = migrate_json(args.save_dir, store)
+        print(f"Imported {len(imported)} pets into {args.database} ({len(store)} total)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""Fixed-width binary pet records in one memory-mapped file.
+
+Layout: a 64-byte header, then one 56-byte record per pet sorted by
+lowercased name, then a UTF-8 name table and a newline-separated table of
+the rate profiles the records index into. Readers map the file and view the
+records as a NumPy structured array, so opening is O(1), column scans run
+at memory speed and a single pet is found by binary search without
+decoding any other record.
+"""
+from typing import Iterable, Iterator, List, Optional, Union
+import mmap
+import os
+import struct
+import tempfile
+import numpy as np
+from ..core.pet import Tamagotchi
+from ..core.population import PetPopulation
+
+# The magic marks a pet record file and never changes; VERSION says which layout it has
+MAGIC = b"TAMAREC1"
+VERSION = 2
+# magic, version, record size, record count, name table offset, name table size,
+# profile table offset, profile table size
+HEADER = struct.Struct("<8sIIQQQQQ")
+HEADER_SIZE = 64
+
+# names() copies at most this many name bytes at once, and decodes names longer than
+# both this cap and four times the median length one by one
+NAME_BLOCK_BYTES = 1 << 20
+NAME_WIDTH_CAP = 64
+
+FLAG_SLEEPING = 1
+FLAG_ALIVE = 2
+
+RECORD_DTYPE = np.dtype([
+    ("hunger", "<f8"),
+    ("happiness", "<f8"),
+    ("energy", "<f8"),
+    ("last_update", "<f8"),
+    ("age", "<i8"),
+    ("name_offset", "<u8"),
+    ("name_length", "<u4"),
+    ("flags", "u1"),
+    ("profile", "u1"),
+    ("_pad", "V2"),
+])
+
+def write_population(path: str, population: PetPopulation) -> int:
+    """Write a population as a record file, atomically; returns the pet count."""
+    count = len(population)
+    encoded = [name.encode("utf-8") for name in population.names]
+    order = np.array(
+        sorted(range(count), key=lambda index: population.names[index].lower()),
+        dtype=np.int64
+    )
+
+    records = np.zeros(count, dtype=RECORD_DTYPE)
+    for column in ("hunger", "happiness", "energy", "last_update", "age"):
+        records[column] = getattr(population, column)[order]
+    flags = np.where(population.is_sleeping[order], FLAG_SLEEPING, 0)
+    flags |= np.where(population.is_alive[order], FLAG_ALIVE, 0)
+    records["flags"] = flags
+
+    lengths = np.array([len(encoded[index]) for index in order], dtype=np.uint64)
+    offsets = np.zeros(count, dtype=np.uint64)
+    if count:
+        offsets[1:] = np.cumsum(lengths)[:-1]
+    records["name_offset"] = offsets
+    records["name_length"] = lengths
+    name_table = b"".join(encoded[index] for index in order)
+
+    profiles = sorted(set(population.profiles))
+    if len(profiles) > 256:
+        raise ValueError("a record file holds at most 256 distinct rate profiles")
+    profile_ids = {profile: number for number, profile in enumerate(profiles)}
+    records["profile"] = [profile_ids[population.profiles[index]] for index in order]
+    profile_table = "\n".join(profiles).encode("utf-8")
+
+    names_offset = HEADER_SIZE + records.nbytes
+    profiles_offset = names_offset + len(name_table)
+    header = HEADER.pack(
+        MAGIC, VERSION, RECORD_DTYPE.itemsize, count, names_offset, len(name_table),
+        profiles_offset, len(profile_table)
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            f.write(records.tobytes())
+            f.write(name_table)
+            f.write(profile_table)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
+
+def write_records(path: str, pets: Iterable[Tamagotchi]) -> int:
+    """Write pets as a record file, atomically; returns the pet count."""
+    return write_population(path, PetPopulation.from_pets(pets))
+
+class RecordFile:
+    """Read-only, memory-mapped view of a record file."""
+
+    def __init__(self, path: str) -> None:
+        """Map ``path``; nothing beyond the header is read until it is used."""
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, record_size, count, names_offset, names_size,
+         profiles_offset, profiles_size) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a pet record file")
+        if version != VERSION or record_size != RECORD_DTYPE.itemsize:
+            self._mmap.close()
+            raise ValueError(
+                f"{path} is a version {version} pet record file, not version {VERSION}"
+            )
+        self._names_offset = names_offset
+        self._names_size = names_size
+        profile_table = self._mmap[profiles_offset:profiles_offset + profiles_size]
+        self.profile_names: List[str] = profile_table.decode("utf-8").split("\n")
+        self.records = np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=count,
+                                     offset=HEADER_SIZE)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self.records = self.records[:0].copy()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # A caller still holds a column view; the mapping goes with it
+
+    def __enter__(self) -> 'RecordFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getattr__(self, column: str) -> np.ndarray:
+        # Zero-copy column views, e.g. records.hunger < 20
+        if column in ("hunger", "happiness", "energy", "last_update", "age"):
+            return self.records[column]
+        raise AttributeError(column)
+
+    @property
+    def is_sleeping(self) -> np.ndarray:
+        """Boolean column of sleeping pets."""
+        return (self.records["flags"] & FLAG_SLEEPING) != 0
+
+    @property
+    def is_alive(self) -> np.ndarray:
+        """Boolean column of living pets."""
+        return (self.records["flags"] & FLAG_ALIVE) != 0
+
+    def name(self, index: int) -> str:
+        """Decode one pet's name from the name table."""
+        record = self.records[index]
+        start = self._names_offset + int(record["name_offset"])
+        return self._mmap[start:start + int(record["name_length"])].decode("utf-8")
+
+    def pet(self, index: int) -> Tamagotchi:
+        """Decode one pet."""
+        record = self.records[index]
+        flags = int(record["flags"])
+        return Tamagotchi(
+            self.name(index),
+            float(record["hunger"]),
+            float(record["happiness"]),
+            float(record["energy"]),
+            float(record["last_update"]),
+            int(record["age"]),
+            bool(flags & FLAG_SLEEPING),
+            bool(flags & FLAG_ALIVE),
+            self.profile_names[int(record["profile"])],
+        )
+
+    def find(self, name: str) -> Optional[int]:
+        """Return the index of a pet by name, by binary search over the sorted records."""
+        key = name.lower()
+        low, high = 0, len(self.records)
+        while low < high:
+            middle = (low + high) // 2
+            if self.name(middle).lower() < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.records) and self.name(low).lower() == key:
+            return low
+        return None
+
+    def load(self, name: str) -> Optional[Tamagotchi]:
+        """Decode one pet by name, or None if it isn't in the file."""
+        index = self.find(name)
+        return None if index is None else self.pet(index)
+
+    def pets(self, where: Union[np.ndarray, Iterable[int], None] = None) -> Iterator[Tamagotchi]:
+        """Decode the pets selected by a boolean mask or indices, or every pet."""
+        if where is None:
+            indices: Iterable[int] = range(len(self.records))
+        elif isinstance(where, np.ndarray) and where.dtype == np.bool_:
+            indices = np.flatnonzero(where).tolist()
+        else:
+            indices = where
+        return (self.pet(index) for index in indices)
+
+    def names(self) -> List[str]:
+        """Decode every name, a block of records at a time, via fixed-width copies."""
+        offsets = self.records["name_offset"].astype(np.int64)
+        lengths = self.records["name_length"].astype(np.int64)
+        if not len(lengths) or not lengths.max():
+            return [""] * len(lengths)
+        table = np.frombuffer(self._mmap, dtype=np.uint8, count=self._names_size,
+                              offset=self._names_offset)
+        # Fixed-width bytes drop trailing NULs, so names ending in one take the slow path
+        if np.any(table[(offsets + lengths - 1)[lengths > 0]] == 0):
+            return [self.name(index) for index in range(len(self.records))]
+        # Names far longer than usual are decoded alone, so they don't widen every row
+        cap = max(NAME_WIDTH_CAP, 4 * int(np.median(lengths)))
+        long_names = np.flatnonzero(lengths > cap)
+        lengths[long_names] = 0
+        rows = max(1, NAME_BLOCK_BYTES // min(cap, int(lengths.max()) or 1))
+        names: List[str] = []
+        for start in range(0, len(lengths), rows):
+            block_offsets = offsets[start:start + rows]
+            block_lengths = lengths[start:start + rows]
+            width = int(block_lengths.max())
+            if not width:
+                names.extend([""] * len(block_lengths))
+                continue
+            columns = np.arange(width)
+            inside = columns < block_lengths[:, None]
+            positions = np.where(inside, block_offsets[:, None] + columns, 0)
+            fixed = np.where(inside, table[positions], 0)
+            raw = fixed.astype(np.uint8).view(f"S{width}").ravel().tolist()
+            names.extend(name.decode("utf-8") for name in raw)
+        for index in long_names.tolist():
+            names[index] = self.name(index)
+        return names
+
+    def to_population(self) -> PetPopulation:
+        """Copy every pet into a PetPopulation with bulk column copies."""
+        return PetPopulation.from_columns(
+            self.names(),
+            np.array(self.profile_names, dtype=object)[self.records["profile"]].tolist(),
+            hunger=self.records["hunger"],
+            happiness=self.records["happiness"],
+            energy=self.records["energy"],
+            last_update=self.records["last_update"],
+            age=self.records["age"],
+            is_sleeping=self.is_sleeping,
+            is_alive=self.is_alive,
+        )
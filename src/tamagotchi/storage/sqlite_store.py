@@ -0,0 +1,191 @@
+from dataclasses import astuple, fields
+from typing import Iterable, Iterator, List, Optional
+import contextlib
+import os
+import sqlite3
+from .journal import SaveJournal
+from ..core.pet import Tamagotchi
+
+_FIELDS = [f.name for f in fields(Tamagotchi)]
+
+class JSONDirectoryStore:
+    """The classic one-``<name>.json``-per-pet layout behind the store interface."""
+
+    def __init__(self, save_dir: str = "saves") -> None:
+        self.save_dir = save_dir
+        self._journal = SaveJournal(save_dir)
+
+    def save(self, pet: Tamagotchi) -> None:
+        """Write one pet."""
+        self._journal.snapshot(pet)
+
+    def save_many(self, pets: Iterable[Tamagotchi]) -> None:
+        """Write many pets."""
+        for pet in pets:
+            self.save(pet)
+
+    def load(self, name: str) -> Optional[Tamagotchi]:
+        """Load one pet, replaying its journal if it has one."""
+        # save() always writes a full snapshot, so there is no flush state worth keeping
+        return self._journal.load(name, remember=False)
+
+    def load_many(self, names: Optional[Iterable[str]] = None) -> Iterator[Tamagotchi]:
+        """Load the named pets, or every pet."""
+        for name in self.names() if names is None else names:
+            pet = self.load(name)
+            if pet is not None:
+                yield pet
+
+    def names(self) -> List[str]:
+        """Return the saved pet names."""
+        return sorted(
+            filename[:-len(".json")]
+            for filename in os.listdir(self.save_dir)
+            if filename.endswith(".json") and not filename.startswith(".")
+        )
+
+class SQLiteStore:
+    """Many pets in one SQLite database, indexed by lowercased name."""
+
+    def __init__(self, path: str = os.path.join("saves", "pets.db")) -> None:
+        """Open (and if needed create) the database at ``path``."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pets ("
+            " key TEXT PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " hunger REAL NOT NULL,"
+            " happiness REAL NOT NULL,"
+            " energy REAL NOT NULL,"
+            " last_update REAL NOT NULL,"
+            " age INTEGER NOT NULL,"
+            " is_sleeping INTEGER NOT NULL,"
+            " is_alive INTEGER NOT NULL,"
+            " profile TEXT NOT NULL DEFAULT 'default'"
+            ") WITHOUT ROWID"
+        )
+        # Databases written before rate profiles existed lack the column
+        existing = {row[1] for row in self._connection.execute("PRAGMA table_info(pets)")}
+        if "profile" not in existing:
+            self._connection.execute(
+                "ALTER TABLE pets ADD COLUMN profile TEXT NOT NULL DEFAULT 'default'"
+            )
+        self._connection.commit()
+        self._depth = 0
+        columns = ", ".join(_FIELDS)
+        self._insert = (
+            f"INSERT OR REPLACE INTO pets (key, {columns}) "
+            f"VALUES (?, {', '.join('?' for _ in _FIELDS)})"
+        )
+        self._select = f"SELECT {columns} FROM pets"
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def __enter__(self) -> 'SQLiteStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator['SQLiteStore']:
+        """Group every write inside the block into one transaction."""
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self._connection.rollback()
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self._connection.commit()
+
+    def _commit(self) -> None:
+        if self._depth == 0:
+            self._connection.commit()
+
+    @staticmethod
+    def _row(pet: Tamagotchi) -> tuple:
+        return (pet.name.lower(),) + astuple(pet)
+
+    @staticmethod
+    def _pet(row: tuple) -> Tamagotchi:
+        name, hunger, happiness, energy, last_update, age, is_sleeping, is_alive, profile = row
+        return Tamagotchi(
+            name, hunger, happiness, energy, last_update, age,
+            bool(is_sleeping), bool(is_alive), profile
+        )
+
+    def save(self, pet: Tamagotchi) -> None:
+        """Write one pet."""
+        self._connection.execute(self._insert, self._row(pet))
+        self._commit()
+
+    def save_many(self, pets: Iterable[Tamagotchi]) -> None:
+        """Write many pets in a single transaction."""
+        with self.batch():
+            self._connection.executemany(self._insert, (self._row(pet) for pet in pets))
+
+    def load(self, name: str) -> Optional[Tamagotchi]:
+        """Load one pet by name, or None if it isn't stored."""
+        row = self._connection.execute(
+            f"{self._select} WHERE key = ?", (name.lower(),)
+        ).fetchone()
+        return None if row is None else self._pet(row)
+
+    def load_many(self, names: Optional[Iterable[str]] = None) -> Iterator[Tamagotchi]:
+        """Load the named pets, or every pet, streaming rows from the database."""
+        if names is None:
+            cursor = self._connection.execute(f"{self._select} ORDER BY key")
+            for row in cursor:
+                yield self._pet(row)
+            return
+        keys = [name.lower() for name in names]
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            cursor = self._connection.execute(
+                f"{self._select} WHERE key IN ({', '.join('?' for _ in chunk)})", chunk
+            )
+            for row in cursor:
+                yield self._pet(row)
+
+    def names(self) -> List[str]:
+        """Return every stored pet name."""
+        return [row[0] for row in self._connection.execute("SELECT name FROM pets ORDER BY key")]
+
+    def delete(self, name: str) -> None:
+        """Remove a pet."""
+        self._connection.execute("DELETE FROM pets WHERE key = ?", (name.lower(),))
+        self._commit()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM pets").fetchone()[0]
+
+def migrate_json(save_dir: str, store: SQLiteStore) -> List[str]:
+    """Import every ``<name>.json`` save (plus its journal) into ``store``.
+
+    Files that aren't valid pet saves are skipped; returns the imported names.
+    """
+    source = JSONDirectoryStore(save_dir)
+    pets = []
+    for name in source.names():
+        try:
+            pet = source.load(name)
+        except (TypeError, KeyError, ValueError):
+            # ValueError covers bad JSON and unknown rate profiles
+            pet = None
+        if pet is not None:
+            pets.append(pet)
+    store.save_many(pets)
+    return [pet.name for pet in pets]
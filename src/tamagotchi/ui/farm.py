@@ -0,0 +1,251 @@
+"""Scrollable grid of many pets that animates only the ones in view.
+
+    python -m src.tamagotchi.ui.farm --pets 5000
+
+Canvas items exist only for a pool of cells that covers the viewport; each
+cell shows the pet at ``index`` where ``index % len(cells)`` is the cell, so
+scrolling by a row re-targets one row of cells and leaves the rest alone.
+One after() timer drives every visible pet, and all of a frame's canvas
+changes happen in that one callback, so Tk repaints once per frame.
+"""
+from typing import Any, List, Optional, Tuple
+import argparse
+import math
+import random
+import sys
+import time
+import tkinter as tk
+import numpy as np
+from ..clock import Clock, MonotonicClock, get_clock
+from ..config.profiles import PROFILES
+from ..config.settings import settings
+from ..core.pet import Tamagotchi
+from ..core.population import PetPopulation
+from ..metrics import RENDER_SECONDS, TICK_SECONDS
+from ..pet_sprite import FRAME_COUNT, SPRITE_SIZE, appearance_for, claim_frame_cache, shared_frame
+from .overlay import FrameStats, PerfOverlay
+from .retained import RetainedBar, RetainedImage
+
+def visible_range(top: float, height: float, columns: int, count: int) -> Tuple[int, int]:
+    """Return the first and one-past-last pet index in view when scrolled ``top`` pixels down."""
+    cell_height = settings.farm.CELL_HEIGHT
+    first_row = max(0, int(top // cell_height))
+    last_row = math.ceil((top + height) / cell_height)
+    return min(count, first_row * columns), min(count, last_row * columns)
+
+def animation_states(population: PetPopulation, start: int, stop: int) -> np.ndarray:
+    """Pick the animation of pets ``start:stop``: mood() over whole columns, dead pets sick."""
+    alive = population.is_alive[start:stop]
+    return np.select(
+        [
+            ~alive,
+            population.is_sleeping[start:stop],
+            population.happiness[start:stop] > settings.ui.HAPPY_THRESHOLD,
+            population.hunger[start:stop] < settings.ui.SICK_THRESHOLD,
+        ],
+        ["sick", "sleep", "happy", "sick"],
+        "idle",
+    )
+
+class _Cell:
+    """The canvas items for one grid slot: sprite, name and three mini stat bars."""
+
+    def __init__(self, canvas: tk.Canvas) -> None:
+        self.canvas = canvas
+        self.index = -1  # The pet shown, or -1 before the first placement
+        self.image = RetainedImage(canvas, 0, 0)
+        self.label = canvas.create_text(0, 0, fill=settings.game.WHITE, font=("Courier", 8))
+        self.bars = [
+            RetainedBar(canvas, settings.farm.BAR_WIDTH, settings.farm.BAR_HEIGHT, color)
+            for color in (settings.game.RED, settings.game.YELLOW, settings.game.GREEN)
+        ]
+
+    def place(self, index: int, columns: int, name: str) -> None:
+        """Move every item to the grid position of pet ``index``."""
+        self.index = index
+        left = index % columns * settings.farm.CELL_WIDTH
+        top = index // columns * settings.farm.CELL_HEIGHT
+        center = left + settings.farm.CELL_WIDTH / 2
+        self.image.move(center, top + 4 + SPRITE_SIZE[1] / 2)
+        self.canvas.coords(self.label, center, top + SPRITE_SIZE[1] + 12)
+        self.canvas.itemconfig(self.label, text=name)
+        bar_left = left + (settings.farm.CELL_WIDTH - settings.farm.BAR_WIDTH) / 2
+        for row, bar in enumerate(self.bars):
+            bar.move(bar_left, top + SPRITE_SIZE[1] + 22 + row * (settings.farm.BAR_HEIGHT + 2))
+
+class FarmView:
+    """A scrollable grid of a PetPopulation with one shared animation timer."""
+
+    def __init__(
+        self,
+        root: Any,
+        population: PetPopulation,
+        clock: Optional[Clock] = None,
+        stats: Optional[FrameStats] = None,
+    ) -> None:
+        """Build the view inside ``root``; pack or grid ``view.frame`` to show it."""
+        self.root = root
+        self.population = population
+        # Model time for the pets; animation stays on real time like PetSprite
+        self.clock = clock if clock is not None else get_clock()
+        self.animation_clock = MonotonicClock()
+        self.stats = stats if stats is not None else FrameStats()
+        self.appearances = [appearance_for(name) for name in population.names]
+
+        self.frame = tk.Frame(root, bg=settings.game.BLACK)
+        toolbar = tk.Frame(self.frame, bg=settings.game.BLACK)
+        toolbar.pack(side=tk.TOP, fill=tk.X)
+        for text, action in (("Feed all", population.feed), ("Play all", population.play),
+                             ("Sleep all", population.sleep)):
+            tk.Button(toolbar, text=text, command=lambda act=action: self._care(act)).pack(
+                side=tk.LEFT, padx=4, pady=4
+            )
+        self.canvas = tk.Canvas(
+            self.frame,
+            bg=settings.game.BLACK,
+            highlightthickness=0,
+            yscrollincrement=settings.farm.CELL_HEIGHT,
+        )
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        claim_frame_cache(self.canvas)
+
+        self.columns = 1
+        self.cells: List[_Cell] = []
+        self.visible = (0, 0)
+        self._bars_due = True
+        self._next_tick = 0.0
+        self._due: Optional[float] = None
+        self._pending: Optional[str] = None
+
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<MouseWheel>", lambda event: self._scroll(-event.delta // 120))
+        self.canvas.bind("<Button-4>", lambda event: self._scroll(-1))
+        self.canvas.bind("<Button-5>", lambda event: self._scroll(1))
+        self._pending = root.after_idle(self._frame)
+
+    def _scroll(self, rows: int) -> None:
+        self.canvas.yview_scroll(rows, "units")
+
+    def _care(self, action: Any) -> None:
+        action()
+        self._bars_due = True
+
+    def _on_resize(self, event: Any) -> None:
+        columns = max(1, event.width // settings.farm.CELL_WIDTH)
+        rows = math.ceil(event.height / settings.farm.CELL_HEIGHT) + 1
+        total_rows = math.ceil(len(self.population) / columns)
+        self.canvas.configure(scrollregion=(
+            0, 0, columns * settings.farm.CELL_WIDTH, total_rows * settings.farm.CELL_HEIGHT
+        ))
+        if columns != self.columns or columns * rows != len(self.cells):
+            # A new shape means a new pool; every cell is placed afresh
+            self.canvas.delete("all")
+            self.columns = columns
+            self.cells = [_Cell(self.canvas) for _ in range(columns * rows)]
+        self._layout()
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        self._layout()
+
+    def _layout(self) -> None:
+        if not self.cells:
+            return
+        self.visible = visible_range(
+            self.canvas.canvasy(0), self.canvas.winfo_height(), self.columns, len(self.population)
+        )
+        names = self.population.names
+        for index in range(*self.visible):
+            cell = self.cells[index % len(self.cells)]
+            if cell.index != index:
+                cell.place(index, self.columns, names[index])
+                self._bars_due = True
+
+    def _frame(self) -> None:
+        lag = 0.0 if self._due is None else time.perf_counter() - self._due
+        self._due = time.perf_counter() + settings.farm.FRAME_MS / 1000
+        self._pending = self.root.after(settings.farm.FRAME_MS, self._frame)
+        self.stats.begin_frame(lag)
+        if time.perf_counter() >= self._next_tick:
+            with TICK_SECONDS.time(), self.stats.phase("update"):
+                self.population.update(self.clock())
+            self._next_tick = time.perf_counter() + settings.farm.TICK_MS / 1000
+            self._bars_due = True
+        with RENDER_SECONDS.time(), self.stats.phase("render"):
+            self._render()
+        self.stats.end_frame()
+
+    def _render(self) -> None:
+        start, stop = self.visible
+        if not self.cells or start == stop:
+            return
+        frame = int(self.animation_clock() * 1000 // settings.farm.FRAME_MS) % FRAME_COUNT
+        states = animation_states(self.population, start, stop).tolist()
+        alive = self.population.is_alive[start:stop].tolist()
+        stats = None
+        if self._bars_due:
+            stats = zip(
+                self.population.hunger[start:stop].tolist(),
+                self.population.happiness[start:stop].tolist(),
+                self.population.energy[start:stop].tolist(),
+            )
+            self._bars_due = False
+        for offset, index in enumerate(range(start, stop)):
+            cell = self.cells[index % len(self.cells)]
+            # The dead hold still on their first frame
+            shown = frame if alive[offset] else 0
+            cell.image.show(shared_frame(self.appearances[index], states[offset], shown))
+            if stats is not None:
+                for bar, value in zip(cell.bars, next(stats)):
+                    bar.set_value(value)
+
+    def destroy(self) -> None:
+        """Stop the timer and remove the view."""
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+        self.frame.destroy()
+
+def random_population(count: int, seed: int = 0) -> PetPopulation:
+    """Build ``count`` pets with varied stats and profiles, e.g. for trying the view out."""
+    rng = random.Random(seed)
+    profiles = ["default"] + sorted(PROFILES)
+    now = get_clock()()
+    return PetPopulation.from_pets(
+        Tamagotchi(
+            f"Pet{i}",
+            hunger=rng.uniform(20, 100),
+            happiness=rng.uniform(20, 100),
+            energy=rng.uniform(0, 100),
+            last_update=now,
+            is_sleeping=rng.random() < 0.2,
+            profile=rng.choice(profiles),
+        )
+        for i in range(count)
+    )
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Show many pets in one scrollable window")
+    parser.add_argument("--pets", type=int, default=1000, help="number of pets to show")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for their stats")
+    args = parser.parse_args(argv)
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Cannot open a window: {e}", file=sys.stderr)
+        return 1
+    root.title(f"{settings.game.TITLE} Farm")
+    root.geometry(f"{settings.game.WINDOW_WIDTH * 2}x{settings.game.WINDOW_HEIGHT}")
+    view = FarmView(root, random_population(args.pets, args.seed))
+    view.frame.pack(fill=tk.BOTH, expand=True)
+    PerfOverlay(root, view.stats)
+    root.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Process-wide LRU cache of rendered sprite frames, bounded by bytes."""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+class FrameCache:
+    """Least-recently-used frames, evicted once their total size passes ``max_bytes``.
+
+    A displayed frame survives eviction because the canvas item showing it
+    holds a reference (see RetainedImage); it is only re-rendered on next use.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Whatever the frames belong to, e.g. the Tk interpreter that created them
+        self.owner: Any = None
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the frame for ``key`` and mark it recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, frame: Any, size: int) -> None:
+        """Store ``frame`` taking ``size`` bytes, evicting the least recently used."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous[1]
+        self._entries[key] = (frame, size)
+        self.bytes += size
+        # The newest frame always stays, even if it alone is over budget
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """Drop ``key`` if cached."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Drop every frame."""
+        self._entries.clear()
+        self.bytes = 0
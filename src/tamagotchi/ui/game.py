@@ -1,15 +1,21 @@
 from typing import Dict, Optional
+import math
 import tkinter as tk
 from tkinter import ttk
 import time
+from ..clock import Clock, get_clock
 from ..core.pet import Tamagotchi
 from ..config.settings import settings
+from ..metrics import RENDER_SECONDS, TICK_SECONDS
+from .overlay import FrameStats, PerfOverlay
+from .scheduler import UpdateScheduler
 
 class Game:
     """Main game class handling the tkinter interface and game loop."""
     
-    def __init__(self) -> None:
-        """Initialize the game window and UI elements."""
+    def __init__(self, clock: Optional[Clock] = None) -> None:
+        """Initialize the game window and UI elements, reading model time from ``clock``."""
+        self.clock = clock if clock is not None else get_clock()
         self.root = tk.Tk()
         self.root.title(settings.game.TITLE)
         self.root.geometry(f"{settings.game.WINDOW_WIDTH}x{settings.game.WINDOW_HEIGHT}")
@@ -26,11 +32,18 @@ class Game:
         # Create UI elements
         self._create_widgets()
         
+        # Redraw only when something visible is due to change
+        self.scheduler = UpdateScheduler(self.root, self._update)
+        
+        # Frame timing behind the F3 overlay
+        self.frame_stats = FrameStats()
+        self.overlay = PerfOverlay(self.root, self.frame_stats)
+        
         # Start with new pet
         self.create_new_pet()
         
         # Start update loop
-        self._update()
+        self.scheduler.wake()
 
     def _create_widgets(self) -> None:
         """Create all UI widgets."""
@@ -153,12 +166,13 @@ class Game:
         # Clear and focus input
         self.input_entry.delete(0, tk.END)
         self.input_entry.focus()
+        self.scheduler.wake()
 
     def _on_name_enter(self, event: Optional[tk.Event] = None) -> None:
         """Handle pet name entry."""
         name = self.input_entry.get().strip()
         if name:
-            self.pet = Tamagotchi(name)
+            self.pet = Tamagotchi(name, last_update=self.clock())
             self.input_active = False
             
             # Hide input frame and show other elements
@@ -175,61 +189,80 @@ class Game:
             self.play_button.grid()
             self.sleep_button.grid()
             self.new_pet_button.grid()
+            self.scheduler.wake()
 
     def _on_feed(self) -> None:
         """Handle feed button click."""
         if self.pet and self.pet.is_alive and not self.pet.is_sleeping:
             self.pet.feed()
+            self.scheduler.wake()
 
     def _on_play(self) -> None:
         """Handle play button click."""
         if self.pet and self.pet.is_alive and not self.pet.is_sleeping:
             self.pet.play()
+            self.scheduler.wake()
 
     def _on_sleep(self) -> None:
         """Handle sleep button click."""
         if self.pet and self.pet.is_alive:
             self.pet.sleep()
+            self.scheduler.wake()
 
-    def _update(self) -> None:
-        """Update game state and UI."""
-        if self.pet:
-            self.pet.update()
-            
-            # Update UI
-            self.name_label.config(text=self.pet.name)
+    def _render(self) -> None:
+        """Push the pet's state into the widgets."""
+        # Update UI
+        self.name_label.config(text=self.pet.name)
+        self.status_label.config(
+            text="Sleeping..." if self.pet.is_sleeping else "Awake"
+        )
+        
+        # Update status bars
+        self.hunger_bar['value'] = self.pet.hunger
+        self.hunger_label.config(text=f"Hunger: {int(self.pet.hunger)}")
+        
+        self.happiness_bar['value'] = self.pet.happiness
+        self.happiness_label.config(text=f"Happiness: {int(self.pet.happiness)}")
+        
+        self.energy_bar['value'] = self.pet.energy
+        self.energy_label.config(text=f"Energy: {int(self.pet.energy)}")
+        
+        # Update button states
+        state = 'normal' if self.pet.is_alive and not self.pet.is_sleeping else 'disabled'
+        self.feed_button['state'] = state
+        self.play_button['state'] = state
+        
+        # Show death message if pet died
+        if not self.pet.is_alive:
             self.status_label.config(
-                text="Sleeping..." if self.pet.is_sleeping else "Awake"
+                text="Your pet has passed away...",
+                foreground='red'
             )
-            
-            # Update status bars
-            self.hunger_bar['value'] = self.pet.hunger
-            self.hunger_label.config(text=f"Hunger: {int(self.pet.hunger)}")
-            
-            self.happiness_bar['value'] = self.pet.happiness
-            self.happiness_label.config(text=f"Happiness: {int(self.pet.happiness)}")
-            
-            self.energy_bar['value'] = self.pet.energy
-            self.energy_label.config(text=f"Energy: {int(self.pet.energy)}")
-            
-            # Update button states
-            state = 'normal' if self.pet.is_alive and not self.pet.is_sleeping else 'disabled'
-            self.feed_button['state'] = state
-            self.play_button['state'] = state
-            
-            # Show death message if pet died
-            if not self.pet.is_alive:
-                self.status_label.config(
-                    text="Your pet has passed away...",
-                    foreground='red'
-                )
-                self.feed_button.grid_remove()
-                self.play_button.grid_remove()
-                self.sleep_button.grid_remove()
-                self.new_pet_button.grid()
-        
-        # Schedule next update
-        self.root.after(1000 // settings.game.FPS, self._update)
+            self.feed_button.grid_remove()
+            self.play_button.grid_remove()
+            self.sleep_button.grid_remove()
+            self.new_pet_button.grid()
+
+    def _update(self) -> float:
+        """Update game state and UI, returning seconds until the next visible change."""
+        if self.pet:
+            self.frame_stats.begin_frame(self.scheduler.lag)
+            with TICK_SECONDS.time(), self.frame_stats.phase("update"):
+                self.pet.update(self.clock())
+            with RENDER_SECONDS.time(), self.frame_stats.phase("render"):
+                self._render()
+            self.frame_stats.end_frame()
+
+            # Labels show whole numbers, bars move every 100 / BAR_WIDTH points
+            model_seconds = self.pet.seconds_until_change(
+                resolution=min(1.0, 100 / settings.ui.BAR_WIDTH),
+                thresholds=(settings.ui.HAPPY_THRESHOLD, settings.ui.SICK_THRESHOLD)
+            )
+            # An accelerated clock reaches the change sooner in real time
+            return model_seconds / self.clock.rate if self.clock.rate > 0 else math.inf
+        
+        # Nothing changes on its own until a pet exists
+        return math.inf
 
     def run(self) -> None:
         """Start the game."""
@@ -0,0 +1,164 @@
+"""Frame timing, an on-screen performance overlay and mainloop profiling."""
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, Optional
+import contextlib
+import cProfile
+import os
+import time
+import tkinter as tk
+from ..config.settings import settings
+
+class FrameStats:
+    """Rolling frame times, after() jitter and per-phase durations."""
+
+    def __init__(self, window: Optional[int] = None) -> None:
+        """Keep the last ``window`` samples of each series."""
+        self.window = settings.debug.OVERLAY_WINDOW if window is None else window
+        self.frames: Deque[float] = deque(maxlen=self.window)
+        self.jitter: Deque[float] = deque(maxlen=self.window)
+        self.phases: Dict[str, Deque[float]] = {}
+        self._frame_start: Optional[float] = None
+
+    def begin_frame(self, lag: float = 0.0) -> None:
+        """Start timing a frame that ran ``lag`` seconds after it was due."""
+        self.jitter.append(lag)
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Finish timing the current frame."""
+        if self._frame_start is not None:
+            self.frames.append(time.perf_counter() - self._frame_start)
+            self._frame_start = None
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Add one duration for ``phase``."""
+        samples = self.phases.get(phase)
+        if samples is None:
+            samples = self.phases[phase] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the block as one sample of phase ``name``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    @staticmethod
+    def _describe(samples: Deque[float]) -> Dict[str, float]:
+        if not samples:
+            return {"mean_ms": 0.0, "max_ms": 0.0}
+        return {
+            "mean_ms": sum(samples) / len(samples) * 1e3,
+            "max_ms": max(samples) * 1e3,
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Return mean and max milliseconds for frames, jitter and each phase."""
+        return {
+            "frame": self._describe(self.frames),
+            "jitter": self._describe(self.jitter),
+            "phases": {name: self._describe(samples) for name, samples in self.phases.items()},
+        }
+
+    def text(self) -> str:
+        """Render the summary as the overlay shows it."""
+        summary = self.summary()
+        lines = [
+            f"frame  {summary['frame']['mean_ms']:7.2f} ms  max {summary['frame']['max_ms']:7.2f}",
+            f"jitter {summary['jitter']['mean_ms']:7.2f} ms  max {summary['jitter']['max_ms']:7.2f}",
+        ]
+        for name, stats in sorted(summary["phases"].items()):
+            lines.append(f"{name:<6} {stats['mean_ms']:7.2f} ms  max {stats['max_ms']:7.2f}")
+        return "\n".join(lines)
+
+class ProfileCapture:
+    """Profiles the Tk mainloop for a fixed time and writes a pstats file."""
+
+    def __init__(self, root: Any) -> None:
+        self.root = root
+        self._profile: Optional[cProfile.Profile] = None
+        self.path: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        """True while a capture is in progress."""
+        return self._profile is not None
+
+    def start(self, seconds: Optional[float] = None, path: Optional[str] = None) -> Optional[str]:
+        """Profile every callback for the next ``seconds``; returns the output path.
+
+        Returns None if a capture is already running.
+        """
+        if self._profile is not None:
+            return None
+        if seconds is None:
+            seconds = settings.debug.PROFILE_SECONDS
+        if path is None:
+            os.makedirs(settings.debug.PROFILE_DIR, exist_ok=True)
+            path = os.path.join(
+                settings.debug.PROFILE_DIR, time.strftime("mainloop-%Y%m%d-%H%M%S.pstats")
+            )
+        self.path = path
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self.root.after(int(seconds * 1000), self.stop)
+        return path
+
+    def stop(self) -> None:
+        """End the capture early or on schedule and write the stats."""
+        if self._profile is None:
+            return
+        self._profile.disable()
+        self._profile.dump_stats(self.path)
+        self._profile = None
+
+class PerfOverlay:
+    """A key-toggled label over the window showing FrameStats, plus a profiling key.
+
+    While hidden it schedules nothing, so it costs only the timing itself.
+    """
+
+    def __init__(self, root: Any, stats: FrameStats) -> None:
+        """Bind the overlay and profiling keys from settings.debug on ``root``."""
+        self.root = root
+        self.stats = stats
+        self.profiler = ProfileCapture(root)
+        self.label = tk.Label(
+            root,
+            font=("Courier", 9),
+            justify=tk.LEFT,
+            anchor="nw",
+            bg=settings.game.BLACK,
+            fg=settings.game.GREEN,
+        )
+        self.visible = False
+        self._pending: Optional[str] = None
+        root.bind(settings.debug.OVERLAY_KEY, lambda event: self.toggle())
+        root.bind(settings.debug.PROFILE_KEY, lambda event: self.profile())
+
+    def toggle(self) -> None:
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        if self.visible:
+            self.label.place(x=0, y=0)
+            self.label.lift()
+            self._refresh()
+        else:
+            self.label.place_forget()
+            if self._pending is not None:
+                self.root.after_cancel(self._pending)
+                self._pending = None
+
+    def profile(self, seconds: Optional[float] = None) -> Optional[str]:
+        """Start a mainloop profile capture; returns where it will be written."""
+        return self.profiler.start(seconds)
+
+    def _refresh(self) -> None:
+        text = self.stats.text()
+        if self.profiler.running:
+            text += f"\nprofiling -> {self.profiler.path}"
+        self.label.config(text=text)
+        self._pending = self.root.after(settings.debug.OVERLAY_REFRESH_MS, self._refresh)
@@ -0,0 +1,77 @@
+"""Retained-mode canvas items that are created once and only reconfigured on change."""
+from typing import Any, Optional
+
+class RetainedImage:
+    """A canvas image item whose picture is swapped in place."""
+
+    def __init__(self, canvas: Any, x: float, y: float) -> None:
+        """Bind to ``canvas``; the item is created on the first show()."""
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.item_id: Optional[int] = None
+        self.image: Any = None
+
+    def show(self, image: Any) -> bool:
+        """Display ``image``, returning False if it was already shown."""
+        if image is self.image:
+            return False
+        if self.item_id is None:
+            self.item_id = self.canvas.create_image(self.x, self.y, image=image)
+        else:
+            self.canvas.itemconfig(self.item_id, image=image)
+        # Holding the reference keeps Tk from freeing the displayed image
+        self.image = image
+        return True
+
+    def move(self, x: float, y: float) -> bool:
+        """Move the item, returning False if it was already there."""
+        if (x, y) == (self.x, self.y):
+            return False
+        self.x, self.y = x, y
+        if self.item_id is not None:
+            self.canvas.coords(self.item_id, x, y)
+        return True
+
+class RetainedBar:
+    """A filled rectangle whose width tracks a 0-100 stat."""
+
+    def __init__(
+        self,
+        canvas: Any,
+        width: int,
+        height: int,
+        color: str,
+        x: float = 0,
+        y: float = 0
+    ) -> None:
+        """Create the bar's rectangle once on ``canvas``, its left edge at ``x``, ``y``."""
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.fill_width = 0
+        self.item_id = canvas.create_rectangle(x, y, x, y + height, fill=color)
+
+    def set_value(self, value: float) -> bool:
+        """Resize the bar for ``value``, skipping the Tk call if no pixel changes."""
+        fill_width = round(self.width * max(0.0, min(value, 100.0)) / 100)
+        if fill_width == self.fill_width:
+            return False
+        self.fill_width = fill_width
+        self._place()
+        return True
+
+    def move(self, x: float, y: float) -> bool:
+        """Move the bar's left edge, returning False if it was already there."""
+        if (x, y) == (self.x, self.y):
+            return False
+        self.x, self.y = x, y
+        self._place()
+        return True
+
+    def _place(self) -> None:
+        self.canvas.coords(
+            self.item_id, self.x, self.y, self.x + self.fill_width, self.y + self.height
+        )
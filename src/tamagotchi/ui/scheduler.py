@@ -0,0 +1,60 @@
+"""Event-driven replacement for fixed-rate ``after()`` polling."""
+from typing import Any, Callable, Optional
+import math
+import time
+from ..config.settings import settings
+from ..metrics import AFTER_LAG_SECONDS
+
+class UpdateScheduler:
+    """Runs a callback only when its next visible change is due.
+
+    The callback returns the seconds until it next needs to run (``math.inf``
+    when nothing will change on its own); wake() runs it right away, e.g.
+    after a user action.
+    """
+
+    def __init__(
+        self,
+        root: Any,
+        callback: Callable[[], float],
+        min_delay_ms: int = 1000 // settings.game.FPS,
+        max_delay_ms: int = 60000
+    ) -> None:
+        """Bind the scheduler to a Tk widget's event loop."""
+        self.root = root
+        self.callback = callback
+        self.min_delay_ms = min_delay_ms
+        # A ceiling keeps the display honest if the wall clock jumps
+        self.max_delay_ms = max_delay_ms
+        self._pending: Optional[str] = None
+        self._due = 0.0
+        self.lag = 0.0  # Seconds the latest run started after it was due
+
+    def schedule(self, seconds: float) -> None:
+        """Run the callback after ``seconds``, replacing any pending run."""
+        self.cancel()
+        if math.isinf(seconds):
+            delay_ms = self.max_delay_ms
+        else:
+            # Round up so the crossing has happened by the time we run
+            delay_ms = min(self.max_delay_ms, max(self.min_delay_ms, math.ceil(seconds * 1000)))
+        self._due = time.perf_counter() + delay_ms / 1000
+        self._pending = self.root.after(delay_ms, self._run)
+
+    def wake(self) -> None:
+        """Run the callback as soon as Tk is idle."""
+        self.cancel()
+        self._due = time.perf_counter()
+        self._pending = self.root.after_idle(self._run)
+
+    def cancel(self) -> None:
+        """Drop the pending run, if any."""
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+
+    def _run(self) -> None:
+        self._pending = None
+        self.lag = time.perf_counter() - self._due
+        AFTER_LAG_SECONDS.observe(self.lag)
+        self.schedule(self.callback())
@@ -0,0 +1,37 @@
+"""Seeded random pets shared by the tests."""
+import random
+from typing import List, Optional
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.config.profiles import DEFAULT_PROFILE, PROFILES
+
+PROFILE_NAMES = [DEFAULT_PROFILE] + sorted(PROFILES)
+
+def random_pets(
+    count: int,
+    seed: int = 0,
+    name: str = "Pet{}",
+    last_update: Optional[float] = None,
+    max_energy: float = 100.0,
+    sleeping: float = 0.5,
+    alive: float = 0.9,
+) -> List[Tamagotchi]:
+    """Pets with random stats, ages and profiles, the same every time for one seed.
+
+    ``last_update`` defaults to a random time in [0, 1000); ``sleeping`` and
+    ``alive`` are the chances of each flag being set.
+    """
+    rng = random.Random(seed)
+    return [
+        Tamagotchi(
+            name.format(i),
+            hunger=rng.uniform(0, 100),
+            happiness=rng.uniform(0, 100),
+            energy=rng.uniform(0, max_energy),
+            last_update=rng.uniform(0, 1000) if last_update is None else last_update,
+            age=rng.randrange(10**6),
+            is_sleeping=rng.random() < sleeping,
+            is_alive=rng.random() < alive,
+            profile=rng.choice(PROFILE_NAMES),
+        )
+        for i in range(count)
+    ]
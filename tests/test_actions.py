@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.config.settings import settings
+from src.tamagotchi.core.population import PetPopulation
+from tests.factories import random_pets
+
+def _pets():
+    return random_pets(300, seed=7, last_update=0.0, max_energy=30.0, sleeping=0.3)
+
+class TestBulkActions(unittest.TestCase):
+    def test_list_actions_match_single_actions(self):
+        """Test bulk list actions apply the same rules as one call per pet"""
+        for action in ("feed", "play", "sleep"):
+            bulk, single = _pets(), _pets()
+            accepted = getattr(Tamagotchi, f"{action}_many")(bulk)
+            for pet, ok in zip(single, accepted):
+                allowed = pet.is_alive and (action == "sleep" or not pet.is_sleeping)
+                if action == "play":
+                    allowed = allowed and pet.energy >= pet.rates.PLAY_ENERGY_COST
+                self.assertEqual(ok, allowed)
+                if allowed:
+                    getattr(pet, action)()
+            self.assertEqual(bulk, single)
+
+    def test_population_actions_match_list_actions(self):
+        """Test mask actions over a population agree exactly with the list actions"""
+        for action in ("feed", "play", "sleep"):
+            pets = _pets()
+            population = PetPopulation.from_pets(pets)
+            mask = np.arange(len(pets)) % 2 == 0
+            accepted = getattr(population, action)(mask)
+            expected = getattr(Tamagotchi, f"{action}_many")(pets[::2])
+            self.assertEqual(accepted[::2].tolist(), expected)
+            self.assertFalse(accepted[1::2].any())
+            self.assertEqual(population.to_pets()[::2], pets[::2])
+
+    def test_play_needs_energy(self):
+        """Test bulk play rejects pets without the energy to play"""
+        population = PetPopulation.from_pets([
+            Tamagotchi("Tired", energy=settings.pet.PLAY_ENERGY_COST - 1, last_update=0.0),
+            Tamagotchi("Fresh", last_update=0.0),
+        ])
+        self.assertEqual(population.play().tolist(), [False, True])
+        self.assertEqual(population.happiness[0], 100.0)
+
+    def test_settings_override(self):
+        """Test an explicit PetSettings replaces the per-pet amounts"""
+        population = PetPopulation.from_pets(
+            [Tamagotchi("Tama", hunger=10.0, last_update=0.0, profile="glutton")]
+        )
+        population.feed(pet_settings=settings.pet)
+        self.assertEqual(population.hunger[0], 10.0 + settings.pet.FEED_HUNGER_RECOVERY)
+
+    def test_mask_must_cover_population(self):
+        """Test a mask of the wrong length is rejected"""
+        population = PetPopulation.from_pets(_pets())
+        with self.assertRaises(ValueError):
+            population.feed(np.ones(3, dtype=bool))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+import numpy as np
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.analytics import (
+    Aggregator, Count, Fraction, GroupBy, Quantile, Summary, aggregate, current, history, histories,
+    is_sick, main, pet_mood, read_pets, tumbling, where
+)
+from src.tamagotchi.config.settings import settings
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.storage.columnar import export_pets
+from src.tamagotchi.storage.eventlog import EventLog
+from src.tamagotchi.storage.records import write_records
+from src.tamagotchi.storage.sqlite_store import SQLiteStore
+from src.tamagotchi.ui.farm import animation_states
+from tests.factories import random_pets
+
+def _pets(count):
+    return random_pets(count, seed=5, last_update=1000.0, sleeping=0.2)
+
+class TestAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.save_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_quantile_estimate_is_close(self):
+        """Test the P² median and p90 track the exact ones without keeping samples"""
+        values = np.random.default_rng(1).exponential(10.0, 20000)
+        for q in (0.5, 0.9):
+            exact = np.quantile(values, q)
+            self.assertAlmostEqual(aggregate(values, Quantile(q)), exact, delta=0.02 * exact)
+        self.assertEqual(aggregate([3.0, 1.0, 2.0], Quantile(0.5)), 2.0)
+        self.assertIsNone(aggregate([], Quantile(0.5)))
+
+    def test_summary_matches_numpy(self):
+        """Test the running mean and spread equal the batch ones"""
+        values = np.random.default_rng(2).uniform(0, 100, 5000)
+        summary = aggregate(values, Summary())
+        self.assertEqual(summary["count"], 5000)
+        self.assertAlmostEqual(summary["mean"], values.mean())
+        self.assertAlmostEqual(summary["std"], values.std())
+        self.assertEqual(aggregate([], Summary()), {})
+
+    def test_every_store_gives_the_same_answer(self):
+        """Test the sick fraction is the same read from JSON, SQLite, records and columns"""
+        pets = _pets(200)
+        for pet in pets:
+            pet.save(self.save_dir)
+        with SQLiteStore(os.path.join(self.save_dir, "pets.db")) as store:
+            store.save_many(pets)
+        write_records(os.path.join(self.save_dir, "pets.rec"), pets)
+        export_pets(os.path.join(self.save_dir, "pets.tcol"), pets, chunk_size=32)
+
+        expected = sum(is_sick(pet) for pet in pets) / len(pets)
+        self.assertGreater(expected, 0.0)
+        for source in (self.save_dir, "pets.db", "pets.rec", "pets.tcol"):
+            path = os.path.join(self.save_dir, source) if source != self.save_dir else source
+            self.assertAlmostEqual(aggregate(read_pets(path), Fraction(is_sick)), expected)
+
+    def test_moods_follow_the_game(self):
+        """Test mood counts use the thresholds the game and farm pick sprites by"""
+        pets = _pets(300)
+        population = PetPopulation.from_pets(pets)
+        states = animation_states(population, 0, len(pets)).tolist()
+        expected = {}
+        for pet, state in zip(pets, states):
+            name = state if pet.is_alive else "dead"
+            expected[name] = expected.get(name, 0) + 1
+        self.assertEqual(aggregate(pets, GroupBy(pet_mood, Count)), expected)
+
+    def test_current_brings_pets_up_to_date(self):
+        """Test pets saved a while ago are judged as they are now"""
+        pet = Tamagotchi("Hungry", hunger=30.0, last_update=0.0)
+        later = 15.0 / settings.pet.HUNGER_RATE
+        self.assertEqual(aggregate(current([pet], at=later), Fraction(is_sick)), 1.0)
+
+    def test_history_finds_time_of_death(self):
+        """Test a neglected pet dies when its stats would have run out"""
+        log = EventLog(self.save_dir)
+        pet = Tamagotchi("Neglected", last_update=0.0)
+        for minute in range(1, 4):
+            pet.update(minute * 60.0)
+            log.apply(pet, "feed")
+        result = history(log, "neglected", at=1e9)
+        rates = settings.pet
+        expected = pet.last_update + min(pet.hunger / rates.HUNGER_RATE,
+                                         pet.happiness / rates.HAPPINESS_RATE)
+        self.assertEqual(result.actions, 3)
+        self.assertAlmostEqual(result.died_at, expected)
+        self.assertAlmostEqual(result.lifetime, expected - 60.0)
+        self.assertIsNone(history(log, "neglected", at=expected - 1.0).died_at)
+
+    def test_median_time_to_death_by_care(self):
+        """Test grouping logged lives by care frequency in one pass"""
+        log = EventLog(self.save_dir)
+        for i in range(6):
+            pet = Tamagotchi(f"Pet{i}", last_update=0.0)
+            for _ in range(i * 5):
+                pet.update(pet.last_update + 30.0)
+                log.apply(pet, "feed")
+                log.apply(pet, "play")
+        deaths = aggregate(
+            where(histories(self.save_dir, at=1e9), lambda h: h.died_at is not None),
+            GroupBy(lambda h: h.care_per_day > 0, lambda: Quantile(0.5, lambda h: h.lifetime)),
+        )
+        self.assertEqual(set(deaths), {True})
+        self.assertGreater(deaths[True], 0.0)
+
+    def test_tumbling_windows(self):
+        """Test windows close as the stream moves past them"""
+        times = [0.0, 5.0, 12.0, 13.0, 31.0]
+        self.assertEqual(list(tumbling(times, float, 10.0, Count)),
+                         [(0.0, 2), (10.0, 2), (30.0, 1)])
+        with self.assertRaises(ValueError):
+            list(tumbling([15.0, 3.0], float, 10.0, Count))
+
+    def test_aggregator_must_fold_and_report(self):
+        """Test an aggregator missing add() or result() fails when created"""
+        class NoResult(Aggregator):
+            def add(self, item):
+                pass
+        with self.assertRaises(TypeError):
+            NoResult()
+
+    def test_command_line_report(self):
+        """Test the report runs over a save directory and prints JSON"""
+        for pet in _pets(20):
+            pet.save(self.save_dir)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main([self.save_dir, "--json"]), 0)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["pets"], 20)
+        self.assertIn("death_days_by_care", report)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import time
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.clock import (
+    Clock, MonotonicClock, VirtualClock, get_clock, now, parse_speed, use_clock
+)
+from src.tamagotchi.config.settings import settings
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.pet_sprite import PetSprite
+
+class FakeCanvas:
+    """Stand-in for tk.Canvas that keeps scheduled callbacks instead of running them."""
+    def __init__(self):
+        self.shown = []
+
+    def create_image(self, *args, **kwargs):
+        self.shown.append(kwargs.get("image"))
+        return 1
+
+    def itemconfig(self, item, image=None):
+        self.shown.append(image)
+
+    def after(self, delay, callback):
+        return "after#1"
+
+class NumberedSprite(PetSprite):
+    """PetSprite whose frames are their own indices, so no Tk images are needed."""
+    def get_frame(self, state, frame):
+        return frame
+
+class TestClock(unittest.TestCase):
+    def test_virtual_clock_only_moves_when_advanced(self):
+        """Test a rate-0 virtual clock is fully deterministic"""
+        clock = VirtualClock(start=1000.0)
+        self.assertEqual(clock(), 1000.0)
+        clock.advance(60.0)
+        self.assertEqual(clock(), 1060.0)
+
+    def test_changing_rate_does_not_jump(self):
+        """Test switching speed keeps the time reached so far"""
+        clock = VirtualClock(start=0.0, rate=1000.0)
+        before = clock()
+        clock.rate = 0.0
+        self.assertGreaterEqual(clock(), before)
+        self.assertEqual(clock(), clock())
+
+    def test_clock_must_tell_time(self):
+        """Test a Clock subclass without __call__ can't be created"""
+        class Broken(Clock):
+            pass
+        with self.assertRaises(TypeError):
+            Broken()
+
+    def test_speed_must_be_positive(self):
+        """Test TAMAGOTCHI_SPEED values that would freeze or reverse time are refused"""
+        self.assertEqual(parse_speed("3600"), 3600.0)
+        for speed in ("fast", "0", "-1", "nan", "inf"):
+            with self.assertRaisesRegex(ValueError, "TAMAGOTCHI_SPEED"):
+                parse_speed(speed)
+
+    def test_monotonic_clock_reads_epoch_time(self):
+        """Test the monotonic clock starts at the wall clock and never goes back"""
+        clock = MonotonicClock()
+        first = clock()
+        self.assertAlmostEqual(first, time.time(), delta=1.0)
+        self.assertGreaterEqual(clock(), first)
+
+    def test_model_reads_the_installed_clock(self):
+        """Test pets and populations default to the process-wide clock"""
+        previous = get_clock()
+        with use_clock(VirtualClock(start=500.0)) as clock:
+            pet = Tamagotchi("Tama")
+            self.assertEqual(pet.last_update, 500.0)
+            population = PetPopulation.from_pets([Tamagotchi("Pop")])
+            clock.advance(10.0)
+            pet.update()
+            population.update()
+            self.assertEqual(now(), 510.0)
+            self.assertEqual(pet.last_update, 510.0)
+            self.assertEqual(population.last_update[0], 510.0)
+            self.assertEqual(pet.hunger, 100.0 - 10.0 * settings.pet.HUNGER_RATE)
+        self.assertIs(get_clock(), previous)
+
+    def test_week_of_life_runs_instantly(self):
+        """Test a virtual week matches one closed-form update over the same gap"""
+        week = 7 * 86400.0
+        with use_clock(VirtualClock(start=0.0)) as clock:
+            ticked = Tamagotchi("Tama", energy=40.0, is_sleeping=True)
+            for _ in range(7 * 24):
+                clock.advance(3600.0)
+                ticked.update()
+        jumped = Tamagotchi("Tama", energy=40.0, is_sleeping=True, last_update=0.0)
+        jumped.advance(week)
+        jumped.last_update = week
+        self.assertEqual(ticked.last_update, week)
+        self.assertFalse(ticked.is_alive)
+        self.assertEqual(ticked, jumped)
+
+    def test_sprite_frames_follow_the_clock(self):
+        """Test animation frames come from elapsed clock time, skipping late frames"""
+        clock = VirtualClock(start=0.0)
+        sprite = NumberedSprite(FakeCanvas(), 0, 0, clock=clock)
+        self.assertEqual(sprite.current_frame, 0)
+        clock.advance(3 * sprite.frame_delay / 1000)
+        sprite.animate()
+        self.assertEqual(sprite.current_frame, 3)
+        sprite.set_animation("happy")
+        sprite.animate()
+        self.assertEqual(sprite.current_frame, 0)
+
+if __name__ == '__main__':
+    unittest.main()
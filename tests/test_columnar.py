@@ -0,0 +1,128 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+import numpy as np
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.storage import columnar
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.storage.columnar import (
+    ColumnReader, ColumnWriter, export_pets, export_population, import_population, main
+)
+from src.tamagotchi.storage.sqlite_store import SQLiteStore
+from tests.factories import random_pets
+
+def _pets(count):
+    return random_pets(count, seed=11, name="Pét {}", sleeping=0.5)
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "pets.tcol")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pets_round_trip_in_chunks(self):
+        """Test every field of every pet survives export and import across chunks"""
+        pets = _pets(1000)
+        self.assertEqual(export_pets(self.path, pets, chunk_size=128), 1000)
+        with ColumnReader(self.path) as reader:
+            sizes = [len(chunk["name"]) for chunk in reader.chunks()]
+            self.assertEqual(list(reader.pets()), pets)
+        self.assertEqual(max(sizes), 128)
+        self.assertEqual(import_population(self.path).to_pets(), pets)
+
+    def test_population_round_trip(self):
+        """Test a population written from its columns reads back identically"""
+        population = PetPopulation.from_pets(_pets(300))
+        export_population(self.path, population, chunk_size=64)
+        restored = import_population(self.path)
+        self.assertEqual(restored.to_pets(), population.to_pets())
+        self.assertEqual(restored.profiles, population.profiles)
+
+    def test_reads_selected_columns(self):
+        """Test analysis can decode just the columns it needs"""
+        export_pets(self.path, _pets(200), chunk_size=50)
+        with ColumnReader(self.path) as reader:
+            chunks = list(reader.chunks(["hunger"]))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(set(chunks[0]), {"hunger"})
+
+    def test_failed_export_leaves_nothing(self):
+        """Test an export that raises never replaces the target file"""
+        with self.assertRaises(RuntimeError):
+            with ColumnWriter(self.path) as writer:
+                writer.write(_pets(10))
+                raise RuntimeError("interrupted")
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_truncated_file_is_rejected(self):
+        """Test a torn backup raises instead of importing part of the pets"""
+        export_pets(self.path, _pets(100), chunk_size=10)
+        with open(self.path, 'r+b') as f:
+            f.truncate(os.path.getsize(self.path) - 20)
+        with self.assertRaises(ValueError):
+            import_population(self.path)
+
+    def test_names_may_contain_nul(self):
+        """Test a NUL inside a name doesn't shift the names and profiles after it"""
+        pets = _pets(20)
+        pets[3].name = "Bad\0Name"
+        export_pets(self.path, pets, chunk_size=8)
+        self.assertEqual(import_population(self.path).to_pets(), pets)
+
+    def test_reads_version_one_files(self):
+        """Test NUL-joined version 1 files still import, and a miscounted one raises"""
+        def nul_joined(values, dtype):
+            if dtype == columnar.STRING:
+                return "\0".join(values).encode("utf-8")
+            return np.ascontiguousarray(values, dtype=dtype).tobytes()
+        pets = _pets(20)
+        with mock.patch.object(columnar, "VERSION", 1), \
+                mock.patch.object(columnar, "_encode", nul_joined):
+            export_pets(self.path, pets, chunk_size=8)
+        self.assertEqual(import_population(self.path).to_pets(), pets)
+
+        pets[3].name = "Bad\0Name"
+        with mock.patch.object(columnar, "VERSION", 1), \
+                mock.patch.object(columnar, "_encode", nul_joined):
+            export_pets(self.path, pets, chunk_size=8)
+        with self.assertRaises(ValueError):
+            import_population(self.path)
+
+    def test_empty_export(self):
+        """Test a file with no pets round-trips"""
+        export_pets(self.path, [])
+        self.assertEqual(len(import_population(self.path)), 0)
+
+    def test_command_line_backup_and_restore(self):
+        """Test exporting a SQLite store and importing it into another"""
+        source = os.path.join(self.tmp.name, "source.db")
+        target = os.path.join(self.tmp.name, "target.db")
+        pets = _pets(50)
+        with SQLiteStore(source) as store:
+            store.save_many(pets)
+        self.assertEqual(main(["export", source, self.path, "--chunk-size", "16"]), 0)
+        self.assertEqual(main(["import", self.path, target]), 0)
+        with SQLiteStore(target) as store:
+            restored = {pet.name: pet for pet in store.load_many()}
+        self.assertEqual(restored, {pet.name: pet for pet in pets})
+
+    def test_bad_export_arguments_are_rejected(self):
+        """Test a missing source or a chunk size below 1 is an error, not an empty export"""
+        missing = os.path.join(self.tmp.name, "missing.db")
+        for argv in (["export", missing, self.path],
+                     ["export", self.tmp.name, self.path, "--chunk-size", "0"]):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                main(argv)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+        with self.assertRaises(ValueError):
+            ColumnWriter(self.path, chunk_size=0)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import tempfile
+import unittest
+from dataclasses import asdict
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.core.compact import CompactTamagotchi
+
+class TestCompactTamagotchi(unittest.TestCase):
+    def test_has_no_instance_dict(self):
+        """Test the compact pet uses slots"""
+        pet = CompactTamagotchi("Tiny")
+        self.assertFalse(hasattr(pet, "__dict__"))
+        with self.assertRaises(AttributeError):
+            pet.colour = "red"
+
+    def test_same_behaviour_as_tamagotchi(self):
+        """Test actions, updates and asdict match the dataclass"""
+        compact = CompactTamagotchi("Tiny", hunger=40, energy=50, last_update=0.0)
+        classic = Tamagotchi("Tiny", hunger=40, energy=50, last_update=0.0)
+        for pet in (compact, classic):
+            pet.feed()
+            pet.play()
+            pet.update(30.0)
+            pet.sleep()
+        self.assertEqual(asdict(compact), asdict(classic))
+
+    def test_save_and_load(self):
+        """Test saving and loading keeps the compact type"""
+        with tempfile.TemporaryDirectory() as save_dir:
+            pet = CompactTamagotchi("Tiny", last_update=1.0)
+            pet.save(save_dir)
+            loaded = CompactTamagotchi.load("Tiny", save_dir)
+        self.assertIsInstance(loaded, CompactTamagotchi)
+        self.assertEqual(loaded, pet)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from dataclasses import asdict, replace
+from unittest import mock
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.config.profiles import PROFILES
+from src.tamagotchi.storage.eventlog import EventLog
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log = EventLog(self.tmp.name, snapshot_every=4)
+        self.pet = Tamagotchi("Tama", hunger=60, energy=40, last_update=0.0)
+        self.history = {}
+        # Tick every 7 seconds, acting every other tick, as the game loop would
+        for tick in range(1, 30):
+            now = tick * 7.0
+            self.pet.update(now)
+            if tick % 2:
+                self.log.apply(self.pet, ("feed", "play", "sleep")[tick % 3])
+            self.history[now] = replace(self.pet)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertSamePet(self, first, second):
+        for field, value in asdict(first).items():
+            if isinstance(value, float):
+                self.assertAlmostEqual(value, getattr(second, field), places=9, msg=field)
+            else:
+                self.assertEqual(value, getattr(second, field), msg=field)
+
+    def test_replay_rebuilds_past_states(self):
+        """Test replay reproduces the live pet at any logged time"""
+        for now in (7.0, 63.0, 203.0):
+            self.assertSamePet(self.log.replay("tama", at=now), self.history[now])
+        self.assertSamePet(self.log.replay("TAMA"), self.history[203.0])
+        self.assertIsNone(self.log.replay("tama", at=-1.0))
+
+    def test_snapshots_and_compaction(self):
+        """Test periodic snapshots and that compaction keeps later history intact"""
+        kinds = [event.kind for event in self.log.events("tama")]
+        self.assertEqual(kinds.count("snapshot"), 4)
+        dropped = self.log.compact("tama", before=100.0)
+        self.assertGreater(dropped, 0)
+        self.assertEqual(next(self.log.events("tama")).kind, "snapshot")
+        self.assertSamePet(self.log.replay("tama", at=147.0), self.history[147.0])
+
+    def test_corrupt_tail_is_ignored(self):
+        """Test replay stops at a damaged record instead of failing"""
+        path = self.log.path("Tama")
+        with open(path, 'r+b') as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"\xff\xff\xff")
+        with self.assertLogs("src.tamagotchi.storage.eventlog", "WARNING"):
+            pet = self.log.replay("tama")
+        self.assertSamePet(pet, self.history[189.0])
+
+    def test_unreadable_state_ends_replay(self):
+        """Test a state whose profile no longer exists stops replay like a corrupt record"""
+        pet = Tamagotchi("Gone", last_update=300.0, profile="glutton")
+        self.log.apply(pet, "feed")
+        pet.update(310.0)
+        self.log.apply(pet, "play")
+        self.assertSamePet(self.log.replay("Gone"), pet)
+        warns = self.assertLogs("src.tamagotchi.storage.eventlog", "WARNING")
+        with mock.patch.dict(PROFILES), warns:
+            del PROFILES["glutton"]
+            self.assertIsNone(self.log.replay("Gone"))
+            self.assertEqual(self.log.compact("Gone", before=305.0), 0)
+
+    def test_oversized_state_is_a_clear_error(self):
+        """Test a state too big for a record raises ValueError and leaves the pet untouched"""
+        pet = Tamagotchi("Tama", hunger=50, last_update=300.0)
+        pet.name = "T" * 70000
+        with self.assertRaisesRegex(ValueError, "at most 65535"):
+            self.log.apply(pet, "feed")
+        self.assertEqual(pet.hunger, 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.config.settings import settings
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.ui.farm import animation_states, random_population, visible_range
+
+class TestFarm(unittest.TestCase):
+    def test_visible_range_covers_partial_rows(self):
+        """Test culling keeps every row that is at least partly in view"""
+        height = settings.farm.CELL_HEIGHT
+        self.assertEqual(visible_range(0, 3 * height, 4, 5000), (0, 12))
+        self.assertEqual(visible_range(height / 2, 3 * height, 4, 5000), (0, 16))
+        self.assertEqual(visible_range(10 * height, height, 4, 5000), (40, 44))
+
+    def test_visible_range_stops_at_the_last_pet(self):
+        """Test the range never runs past the population"""
+        height = settings.farm.CELL_HEIGHT
+        self.assertEqual(visible_range(0, 10 * height, 4, 6), (0, 6))
+
+    def test_animation_states_follow_the_game(self):
+        """Test each pet animates as the single-pet window would show it"""
+        population = PetPopulation.from_pets([
+            Tamagotchi("Sleepy", is_sleeping=True, last_update=0.0),
+            Tamagotchi("Happy", last_update=0.0),
+            Tamagotchi("Sick", hunger=5.0, happiness=50.0, last_update=0.0),
+            Tamagotchi("Idle", happiness=50.0, last_update=0.0),
+            Tamagotchi("Gone", is_alive=False, last_update=0.0),
+        ])
+        self.assertEqual(
+            animation_states(population, 0, 5).tolist(),
+            ["sleep", "happy", "sick", "idle", "sick"],
+        )
+        self.assertEqual(animation_states(population, 3, 4).tolist(), ["idle"])
+
+    def test_random_population_is_reproducible(self):
+        """Test the demo population depends only on its seed"""
+        first, second = random_population(50, seed=3), random_population(50, seed=3)
+        self.assertEqual(first.hunger.tolist(), second.hunger.tolist())
+        self.assertEqual(first.profiles, second.profiles)
+
+if __name__ == '__main__':
+    unittest.main()
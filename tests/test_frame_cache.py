@@ -0,0 +1,92 @@
+import unittest
+from src.tamagotchi.pet_sprite import (
+    DEFAULT_APPEARANCE, FRAME_CACHE, Appearance, PetSprite, appearance_for, draw_pixel_art,
+    shared_frame
+)
+from src.tamagotchi.ui.frame_cache import FrameCache
+
+class FakeCanvas:
+    """Stand-in for tk.Canvas that ignores drawing and scheduling."""
+    def create_image(self, *args, **kwargs):
+        return 1
+
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+    def after(self, delay, callback):
+        return "after#1"
+
+class CountingSprite(PetSprite):
+    """PetSprite that renders placeholder frames and counts how many it made."""
+    rendered = 0
+
+    def render_frame(self, state, frame):
+        CountingSprite.rendered += 1
+        return object(), 64 * 64 * 4
+
+class TestFrameCache(unittest.TestCase):
+    def setUp(self):
+        FRAME_CACHE.clear()
+        CountingSprite.rendered = 0
+
+    def tearDown(self):
+        FRAME_CACHE.clear()
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache stays within its byte budget, dropping the oldest first"""
+        cache = FrameCache(max_bytes=300)
+        for key in "abc":
+            cache.put(key, key.upper(), 100)
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("d", "D", 100)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.bytes, 300)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_same_appearance_shares_frames(self):
+        """Test many sprites that look alike render each frame once"""
+        sprites = [CountingSprite(FakeCanvas(), 0, 0) for _ in range(20)]
+        frames = [sprite.get_frames("happy") for sprite in sprites]
+        self.assertTrue(all(f == frames[0] for f in frames))
+        # 8 happy frames plus the idle frame each sprite showed on creation
+        self.assertEqual(CountingSprite.rendered, 9)
+
+        other = CountingSprite(FakeCanvas(), 0, 0, appearance=Appearance("night", "round", "wide"))
+        self.assertNotEqual(other.get_frames("happy"), frames[0])
+
+    def test_farm_and_sprites_share_one_render_path(self):
+        """Test shared_frame() and PetSprite.get_frame() fill and read the same entries"""
+        sprite = CountingSprite(FakeCanvas(), 0, 0)
+        image = sprite.get_frame("happy", 3)
+        self.assertIs(shared_frame(DEFAULT_APPEARANCE, "happy", 3), image)
+        image = shared_frame(DEFAULT_APPEARANCE, "sick", 1, sprite.render_frame)
+        self.assertIs(sprite.get_frame("sick", 1), image)
+        self.assertEqual(CountingSprite.rendered, 3)
+
+    def test_memory_is_bounded(self):
+        """Test the shared cache never holds more than its budget"""
+        budget = FRAME_CACHE.max_bytes
+        FRAME_CACHE.max_bytes = 10 * 64 * 64 * 4
+        try:
+            for i in range(50):
+                sprite = CountingSprite(FakeCanvas(), 0, 0, appearance=appearance_for(f"Pet{i}"))
+                sprite.get_frames("idle")
+            self.assertLessEqual(FRAME_CACHE.bytes, FRAME_CACHE.max_bytes)
+            self.assertEqual(len(FRAME_CACHE), 10)
+        finally:
+            FRAME_CACHE.max_bytes = budget
+
+    def test_variants_draw_differently(self):
+        """Test each appearance parameter changes the picture"""
+        base = draw_pixel_art("idle", 0).tobytes()
+        self.assertEqual(draw_pixel_art("idle", 0, DEFAULT_APPEARANCE).tobytes(), base)
+        for variant in (Appearance(palette="ember"), Appearance(body="tall"), Appearance(eyes="wide")):
+            self.assertNotEqual(draw_pixel_art("idle", 0, variant).tobytes(), base)
+
+    def test_appearance_is_stable_per_name(self):
+        """Test a pet's derived appearance doesn't depend on name case or call order"""
+        self.assertEqual(appearance_for("Tama"), appearance_for("tama"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.storage.journal import SaveJournal
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = 0.0
+        self.journal = SaveJournal(
+            self.tmp.name, flush_interval=10, compact_after=3, clock=lambda: self.now
+        )
+        self.pet = Tamagotchi("Tama", last_update=1000.0)
+        self.journal.snapshot(self.pet)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def journal_lines(self):
+        with open(self.journal.journal_path("Tama")) as f:
+            return f.readlines()
+
+    def test_writes_are_coalesced(self):
+        """Test changes inside the flush interval are written once"""
+        self.pet.update(1001.0)
+        self.assertFalse(self.journal.maybe_flush(self.pet))
+        self.now = 10.0
+        self.pet.update(1002.0)
+        self.assertTrue(self.journal.maybe_flush(self.pet))
+        self.assertEqual(len(self.journal_lines()), 1)
+
+    def test_clean_pet_is_not_written(self):
+        """Test a pet whose only change is last_update is not dirty"""
+        self.pet.hunger = 0
+        self.pet.happiness = 0
+        self.pet.energy = 0
+        self.pet.update(1000.0)
+        self.journal.flush(self.pet)
+        self.pet.update(2000.0)
+        self.assertFalse(self.journal.flush(self.pet))
+
+    def test_load_replays_journal_and_ignores_torn_line(self):
+        """Test loading applies deltas on top of the snapshot"""
+        self.pet.update(1010.0)
+        self.pet.feed()
+        self.journal.flush(self.pet)
+        with open(self.journal.journal_path("Tama"), 'a') as f:
+            f.write('{"hunger":1')
+        loaded = SaveJournal(self.tmp.name).load("Tama")
+        self.assertEqual(loaded, self.pet)
+
+    def test_malformed_snapshot_loads_nothing(self):
+        """Test a snapshot that parses but is not a pet loads as missing instead of raising"""
+        journal = SaveJournal(self.tmp.name)
+        snapshots = ['[1, 2]', '{"name": "Tama"}', '{"name": "Tama", "last_update": 1, "x": 2}']
+        for snapshot in snapshots:
+            with open(journal.snapshot_path("Tama"), 'w') as f:
+                f.write(snapshot)
+            with self.assertLogs("src.tamagotchi.storage.journal", "ERROR"):
+                self.assertIsNone(journal.load("Tama"))
+
+    def test_garbled_delta_ends_replay(self):
+        """Test deltas that are not objects with a timestamp are treated like a torn tail"""
+        self.pet.update(1010.0)
+        self.pet.feed()
+        self.journal.flush(self.pet)
+        with open(self.journal.journal_path("Tama"), 'a') as f:
+            f.write('[1]\n{"hunger": 1}\n')
+        self.assertEqual(SaveJournal(self.tmp.name).load("Tama"), self.pet)
+
+    def test_load_can_forget_flush_state(self):
+        """Test a pet read without remembering it is dirty, so its next flush writes a snapshot"""
+        journal = SaveJournal(self.tmp.name)
+        loaded = journal.load("Tama", remember=False)
+        self.assertEqual(loaded, self.pet)
+        self.assertTrue(journal.is_dirty(loaded))
+        remembered = SaveJournal(self.tmp.name)
+        self.assertFalse(remembered.is_dirty(remembered.load("Tama")))
+
+    def test_compaction_rewrites_snapshot(self):
+        """Test the journal is folded into the snapshot after enough appends"""
+        for second in range(1, 5):
+            self.pet.update(1000.0 + second)
+            self.journal.flush(self.pet)
+        self.assertEqual(self.journal_lines(), [])
+        self.assertEqual(Tamagotchi.load("Tama", self.tmp.name), self.pet)
+        self.assertEqual(
+            [name for name in os.listdir(self.tmp.name) if name.endswith(".tmp")], []
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.metrics import MetricsRegistry, PET_LOADS, PET_SAVES, metrics
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.counter = self.registry.counter("saves_total", "Saves")
+        self.histogram = self.registry.histogram("tick_seconds", "Ticks", buckets=(0.01, 0.1))
+
+    def test_disabled_records_nothing(self):
+        """Test recording is a no-op until the registry is enabled"""
+        self.counter.inc()
+        self.histogram.observe(0.05)
+        with self.histogram.time():
+            pass
+        self.assertEqual(self.counter.value, 0)
+        self.assertEqual(self.histogram.count, 0)
+
+    def test_snapshot_exports(self):
+        """Test JSON and Prometheus snapshots carry the recorded values"""
+        self.registry.enable()
+        self.counter.inc(2)
+        for seconds in (0.005, 0.05, 5.0):
+            self.histogram.observe(seconds)
+        with self.histogram.time():
+            pass
+        snapshot = json.loads(self.registry.to_json())
+        self.assertEqual(snapshot["counters"]["saves_total"], 2)
+        self.assertEqual(snapshot["histograms"]["tick_seconds"]["buckets"],
+                         {"0.01": 2, "0.1": 3, "+Inf": 4})
+        self.assertEqual(snapshot["histograms"]["tick_seconds"]["p50"], 0.01)
+        text = self.registry.to_prometheus()
+        self.assertIn("# TYPE saves_total counter\nsaves_total 2\n", text)
+        self.assertIn('tick_seconds_bucket{le="+Inf"} 4\n', text)
+        self.assertIn("tick_seconds_count 4\n", text)
+
+class TestPetInstrumentation(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_save_and_load_are_counted_without_printing(self):
+        """Test save/load record metrics and keep stdout clean"""
+        stdout = io.StringIO()
+        with tempfile.TemporaryDirectory() as save_dir, contextlib.redirect_stdout(stdout):
+            Tamagotchi("Tama", last_update=1.0).save(save_dir)
+            Tamagotchi.load("Tama", save_dir)
+            Tamagotchi.load("Nobody", save_dir)
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertEqual(PET_SAVES.value, 1)
+        self.assertEqual(PET_LOADS.value, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from dataclasses import replace
+from src.tamagotchi.config.settings import settings
+from src.tamagotchi.optimize import (
+    Outcome, ResultCache, Schedule, cheapest_survivor, evaluate, main, pareto_front,
+    random_schedules, simulate
+)
+from src.tamagotchi.sim import SECONDS_PER_DAY, Simulation
+
+def _outcome(actions, survival, happiness):
+    return Outcome(Schedule(60.0, 50.0, 50.0, 20.0), 100.0, actions, survival, happiness)
+
+class TestOptimize(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _assert_matches_simulation(self, schedules, duration):
+        results = simulate(schedules, duration)
+        for schedule, (actions, survival, _) in zip(schedules, results):
+            report = Simulation.with_new_pets(1, schedule.policy(), step=schedule.every).run(
+                duration
+            )
+            self.assertEqual(actions, report.actions, schedule)
+            self.assertAlmostEqual(survival, report.survival["mean"], msg=schedule)
+        return results
+
+    def test_many_schedules_match_simulation(self):
+        """Test the batched run agrees with Simulation pet by pet, cycles skipped included"""
+        schedules = random_schedules(40, seed=3, every=(60.0, 200.0))
+        results = self._assert_matches_simulation(schedules, SECONDS_PER_DAY)
+        survived = [survival for _, survival, _ in results if survival == SECONDS_PER_DAY]
+        self.assertTrue(survived)
+        self.assertLess(len(survived), len(results))
+
+    def test_few_schedules_match_simulation(self):
+        """Test the plain-float path used for the last pets agrees with Simulation too"""
+        schedules = random_schedules(6, seed=3, every=(60.0, 200.0)) + [
+            Schedule(45.0, 80.0, 60.0, 30.0)
+        ]
+        self._assert_matches_simulation(schedules, SECONDS_PER_DAY)
+
+    def test_repeated_schedules_are_cached(self):
+        """Test each distinct settings, schedule and duration is simulated once"""
+        path = os.path.join(self.tmp.name, "cache.json")
+        schedules = random_schedules(5, seed=1) * 3
+        cache = ResultCache(path)
+        first = evaluate(schedules, SECONDS_PER_DAY, cache=cache)
+        self.assertEqual((cache.misses, cache.hits, len(cache)), (5, 0, 5))
+        self.assertEqual(first[:5], first[5:10])
+        cache.save()
+
+        reloaded = ResultCache(path)
+        self.assertEqual(evaluate(schedules, SECONDS_PER_DAY, cache=reloaded), first)
+        self.assertEqual((reloaded.misses, reloaded.hits), (0, 5))
+        hungrier = replace(settings.pet, HUNGER_RATE=1.0)
+        evaluate(schedules[:5], SECONDS_PER_DAY, hungrier, cache=reloaded)
+        self.assertEqual(reloaded.misses, 5)
+
+    def test_pareto_front(self):
+        """Test dominated outcomes and early deaths are dropped and the front is cheapest first"""
+        outcomes = [
+            _outcome(10, 100.0, 50.0),
+            _outcome(5, 100.0, 40.0),
+            _outcome(5, 100.0, 40.0),
+            _outcome(20, 100.0, 45.0),  # worse than 10 actions on everything
+            _outcome(2, 30.0, 90.0),
+            _outcome(3, 20.0, 80.0),  # worse than 2 actions on everything
+        ]
+        front = pareto_front(outcomes)
+        self.assertEqual([o.actions for o in front], [5, 10])
+        self.assertEqual(cheapest_survivor(outcomes).actions, 5)
+        self.assertIsNone(cheapest_survivor(outcomes[4:]))
+        # With no survivors the front still ranks by how long pets lived
+        self.assertEqual([o.actions for o in pareto_front(outcomes[4:])], [2])
+
+    def test_command_line_report(self):
+        """Test the search runs end to end and prints its front as JSON"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main(["--policies", "50", "--days", "1", "--json"]), 0)
+        report = json.loads(out.getvalue())
+        self.assertTrue(report["front"])
+        self.assertTrue(report["best"]["survival"] >= SECONDS_PER_DAY)
+
+if __name__ == '__main__':
+    unittest.main()
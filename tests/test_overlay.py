@@ -0,0 +1,49 @@
+import os
+import pstats
+import tempfile
+import unittest
+from src.tamagotchi.ui.overlay import FrameStats, ProfileCapture
+
+class RecordingRoot:
+    """Stand-in for a Tk root that records after() callbacks."""
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay_ms, callback):
+        self.scheduled.append((delay_ms, callback))
+        return f"after#{len(self.scheduled)}"
+
+class TestFrameStats(unittest.TestCase):
+    def test_summary_covers_frames_jitter_and_phases(self):
+        """Test frames, lag and phases are summarised in milliseconds"""
+        stats = FrameStats(window=3)
+        for lag in (0.001, 0.002, 0.003, 0.004):
+            stats.begin_frame(lag)
+            with stats.phase("update"):
+                pass
+            stats.record("animate", 0.010)
+            stats.end_frame()
+        summary = stats.summary()
+        self.assertEqual(len(stats.frames), 3)
+        self.assertAlmostEqual(summary["jitter"]["mean_ms"], 3.0)
+        self.assertAlmostEqual(summary["jitter"]["max_ms"], 4.0)
+        self.assertAlmostEqual(summary["phases"]["animate"]["mean_ms"], 10.0)
+        self.assertIn("update", stats.text())
+
+class TestProfileCapture(unittest.TestCase):
+    def test_capture_writes_pstats(self):
+        """Test a capture profiles until its scheduled stop and dumps stats"""
+        root = RecordingRoot()
+        capture = ProfileCapture(root)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = capture.start(2.0, os.path.join(tmp, "loop.pstats"))
+            self.assertIsNone(capture.start(2.0))  # One capture at a time
+            sum(range(1000))
+            delay_ms, stop = root.scheduled[-1]
+            self.assertEqual(delay_ms, 2000)
+            stop()
+            self.assertFalse(capture.running)
+            self.assertGreater(pstats.Stats(path).total_calls, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from dataclasses import asdict
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.core.population import PetPopulation
+from tests.factories import random_pets
+
+class TestPetPopulation(unittest.TestCase):
+    def setUp(self):
+        self.pets = random_pets(500, seed=42, alive=1.0)
+        self.population = PetPopulation.from_pets(self.pets)
+
+    def test_matches_scalar_update(self):
+        """Test batched update agrees exactly with Tamagotchi.update()"""
+        for now in (1000.0, 1003.5, 1250.0):
+            self.population.update(now)
+            for pet in self.pets:
+                pet.update(now)
+            self.assertEqual(self.population.to_pets(), self.pets)
+
+    def test_view_reads_and_writes_columns(self):
+        """Test a pet view behaves like a Tamagotchi backed by the columns"""
+        view = self.population[3]
+        view.hunger = 10
+        view.feed()
+        self.assertEqual(self.population.hunger[3], view.hunger)
+        self.assertEqual(asdict(view)["name"], "Pet3")
+        self.assertIsInstance(view, Tamagotchi)
+
+    def test_add_grows_population(self):
+        """Test adding pets one at a time"""
+        index = self.population.add(Tamagotchi("Extra"))
+        self.assertEqual(index, len(self.pets))
+        self.assertEqual(self.population.pet(-1).name, "Extra")
+        self.assertEqual(len(self.population.hunger), len(self.pets) + 1)
+
+if __name__ == '__main__':
+    unittest.main()
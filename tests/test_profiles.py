@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.config.profiles import PROFILES, profile_rates
+from src.tamagotchi.config.settings import settings
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.storage.sqlite_store import SQLiteStore
+from tests.factories import random_pets
+
+class TestRateProfiles(unittest.TestCase):
+    def test_pet_decays_at_its_profile_rates(self):
+        """Test a profiled pet uses its own coefficients"""
+        plain = Tamagotchi("Plain", last_update=0.0)
+        glutton = Tamagotchi("Greedy", last_update=0.0, profile="glutton")
+        for pet in (plain, glutton):
+            pet.update(10.0)
+        self.assertEqual(plain.hunger, 100 - 10 * settings.pet.HUNGER_RATE)
+        self.assertEqual(glutton.hunger, 100 - 10 * PROFILES["glutton"].HUNGER_RATE)
+        glutton.hunger = 10
+        glutton.feed()
+        self.assertEqual(glutton.hunger, 10 + PROFILES["glutton"].FEED_HUNGER_RECOVERY)
+
+    def test_unknown_profile_is_rejected(self):
+        """Test creating or switching to an unknown profile fails"""
+        with self.assertRaises(ValueError):
+            Tamagotchi("Odd", profile="dragon")
+        pet = Tamagotchi("Tama")
+        with self.assertRaises(ValueError):
+            pet.set_profile("dragon")
+        self.assertEqual(pet.profile, "default")
+
+    def test_assigning_profile_switches_rates(self):
+        """Test setting pet.profile directly takes effect like set_profile()"""
+        pet = Tamagotchi("Tama", last_update=0.0)
+        pet.profile = "glutton"
+        pet.update(10.0)
+        self.assertEqual(pet.hunger, 100 - 10 * PROFILES["glutton"].HUNGER_RATE)
+        with self.assertRaises(ValueError):
+            pet.profile = "dragon"
+        self.assertEqual(pet.profile, "glutton")
+
+    def test_shared_profile_population_tracks_switches(self):
+        """Test a population that starts on one profile notices a pet leaving it"""
+        pets = [Tamagotchi(f"Pet{i}", last_update=0.0, profile="hardy") for i in range(10)]
+        population = PetPopulation.from_pets(pets)
+        population.update(5.0)
+        for pet in pets:
+            pet.update(5.0)
+        population.pet(3).set_profile("glutton")
+        pets[3].set_profile("glutton")
+        population.update(50.0)
+        for pet in pets:
+            pet.update(50.0)
+        self.assertEqual(population.to_pets(), pets)
+
+    def test_population_matches_scalar_with_mixed_profiles(self):
+        """Test per-pet rate columns agree exactly with the scalar path"""
+        pets = random_pets(300, seed=7, last_update=0.0, alive=1.0)
+        population = PetPopulation.from_pets(pets)
+        population.pet(0).set_profile("sleepyhead")
+        pets[0].set_profile("sleepyhead")
+        for now in (5.0, 40.0, 300.0):
+            population.update(now)
+            for pet in pets:
+                pet.update(now)
+            self.assertEqual(population.to_pets(), pets)
+        self.assertEqual(population.rates.HUNGER_RATE[0], profile_rates("sleepyhead").HUNGER_RATE)
+
+    def test_profile_survives_sqlite(self):
+        """Test the store keeps a pet's profile"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with SQLiteStore(os.path.join(tmp, "pets.db")) as store:
+                pet = Tamagotchi("Tama", last_update=1.0, profile="hardy")
+                store.save(pet)
+                self.assertEqual(store.load("tama"), pet)
+
+if __name__ == '__main__':
+    unittest.main()
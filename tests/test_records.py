@@ -0,0 +1,82 @@
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.storage.records import RecordFile, write_records
+
+class TestRecordFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "pets.rec")
+        self.pets = [
+            Tamagotchi(f"Pet{i}", hunger=i % 100, energy=50.5, last_update=float(i),
+                       age=i, is_sleeping=i % 2 == 0, is_alive=i % 7 != 0)
+            for i in range(1000)
+        ]
+        self.pets.append(Tamagotchi("Zoë", last_update=1.0, profile="glutton"))
+        write_records(self.path, self.pets)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_open_single_pet_by_name(self):
+        """Test a pet is found and decoded without loading the rest"""
+        with RecordFile(self.path) as records:
+            self.assertEqual(len(records), 1001)
+            self.assertEqual(records.load("pet123"), self.pets[123])
+            self.assertEqual(records.load("ZOË"), self.pets[-1])
+            self.assertIsNone(records.load("Nobody"))
+
+    def test_filter_columns(self):
+        """Test scanning a column selects the matching pets"""
+        with RecordFile(self.path) as records:
+            hungry = sorted(pet.name for pet in records.pets(records.hunger < 20))
+            expected = sorted(pet.name for pet in self.pets if pet.hunger < 20)
+            self.assertEqual(hungry, expected)
+            self.assertEqual(int(records.is_alive.sum()), sum(p.is_alive for p in self.pets))
+
+    def test_to_population_round_trips(self):
+        """Test bulk conversion keeps every field"""
+        with RecordFile(self.path) as records:
+            population = records.to_population()
+        by_name = {pet.name: pet for pet in population.to_pets()}
+        self.assertEqual([by_name[pet.name] for pet in self.pets], self.pets)
+
+    def test_bulk_names_match_single_decodes(self):
+        """Test decoding the whole name column agrees with decoding names one by one"""
+        for extra in ([], [Tamagotchi("Nul\0", last_update=1.0)]):
+            write_records(self.path, self.pets + [Tamagotchi("", last_update=1.0)] + extra)
+            with RecordFile(self.path) as records:
+                expected = [records.name(index) for index in range(len(records))]
+                self.assertEqual(records.names(), expected)
+            self.assertIn("Zoë", expected)
+
+    def test_one_long_name_is_decoded_alone(self):
+        """Test a name far longer than the rest decodes right without widening every row"""
+        long_name = "Ö" * 50000
+        write_records(self.path, self.pets + [Tamagotchi(long_name, last_update=1.0)])
+        with RecordFile(self.path) as records, \
+                mock.patch("src.tamagotchi.storage.records.NAME_BLOCK_BYTES", 64):
+            expected = [records.name(index) for index in range(len(records))]
+            self.assertEqual(records.names(), expected)
+        self.assertIn(long_name, expected)
+
+    def test_rejects_other_versions(self):
+        """Test a record file of another layout version is refused by its version"""
+        with open(self.path, 'r+b') as f:
+            f.seek(8)
+            f.write(struct.pack("<I", 1))
+        with self.assertRaisesRegex(ValueError, "version 1"):
+            RecordFile(self.path)
+
+    def test_rejects_other_files(self):
+        """Test a file without the record header is refused"""
+        with open(self.path, 'wb') as f:
+            f.write(b"{}" * 64)
+        with self.assertRaises(ValueError):
+            RecordFile(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from src.tamagotchi.ui.retained import RetainedBar, RetainedImage
+
+class RecordingCanvas:
+    """Stand-in for tk.Canvas that records every call."""
+    def __init__(self):
+        self.calls = []
+
+    def create_image(self, *args, **kwargs):
+        self.calls.append("create_image")
+        return 1
+
+    def create_rectangle(self, *args, **kwargs):
+        self.calls.append("create_rectangle")
+        return 2
+
+    def itemconfig(self, *args, **kwargs):
+        self.calls.append("itemconfig")
+
+    def coords(self, *args):
+        self.calls.append("coords")
+
+class TestRetained(unittest.TestCase):
+    def setUp(self):
+        self.canvas = RecordingCanvas()
+
+    def test_image_is_created_once(self):
+        """Test frames after the first reuse the canvas item"""
+        sprite = RetainedImage(self.canvas, 10, 10)
+        first, second = object(), object()
+        for image in (first, first, second, second, first):
+            sprite.show(image)
+        self.assertEqual(
+            self.canvas.calls, ["create_image", "itemconfig", "itemconfig"]
+        )
+
+    def test_bar_skips_unchanged_width(self):
+        """Test bar updates only touch Tk when the pixel width changes"""
+        bar = RetainedBar(self.canvas, 200, 20, "#FF0000")
+        self.assertTrue(bar.set_value(50.0))
+        self.assertFalse(bar.set_value(50.1))
+        self.assertTrue(bar.set_value(40.0))
+        self.assertEqual(
+            self.canvas.calls, ["create_rectangle", "coords", "coords"]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import math
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.ui.scheduler import UpdateScheduler
+
+class FakeRoot:
+    """Stand-in for a Tk root that records after() calls instead of running them."""
+    def __init__(self):
+        self.pending = {}
+        self.cancelled = []
+        self._ids = 0
+
+    def _add(self, delay, callback):
+        self._ids += 1
+        after_id = f"after#{self._ids}"
+        self.pending[after_id] = (delay, callback)
+        return after_id
+
+    def after(self, delay, callback):
+        return self._add(delay, callback)
+
+    def after_idle(self, callback):
+        return self._add("idle", callback)
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+        del self.pending[after_id]
+
+    def fire(self):
+        (after_id, (_, callback)), = self.pending.items()
+        del self.pending[after_id]
+        callback()
+
+class TestUpdateScheduler(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.pet = Tamagotchi("Tama", hunger=50.25, happiness=80.6, energy=70.7, last_update=0.0)
+        self.runs = 0
+
+    def callback(self):
+        self.runs += 1
+        return self.pet.seconds_until_change()
+
+    def delays(self):
+        return [delay for delay, _ in self.root.pending.values()]
+
+    def test_reschedules_at_next_change(self):
+        """Test each run books the next one for when the pet's display will change"""
+        scheduler = UpdateScheduler(self.root, self.callback, min_delay_ms=10)
+        scheduler.schedule(self.callback())
+        expected = math.ceil(self.pet.seconds_until_change() * 1000)
+        self.assertEqual(self.delays(), [expected])
+        self.root.fire()
+        self.assertEqual(self.runs, 2)
+        self.assertEqual(self.delays(), [expected])
+
+    def test_action_cancels_pending_run(self):
+        """Test wake() replaces the booked run with an immediate one"""
+        scheduler = UpdateScheduler(self.root, self.callback)
+        scheduler.schedule(30.0)
+        (booked,) = self.root.pending
+        scheduler.wake()
+        self.assertEqual(self.root.cancelled, [booked])
+        self.assertEqual(self.delays(), ["idle"])
+        self.root.fire()
+        self.assertEqual(self.runs, 1)
+        scheduler.cancel()
+        self.assertEqual(self.root.pending, {})
+
+    def test_delay_is_clamped(self):
+        """Test delays never go below the frame interval or above the ceiling"""
+        scheduler = UpdateScheduler(self.root, self.callback, min_delay_ms=50, max_delay_ms=5000)
+        for seconds, expected in ((0.0001, 50), (2.0, 2000), (3600.0, 5000), (math.inf, 5000)):
+            scheduler.schedule(seconds)
+            self.assertEqual(self.delays(), [expected])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.server import PetServer
+
+class TestPetServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = PetServer([Tamagotchi("Tama", hunger=50, energy=10)], tick_interval=60)
+        listener = await self.server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.server.close()
+
+    async def send(self, **command):
+        self.writer.write(json.dumps(command).encode() + b"\n")
+        return json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+
+    async def test_commands_apply_pet_rules(self):
+        """Test actions go through the model and report acceptance"""
+        reply = await self.send(id=1, op="feed", name="tama")
+        self.assertTrue(reply["ok"])
+        self.assertEqual(reply["id"], 1)
+        self.assertGreater(reply["pet"]["hunger"], 70)
+        reply = await self.send(id=2, op="play", name="Tama")
+        self.assertFalse(reply["ok"])  # Too tired, as in Game.play_with_pet()
+        reply = await self.send(id=3, op="sleep", name="Tama")
+        self.assertTrue(reply["pet"]["is_sleeping"])
+        reply = await self.send(id=4, op="get", name="Nobody")
+        self.assertIn("unknown pet", reply["error"])
+
+    async def test_subscribers_receive_changes(self):
+        """Test a subscriber is pushed the new state after an action"""
+        await self.send(id=1, op="subscribe", name="Tama")
+        reply = await self.send(id=2, op="feed", name="Tama")
+        push = json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+        self.assertEqual(push["event"], "state")
+        self.assertEqual(push["pet"]["hunger"], reply["pet"]["hunger"])
+
+    async def test_commands_arriving_together_share_a_batch(self):
+        """Test pipelined commands are applied in one batch"""
+        self.writer.write(b"".join(
+            json.dumps({"id": i, "op": "get", "name": "Tama"}).encode() + b"\n"
+            for i in range(20)
+        ))
+        replies = [json.loads(await self.reader.readline()) for _ in range(20)]
+        self.assertEqual([reply["id"] for reply in replies], list(range(20)))
+        self.assertEqual(len({reply["pet"]["last_update"] for reply in replies}), 1)
+
+    async def test_bad_commands_do_not_stop_the_server(self):
+        """Test non-object JSON and failing commands get errors while others still work"""
+        for line in (b"[1, 2]", b'"feed"', b"3"):
+            self.writer.write(line + b"\n")
+            reply = json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+            self.assertFalse(reply["ok"])
+        self.server._act = None  # pylint: disable=protected-access
+        with self.assertLogs("src.tamagotchi.server", "ERROR"):
+            reply = await self.send(id=1, op="feed", name="Tama")
+        self.assertEqual(reply, {"ok": False, "error": "internal error", "id": 1})
+        reply = await self.send(id=2, op="get", name="Tama")
+        self.assertTrue(reply["ok"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.core.population import PetPopulation
+from src.tamagotchi.core.sharded import ShardedPopulation, shard_of
+
+class TestShardedPopulation(unittest.TestCase):
+    def test_shards_match_single_population(self):
+        """Test sharded ticks agree with an unsharded population"""
+        pets = [
+            Tamagotchi(f"Pet{i}", energy=i % 100, is_sleeping=i % 3 == 0, last_update=0.0)
+            for i in range(300)
+        ]
+        reference = PetPopulation.from_pets(pets)
+        with ShardedPopulation(pets, workers=3) as sharded:
+            self.assertEqual(len(sharded), 300)
+            for now in (5.0, 40.0, 90.0):
+                sharded.update(now)
+                reference.update(now)
+            for index in (0, 1, 150, 299):
+                self.assertEqual(sharded.pet(f"pet{index}"), reference[index])
+            self.assertEqual(
+                {float(shard.last_update.max()) for shard in sharded.shards}, {90.0}
+            )
+
+    def test_shard_assignment_is_stable(self):
+        """Test a name always maps to the same shard"""
+        self.assertEqual(shard_of("Tama", 8), shard_of("TAMA", 8))
+        self.assertTrue(0 <= shard_of("Tama", 8) < 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import io
+import unittest
+from contextlib import redirect_stderr
+from src.tamagotchi.sim import NoCarePolicy, Simulation, ThresholdPolicy, main
+from src.tamagotchi.config.settings import settings
+
+class TestSimulation(unittest.TestCase):
+    def test_neglected_pets_die_on_schedule(self):
+        """Test survival time is the exact moment a stat reaches zero"""
+        report = Simulation.with_new_pets(50, NoCarePolicy(), step=7.0).run(3600.0)
+        expected = min(100 / settings.pet.HUNGER_RATE, 100 / settings.pet.HAPPINESS_RATE)
+        self.assertEqual(report.alive, 0)
+        self.assertAlmostEqual(report.survival["p50"], expected)
+        self.assertEqual(report.actions, 0)
+
+    def test_threshold_care_keeps_pets_alive(self):
+        """Test the scripted policy keeps every pet alive for a simulated day"""
+        report = Simulation.with_new_pets(20, ThresholdPolicy(), step=10.0).run(86400.0)
+        self.assertEqual(report.alive, 20)
+        self.assertGreater(report.actions, 0)
+        self.assertGreater(report.ticks_per_second, 0)
+
+    def test_throughput_counts_pet_steps(self):
+        """Test pet-ticks/s is pets times steps over elapsed time, and finite for instant runs"""
+        report = Simulation.with_new_pets(10, NoCarePolicy(), step=60.0).run(600.0)
+        self.assertEqual(report.steps, 10)
+        self.assertAlmostEqual(report.ticks_per_second, 10 * 10 / report.elapsed)
+        report.elapsed = 0.0
+        self.assertEqual(report.ticks_per_second, 0.0)
+
+    def test_bad_arguments_are_usage_errors(self):
+        """Test a step that isn't above 0 and negative pets or days are rejected up front"""
+        for args in (["--step", "0"], ["--step", "-5"], ["--step", "nan"],
+                     ["--pets", "-1"], ["--days", "-1"], ["--days", "inf"]):
+            with self.assertRaises(SystemExit) as raised, redirect_stderr(io.StringIO()):
+                main(args)
+            self.assertEqual(raised.exception.code, 2, args)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from PIL import Image
+from src.tamagotchi.pet_sprite import SpriteAtlas, draw_pixel_art, FRAME_COUNT
+
+class TestSpriteAtlas(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_states_are_drawn_lazily(self):
+        """Test only requested states end up in the atlas"""
+        atlas = SpriteAtlas(self.tmp.name)
+        frames = atlas.frames("happy")
+        self.assertEqual(len(frames), FRAME_COUNT)
+        self.assertEqual(list(atlas.rows), ["happy"])
+
+    def test_sheet_is_reused_across_launches(self):
+        """Test a second atlas loads frames from disk matching the drawing"""
+        SpriteAtlas(self.tmp.name).frames("sleep")
+        atlas = SpriteAtlas(self.tmp.name)
+        atlas._load()
+        self.assertEqual(atlas.rows, {"sleep": 0})
+        frames = atlas.frames("sleep")
+        self.assertEqual(frames[2].tobytes(), draw_pixel_art("sleep", 2).tobytes())
+        self.assertTrue(os.path.exists(atlas.sheet_path))
+
+    def test_single_frame_crops_only_that_frame(self):
+        """Test asking for one frame leaves the other frames of the row alone"""
+        atlas = SpriteAtlas(self.tmp.name)
+        atlas.frames("idle")
+        crops = []
+        crop = atlas.sheet.crop
+        atlas.sheet.crop = lambda box: crops.append(box) or crop(box)
+        frame = atlas.frame("idle", 5)
+        self.assertEqual(len(crops), 1)
+        self.assertEqual(frame.tobytes(), draw_pixel_art("idle", 5).tobytes())
+
+    def test_failed_save_leaves_no_temp_file(self):
+        """Test a sheet that can't be written keeps its frames and leaves nothing behind"""
+        atlas = SpriteAtlas(self.tmp.name)
+        atlas._load()
+        atlas.sheet = Image.new('RGBA', (1, 1))
+        atlas.sheet.save = mock.Mock(side_effect=OSError("disk full"))
+        atlas._save()
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+if __name__ == '__main__':
+    unittest.main()
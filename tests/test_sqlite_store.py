@@ -0,0 +1,61 @@
+from dataclasses import asdict
+import json
+import os
+import tempfile
+import unittest
+from src.tamagotchi import Tamagotchi
+from src.tamagotchi.storage.sqlite_store import SQLiteStore, migrate_json
+
+class TestSQLiteStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteStore(os.path.join(self.tmp.name, "pets.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_pluggable_backend_round_trip(self):
+        """Test Tamagotchi.save/load through the store"""
+        pet = Tamagotchi("Tama", hunger=42.5, is_sleeping=True, last_update=123.0)
+        pet.save(backend=self.store)
+        self.assertEqual(Tamagotchi.load("TAMA", backend=self.store), pet)
+        self.assertIsNone(Tamagotchi.load("Nobody", backend=self.store))
+
+    def test_bulk_save_and_load(self):
+        """Test batched writes and bulk reads"""
+        pets = [Tamagotchi(f"Pet{i}", hunger=i % 100, last_update=1.0) for i in range(2000)]
+        self.store.save_many(pets)
+        self.assertEqual(len(self.store), 2000)
+        loaded = list(self.store.load_many(["Pet7", "pet1999", "missing"]))
+        self.assertEqual(sorted(pet.name for pet in loaded), ["Pet1999", "Pet7"])
+        self.assertEqual(len(list(self.store.load_many())), 2000)
+
+    def test_migrate_json_saves(self):
+        """Test importing a directory of JSON saves"""
+        save_dir = os.path.join(self.tmp.name, "saves")
+        os.makedirs(save_dir)
+        Tamagotchi("Alpha", last_update=1.0).save(save_dir)
+        Tamagotchi("Beta", energy=3.0, last_update=1.0).save(save_dir)
+        with open(os.path.join(save_dir, "broken.json"), 'w') as f:
+            json.dump({"name": "Broken", "colour": "red"}, f)
+        imported = migrate_json(save_dir, self.store)
+        self.assertEqual(sorted(imported), ["Alpha", "Beta"])
+        self.assertEqual(self.store.load("beta").energy, 3.0)
+
+    def test_migration_skips_unknown_profiles(self):
+        """Test one save with an unknown profile is skipped instead of aborting the rest"""
+        save_dir = os.path.join(self.tmp.name, "saves")
+        os.makedirs(save_dir)
+        for name in ("Alpha", "Gamma"):
+            Tamagotchi(name, last_update=1.0).save(save_dir)
+        state = asdict(Tamagotchi("Cat", last_update=1.0))
+        state["profile"] = "cat"
+        with open(os.path.join(save_dir, "cat.json"), 'w') as f:
+            json.dump(state, f)
+        with self.assertLogs(level="ERROR"):
+            imported = migrate_json(save_dir, self.store)
+        self.assertEqual(sorted(imported), ["Alpha", "Gamma"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import unittest
+
+class TestHeadlessImports(unittest.TestCase):
+    def test_model_imports_without_gui_modules(self):
+        """Test the model, storage and package exports never load tkinter or PIL"""
+        script = (
+            "import sys\n"
+            "from src.tamagotchi import Tamagotchi\n"
+            "from src import Tamagotchi as Exported\n"
+            "import src.tamagotchi.storage.journal, src.tamagotchi.pet_sprite\n"
+            "assert Exported is Tamagotchi\n"
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in ('tkinter', 'PIL')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_bad_log_level_is_a_usage_error(self):
+        """Test an unknown log level from the flag or environment exits with a message"""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for args, level in ((["--log-level", "LOUD"], "WARNING"), ([], "LOUD")):
+            result = subprocess.run(
+                [sys.executable, "main.py"] + args, capture_output=True, text=True, cwd=root,
+                env=dict(os.environ, TAMAGOTCHI_LOG_LEVEL=level), check=False
+            )
+            self.assertEqual(result.returncode, 2)
+            self.assertIn("LOUD", result.stderr)
+            self.assertNotIn("Traceback", result.stderr)
+
+    def test_bad_speed_is_a_usage_error(self):
+        """Test a TAMAGOTCHI_SPEED that isn't a positive number exits with a message"""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for speed in ("fast", "0", "-60", "inf"):
+            result = subprocess.run(
+                [sys.executable, "main.py"], capture_output=True, text=True, cwd=root,
+                env=dict(os.environ, TAMAGOTCHI_SPEED=speed), check=False
+            )
+            self.assertEqual(result.returncode, 2)
+            self.assertIn(f"not {speed!r}", result.stderr)
+            self.assertNotIn("Traceback", result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
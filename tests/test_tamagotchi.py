@@ -50,5 +50,52 @@ class TestTamagotchi(unittest.TestCase):
         self.pet.update()
         self.assertFalse(self.pet.is_alive)
 
+    def test_long_gap_wakes_then_drains(self):
+        """Test a sleeping pet wakes mid-gap and drains energy afterwards"""
+        self.pet.energy = 50
+        self.pet.is_sleeping = True
+        self.pet.last_update = 1000.0
+        time_to_wake = 50 / settings.pet.SLEEP_ENERGY_RECOVERY
+        self.pet.update(1000.0 + time_to_wake + 20)
+        self.assertFalse(self.pet.is_sleeping)
+        self.assertAlmostEqual(self.pet.energy, 100 - 20 * settings.pet.ENERGY_RATE)
+
+    def test_catch_up_matches_ticking(self):
+        """Test one update over a long gap equals ticking once per second"""
+        ticked = Tamagotchi("Ticked", energy=10, is_sleeping=True, last_update=0.0)
+        caught_up = Tamagotchi("CaughtUp", energy=10, is_sleeping=True, last_update=0.0)
+        for second in range(1, 301):
+            ticked.update(float(second))
+        caught_up.update(300.0)
+        self.assertAlmostEqual(ticked.hunger, caught_up.hunger)
+        self.assertAlmostEqual(ticked.happiness, caught_up.happiness)
+        self.assertAlmostEqual(ticked.energy, caught_up.energy)
+        self.assertEqual(ticked.is_sleeping, caught_up.is_sleeping)
+        self.assertEqual(ticked.is_alive, caught_up.is_alive)
+        self.assertFalse(caught_up.is_alive)
+
+    def test_seconds_until_change(self):
+        """Test the next visible change is the earliest stat crossing"""
+        self.pet.hunger = 50.25
+        self.pet.happiness = 81.5
+        self.pet.energy = 99.9
+        expected = 0.25 / settings.pet.HUNGER_RATE
+        self.assertAlmostEqual(self.pet.seconds_until_change(), expected)
+
+        pet = Tamagotchi("Calm", hunger=99.9, happiness=80.3, energy=0)
+        self.assertAlmostEqual(pet.seconds_until_change(), 0.3 / settings.pet.HAPPINESS_RATE)
+        self.assertAlmostEqual(
+            pet.seconds_until_change(thresholds=(80.2,)), 0.1 / settings.pet.HAPPINESS_RATE
+        )
+
+    def test_seconds_until_wake(self):
+        """Test a sleeping pet's next change includes waking up"""
+        pet = Tamagotchi("Sleepy", hunger=99.9, happiness=99.9, energy=99.5, is_sleeping=True)
+        self.assertAlmostEqual(
+            pet.seconds_until_change(), 0.5 / settings.pet.SLEEP_ENERGY_RECOVERY
+        )
+        pet = Tamagotchi("Gone", hunger=0, happiness=0, energy=0, is_alive=False)
+        self.assertEqual(pet.seconds_until_change(), float("inf"))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file